@@ -4,6 +4,7 @@ from flask_login import current_user
 from werkzeug.middleware.proxy_fix import ProxyFix
 from config import Config, DevelopmentConfig, ProductionConfig
 from extensions import db, csrf, login_manager, limiter, migrate
+from utils.json_provider import OrjsonProvider
 import uuid
 
 
@@ -22,6 +23,7 @@ def create_app(config_class=None):
 
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
 
     # Trust proxy headers (Cloudflare, nginx, etc.)
     # x_for=1: trust X-Forwarded-For for client IP
@@ -59,6 +59,9 @@ class Config:
         'pool_recycle': 3600,      # Recycle connections after 1 hour
         'pool_pre_ping': True,     # Verify connections before use
         'max_overflow': 20,        # Allow up to 20 additional connections
+        # Compiled-statement cache entries (default 500); filter combinations
+        # across the list views produce many distinct statement shapes
+        'query_cache_size': int(os.environ.get('SQLALCHEMY_QUERY_CACHE_SIZE', 1200)),
     }
 
     # Security settings
@@ -101,6 +104,12 @@ class Config:
     # Public API
     PUBLIC_API_KEY = os.environ.get('PUBLIC_API_KEY', '')
 
+    # Seconds to cache company/contact dropdown lists per process (0 disables)
+    DROPDOWN_CACHE_TTL = int(os.environ.get('DROPDOWN_CACHE_TTL', 60))
+
+    # Seconds the browser may reuse an episode search result fragment (0 disables)
+    EPISODE_SEARCH_CACHE_SECONDS = int(os.environ.get('EPISODE_SEARCH_CACHE_SECONDS', 30))
+
     # Feature flags
     ENABLE_EPISODE_GUIDE = os.environ.get('ENABLE_EPISODE_GUIDE', 'true').lower() == 'true'
 
@@ -139,3 +148,5 @@ class TestConfig(Config):
     SESSION_COOKIE_SECURE = False
     # SQLite doesn't support connection pooling options
     SQLALCHEMY_ENGINE_OPTIONS = {}
+    # Each test gets a fresh database, so never share cached dropdown rows
+    DROPDOWN_CACHE_TTL = 0
@@ -26,6 +26,9 @@ PLATFORM_CHOICES = ['youtube', 'twitter', 'twitch', 'discord', 'instagram', 'tik
 DEAL_TYPE_CHOICES = ['paid_review', 'podcast_ad', 'sponsored_segment', 'other']
 DEAL_STATUS_CHOICES = ['lead', 'negotiating', 'confirmed', 'completed', 'lost']
 PAYMENT_STATUS_CHOICES = ['pending', 'invoiced', 'paid']
+# Set forms for request-path membership checks (lists keep display order)
+DEAL_STATUS_CHOICES_SET = frozenset(DEAL_STATUS_CHOICES)
+PAYMENT_STATUS_CHOICES_SET = frozenset(PAYMENT_STATUS_CHOICES)
 
 # Outreach Template choices
 TEMPLATE_CATEGORY_CHOICES = ['sponsor', 'collab', 'follow_up', 'thank_you', 'pitch', 'other']
@@ -34,6 +37,11 @@ TEMPLATE_CATEGORY_CHOICES = ['sponsor', 'collab', 'follow_up', 'thank_you', 'pit
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 100
 
+# Autocomplete dropdowns (company/contact lookups)
+DROPDOWN_SEARCH_LIMIT = 50
+DROPDOWN_FETCH_BATCH_SIZE = 500  # rows per fetch when loading full dropdown lists
+DELIVERABLES_PREVIEW_LENGTH = 120  # characters of deal deliverables shown in list views
+
 # Built-in choices lookup for dynamic options system
 # Maps option_type to list of (value, label) tuples
 BUILTIN_CHOICES = {
@@ -121,11 +129,13 @@ OUTRO_STATIC_CONTENT = [
 
 # Helper lookups for Episode Guide
 EPISODE_GUIDE_SECTION_CHOICES = [s[0] for s in EPISODE_GUIDE_SECTIONS]
+EPISODE_GUIDE_SECTION_CHOICES_SET = frozenset(EPISODE_GUIDE_SECTION_CHOICES)
 EPISODE_GUIDE_SECTION_NAMES = {s[0]: s[1] for s in EPISODE_GUIDE_SECTIONS}
 EPISODE_GUIDE_SECTION_PARENTS = {s[0]: s[2] for s in EPISODE_GUIDE_SECTIONS}
 
 # Episode Guide status choices
 EPISODE_GUIDE_STATUS_CHOICES = ['draft', 'recording', 'completed']
+EPISODE_GUIDE_STATUS_CHOICES_SET = frozenset(EPISODE_GUIDE_STATUS_CHOICES)
 
 # Calendar event colors
 EVENT_COLORS = {
@@ -0,0 +1,47 @@
+"""Add pipeline stats rollup table
+
+Revision ID: i2j3k4l5m6n7
+Revises: 0595a536d00c
+Create Date: 2026-10-17 10:00:00.000000
+
+Per-user, per-status deal counts and rate sums for the pipeline stats bar.
+Maintained incrementally by an after_flush listener on SalesPipeline writes.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i2j3k4l5m6n7'
+down_revision = '0595a536d00c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'pipeline_stats_rollup',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('deal_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum_rate_agreed', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('sum_rate_quoted', sa.Float(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'status', name='unique_user_pipeline_status'),
+    )
+    op.create_index('ix_pipeline_stats_rollup_user_id', 'pipeline_stats_rollup', ['user_id'])
+
+    # Backfill from existing deals
+    op.execute("""
+        INSERT INTO pipeline_stats_rollup (user_id, status, deal_count, sum_rate_agreed, sum_rate_quoted)
+        SELECT user_id, status, COUNT(*), COALESCE(SUM(rate_agreed), 0), COALESCE(SUM(rate_quoted), 0)
+        FROM sales_pipeline
+        GROUP BY user_id, status
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_pipeline_stats_rollup_user_id', table_name='pipeline_stats_rollup')
+    op.drop_table('pipeline_stats_rollup')
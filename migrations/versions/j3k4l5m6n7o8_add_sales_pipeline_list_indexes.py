@@ -0,0 +1,52 @@
+"""Add composite indexes backing the pipeline list query
+
+Revision ID: j3k4l5m6n7o8
+Revises: i2j3k4l5m6n7
+Create Date: 2026-10-17 11:00:00.000000
+
+list_deals always filters by user_id and orders by created_at, optionally
+narrowed by status, deal_type or follow_up_needed. These indexes let the
+page query be an index range scan + LIMIT instead of a sort. The follow-up
+index is partial since most deals don't need a follow-up.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'j3k4l5m6n7o8'
+down_revision = 'i2j3k4l5m6n7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_sales_pipeline_user_created_at',
+        'sales_pipeline',
+        ['user_id', 'created_at', 'id']
+    )
+    op.create_index(
+        'ix_sales_pipeline_user_status_created_at',
+        'sales_pipeline',
+        ['user_id', 'status', 'created_at']
+    )
+    op.create_index(
+        'ix_sales_pipeline_user_type_created_at',
+        'sales_pipeline',
+        ['user_id', 'deal_type', 'created_at']
+    )
+    op.create_index(
+        'ix_sales_pipeline_user_follow_up_created_at',
+        'sales_pipeline',
+        ['user_id', 'created_at'],
+        postgresql_where=sa.text('follow_up_needed'),
+        sqlite_where=sa.text('follow_up_needed')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_sales_pipeline_user_follow_up_created_at', table_name='sales_pipeline')
+    op.drop_index('ix_sales_pipeline_user_type_created_at', table_name='sales_pipeline')
+    op.drop_index('ix_sales_pipeline_user_status_created_at', table_name='sales_pipeline')
+    op.drop_index('ix_sales_pipeline_user_created_at', table_name='sales_pipeline')
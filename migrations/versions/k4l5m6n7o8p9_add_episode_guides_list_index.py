@@ -0,0 +1,29 @@
+"""Add composite index backing the episode list keyset pagination
+
+Revision ID: k4l5m6n7o8p9
+Revises: j3k4l5m6n7o8
+Create Date: 2026-10-17 14:00:00.000000
+
+list_episodes filters by podcast_id and seeks on (created_at, id), so each
+page is an index range scan + LIMIT regardless of depth.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'k4l5m6n7o8p9'
+down_revision = 'j3k4l5m6n7o8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_episode_guides_podcast_created_at',
+        'episode_guides',
+        ['podcast_id', 'created_at', 'id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_episode_guides_podcast_created_at', table_name='episode_guides')
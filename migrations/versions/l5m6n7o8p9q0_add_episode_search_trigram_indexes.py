@@ -0,0 +1,58 @@
+"""Add trigram indexes for episode guide search
+
+Revision ID: l5m6n7o8p9q0
+Revises: k4l5m6n7o8p9
+Create Date: 2026-10-17 15:00:00.000000
+
+list_episodes searches with ILIKE '%term%', which a btree index can't serve.
+pg_trgm GIN indexes let PostgreSQL answer those patterns (combining them with
+a BitmapOr across columns) without changing the query. Built CONCURRENTLY
+outside the migration transaction, so writes to these tables aren't blocked
+while the GIN indexes build. PostgreSQL only; SQLite dev databases keep
+scanning.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'l5m6n7o8p9q0'
+down_revision = 'k4l5m6n7o8p9'
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_INDEXES = [
+    ('ix_episode_guides_title_trgm', 'episode_guides', 'title'),
+    ('ix_episode_guides_notes_trgm', 'episode_guides', 'notes'),
+    ('ix_episode_guides_previous_poll_trgm', 'episode_guides', 'previous_poll'),
+    ('ix_episode_guides_new_poll_trgm', 'episode_guides', 'new_poll'),
+    ('ix_episode_guide_items_title_trgm', 'episode_guide_items', 'title'),
+    ('ix_episode_guide_items_link_trgm', 'episode_guide_items', 'link'),
+    ('ix_episode_guide_items_notes_trgm', 'episode_guide_items', 'notes'),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""Add covering index for the episode list status counts
+
+Revision ID: m6n7o8p9q0r1
+Revises: l5m6n7o8p9q0
+Create Date: 2026-10-17 16:00:00.000000
+
+list_episodes counts a podcast's guides per status with COUNT(*) FILTER on
+every page hit. An index on (podcast_id, status) holds every column that
+aggregate reads, so PostgreSQL can answer it with an index-only scan
+instead of visiting the heap.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'm6n7o8p9q0r1'
+down_revision = 'l5m6n7o8p9q0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_episode_guides_podcast_status',
+        'episode_guides',
+        ['podcast_id', 'status']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_episode_guides_podcast_status', table_name='episode_guides')
@@ -0,0 +1,30 @@
+"""Add index backing the podcast member list ordering
+
+Revision ID: n7o8p9q0r1s2
+Revises: m6n7o8p9q0r1
+Create Date: 2026-10-17 17:00:00.000000
+
+list_members filters by podcast_id and orders by (role, created_at); 'admin'
+sorts before 'contributor', so admins already come first. With this index
+the rows come back in index order and no sort step is needed.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'n7o8p9q0r1s2'
+down_revision = 'm6n7o8p9q0r1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_podcast_members_podcast_role_created_at',
+        'podcast_members',
+        ['podcast_id', 'role', 'created_at']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_podcast_members_podcast_role_created_at', table_name='podcast_members')
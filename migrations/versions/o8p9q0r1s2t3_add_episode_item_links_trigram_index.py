@@ -0,0 +1,44 @@
+"""Add trigram index for episode guide item links search
+
+Revision ID: o8p9q0r1s2t3
+Revises: n7o8p9q0r1s2
+Create Date: 2026-10-17 18:00:00.000000
+
+list_episodes also matches CAST(links AS VARCHAR) ILIKE '%term%'. That was the
+only search predicate without a trigram index, and one unindexed branch of an
+OR is enough to make PostgreSQL fall back to scanning every item. An
+expression index on the same cast lets the whole OR use a BitmapOr. Built
+CONCURRENTLY outside the migration transaction so item writes aren't
+blocked during the build. PostgreSQL only; SQLite dev databases keep
+scanning.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'o8p9q0r1s2t3'
+down_revision = 'n7o8p9q0r1s2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # The expression must match the route's links.cast(db.String) exactly
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_episode_guide_items_links_trgm ON episode_guide_items '
+            'USING gin ((CAST(links AS VARCHAR)) gin_trgm_ops)'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_episode_guide_items_links_trgm', table_name='episode_guide_items',
+                      postgresql_concurrently=True)
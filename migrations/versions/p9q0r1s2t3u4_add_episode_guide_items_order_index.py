@@ -0,0 +1,32 @@
+"""Add index backing episode item ordering within a guide
+
+Revision ID: p9q0r1s2t3u4
+Revises: o8p9q0r1s2t3
+Create Date: 2026-10-17 19:00:00.000000
+
+Guide pages and the items API read a guide's items ordered by (section,
+position), and appending an item takes MAX(position) within one section.
+The existing single-column guide_id index leaves both to filter and sort;
+(guide_id, section, position) returns the rows already in order and
+answers the MAX from the end of one index range.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'p9q0r1s2t3u4'
+down_revision = 'o8p9q0r1s2t3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_episode_guide_items_guide_section_position',
+        'episode_guide_items',
+        ['guide_id', 'section', 'position']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_episode_guide_items_guide_section_position', table_name='episode_guide_items')
@@ -0,0 +1,31 @@
+"""Add index for looking up an episode by number within a podcast
+
+Revision ID: q0r1s2t3u4v5
+Revises: p9q0r1s2t3u4
+Create Date: 2026-10-17 20:00:00.000000
+
+new_episode carries the poll over from episode N-1 of the same podcast.
+The single-column episode_number index matches that number across every
+podcast; (podcast_id, episode_number) makes it one equality probe. Not
+unique: episode numbers are free-form and duplicates are allowed.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'q0r1s2t3u4v5'
+down_revision = 'p9q0r1s2t3u4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_episode_guides_podcast_episode_number',
+        'episode_guides',
+        ['podcast_id', 'episode_number']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_episode_guides_podcast_episode_number', table_name='episode_guides')
@@ -0,0 +1,40 @@
+"""Make created_at NOT NULL on keyset-paginated tables
+
+Revision ID: r1s2t3u4v5w6
+Revises: q0r1s2t3u4v5
+Create Date: 2026-10-17 21:00:00.000000
+
+The pipeline and episode lists page by (created_at, id) row-value
+comparisons, which never match a NULL created_at: such rows were unreachable
+past the first page and broke the Next cursor. Backfill any NULLs (oldest
+existing timestamp, so they sort last, or now for an all-NULL table) and
+forbid new ones.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'r1s2t3u4v5w6'
+down_revision = 'q0r1s2t3u4v5'
+branch_labels = None
+depends_on = None
+
+TABLES = ('sales_pipeline', 'episode_guides')
+
+
+def upgrade():
+    for table in TABLES:
+        op.execute(
+            f'UPDATE {table} SET created_at = COALESCE('
+            f'(SELECT MIN(created_at) FROM {table}), CURRENT_TIMESTAMP) '
+            f'WHERE created_at IS NULL'
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
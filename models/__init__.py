@@ -18,6 +18,7 @@ from models.business import (
     AffiliateRevenue,
     Collaboration,
     SalesPipeline,
+    PipelineStatsRollup,
     OutreachTemplate,
 )
 
@@ -74,6 +75,7 @@ __all__ = [
     'AffiliateRevenue',
     'Collaboration',
     'SalesPipeline',
+    'PipelineStatsRollup',
     'OutreachTemplate',
     # Config
     'CustomOption',
@@ -0,0 +1,11 @@
+"""Shared SQL helpers for the model modules."""
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(connection, table):
+    """INSERT construct for the connection's dialect (with ON CONFLICT support where available)."""
+    if connection.dialect.name == 'postgresql':
+        return postgresql.insert(table)
+    if connection.dialect.name == 'sqlite':
+        return sqlite.insert(table)
+    return table.insert()
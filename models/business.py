@@ -1,6 +1,10 @@
 """Business and CRM models - contacts, companies, inventory, collaborations, etc."""
 from datetime import datetime, timezone
+from sqlalchemy import event
+from sqlalchemy.orm import column_property, query_expression
+from sqlalchemy.orm.attributes import get_history
 from extensions import db
+from models.base import dialect_insert
 
 
 class Contact(db.Model):
@@ -267,6 +271,55 @@ class AffiliateRevenue(db.Model):
                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         return f"{months[self.month]} {self.year}"
 
+    @classmethod
+    def add_revenue(cls, connection, user_id, company_id, year, month, amount, new_notes, appended_notes):
+        """Add amount to a user's company/month entry, creating it if needed.
+
+        A new (or note-less) entry gets new_notes; an existing one has
+        appended_notes added to its notes. On PostgreSQL and SQLite this is a
+        single INSERT ... ON CONFLICT DO UPDATE against the
+        unique_user_company_month constraint. That constraint never matches
+        a NULL user_id, so user-less entries take the UPDATE-then-INSERT path
+        (where ``user_id == None`` compiles to IS NULL) instead of piling up
+        duplicate rows.
+        """
+        table = cls.__table__
+        now = datetime.now(timezone.utc)
+        merged_notes = db.case(
+            (db.func.coalesce(table.c.notes, '') == '', new_notes),
+            else_=table.c.notes + appended_notes,
+        )
+
+        stmt = dialect_insert(connection, table).values(
+            user_id=user_id,
+            company_id=company_id,
+            year=year,
+            month=month,
+            revenue=amount,
+            notes=new_notes,
+            created_at=now,
+            updated_at=now,
+        )
+        if user_id is not None and hasattr(stmt, 'on_conflict_do_update'):
+            connection.execute(stmt.on_conflict_do_update(
+                index_elements=['user_id', 'company_id', 'year', 'month'],
+                set_={
+                    'revenue': table.c.revenue + stmt.excluded.revenue,
+                    'notes': merged_notes,
+                    'updated_at': now,
+                },
+            ))
+            return
+
+        result = connection.execute(
+            table.update()
+            .where(table.c.user_id == user_id, table.c.company_id == company_id,
+                   table.c.year == year, table.c.month == month)
+            .values(revenue=table.c.revenue + amount, notes=merged_notes, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(stmt)
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -339,17 +392,24 @@ class SalesPipeline(db.Model):
     """Track potential and active sponsorship deals."""
     __tablename__ = 'sales_pipeline'
 
+    # The stats rollup columns (user_id, status, rate_*) use active_history,
+    # so assigning one while it is expired still loads the old value that
+    # _sync_pipeline_stats_rollup has to take the deal out of.
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
+    user_id = column_property(
+        db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True), active_history=True
+    )
     company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False, index=True)
     contact_id = db.Column(db.Integer, db.ForeignKey('contacts.id'), nullable=True, index=True)
     deal_type = db.Column(db.String(30), default='paid_review', index=True)
     # Types: paid_review, podcast_ad, sponsored_segment, other
-    status = db.Column(db.String(20), default='lead', index=True)
+    status = column_property(db.Column(db.String(20), default='lead', index=True), active_history=True)
     # Status: lead, negotiating, confirmed, completed, lost
-    rate_quoted = db.Column(db.Float, nullable=True)
-    rate_agreed = db.Column(db.Float, nullable=True)
+    rate_quoted = column_property(db.Column(db.Float, nullable=True), active_history=True)
+    rate_agreed = column_property(db.Column(db.Float, nullable=True), active_history=True)
     deliverables = db.Column(db.Text, nullable=True)
+    # Truncated deliverables, populated only by queries using with_expression (list view)
+    deliverables_preview = query_expression()
     deadline = db.Column(db.Date, nullable=True, index=True)
     deliverable_date = db.Column(db.Date, nullable=True, index=True)  # When deliverables are due
     payment_status = db.Column(db.String(20), default='pending', index=True)
@@ -363,7 +423,7 @@ class SalesPipeline(db.Model):
 
     follow_up_needed = db.Column(db.Boolean, default=False, index=True)
     follow_up_date = db.Column(db.Date, nullable=True, index=True)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     # Relationships
@@ -371,6 +431,17 @@ class SalesPipeline(db.Model):
     company = db.relationship('Company', backref='deals')
     contact = db.relationship('Contact', backref='deals')
 
+    # Composite indexes backing list_deals: every query filters by user_id and
+    # orders by created_at, optionally narrowed by status/deal_type/follow-up
+    __table_args__ = (
+        db.Index('ix_sales_pipeline_user_created_at', 'user_id', 'created_at', 'id'),
+        db.Index('ix_sales_pipeline_user_status_created_at', 'user_id', 'status', 'created_at'),
+        db.Index('ix_sales_pipeline_user_type_created_at', 'user_id', 'deal_type', 'created_at'),
+        db.Index('ix_sales_pipeline_user_follow_up_created_at', 'user_id', 'created_at',
+                 postgresql_where=db.text('follow_up_needed'),
+                 sqlite_where=db.text('follow_up_needed')),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -398,6 +469,232 @@ class SalesPipeline(db.Model):
         }
 
 
+class PipelineStatsRollup(db.Model):
+    """Per-user, per-status deal totals backing the pipeline stats bar.
+
+    Maintained incrementally on every flush that touches SalesPipeline (see
+    _sync_pipeline_stats_rollup), so list_deals reads a few rows instead of
+    aggregating the whole sales_pipeline table.
+    """
+    __tablename__ = 'pipeline_stats_rollup'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
+    status = db.Column(db.String(20), nullable=True)
+    deal_count = db.Column(db.Integer, nullable=False, default=0)
+    sum_rate_agreed = db.Column(db.Float, nullable=False, default=0.0)
+    sum_rate_quoted = db.Column(db.Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'status', name='unique_user_pipeline_status'),
+    )
+
+    @classmethod
+    def stats_columns(cls, user_id):
+        """Labelled scalar subqueries computing a user's pipeline stats.
+
+        These can be selected on their own or added to another query so the
+        stats ride along with its rows. Built on table columns rather than
+        mapped attributes so the subqueries carry no ORM state, and their
+        cache key is the same whether or not an enclosing ORM query has
+        compiled them.
+        """
+        table = cls.__table__
+
+        def total(column, statuses):
+            return db.select(db.func.coalesce(db.func.sum(column), 0)).where(
+                table.c.user_id == user_id, table.c.status.in_(statuses)
+            ).scalar_subquery()
+
+        return [
+            total(table.c.deal_count, ['lead']).label('lead'),
+            total(table.c.deal_count, ['negotiating']).label('negotiating'),
+            total(table.c.sum_rate_agreed, ['completed']).label('total_revenue'),
+            total(table.c.sum_rate_quoted, ['lead', 'negotiating', 'confirmed']).label('pipeline_value'),
+        ]
+
+    @classmethod
+    def stats_for_user(cls, user_id):
+        """Reduce a user's rollup rows to the stats the pipeline list expects."""
+        row = db.session.execute(db.select(*cls.stats_columns(user_id))).one()
+        return dict(row._mapping)
+
+    @classmethod
+    def counts_by_status(cls, user_id):
+        """Return {status: deal_count} for a user's deals."""
+        rows = db.session.execute(
+            db.select(cls.status, cls.deal_count).where(cls.user_id == user_id)
+        ).all()
+        return {row.status: row.deal_count for row in rows}
+
+    @staticmethod
+    def add_delta(deltas, user_id, status, count, agreed, quoted):
+        """Accumulate a change into a {(user_id, status): [count, agreed, quoted]} dict.
+
+        Deals without a user are skipped: stats are only read per user, and
+        NULL never matches the unique constraint the upsert relies on.
+        """
+        if user_id is None:
+            return
+        current = deltas.setdefault((user_id, status), [0, 0.0, 0.0])
+        current[0] += count
+        current[1] += agreed or 0
+        current[2] += quoted or 0
+
+    @classmethod
+    def apply_deltas(cls, connection, deltas):
+        """Apply accumulated deltas with one UPDATE (or INSERT) per (user, status).
+
+        The after_flush listener calls this for ORM changes; bulk UPDATEs on
+        sales_pipeline bypass the ORM and must call it themselves, then pass
+        the ROLLUP_SYNCED execution option (see _guard_pipeline_bulk_writes).
+        """
+        table = cls.__table__
+        for (user_id, status), (count, agreed, quoted) in deltas.items():
+            if not (count or agreed or quoted):
+                continue
+            result = connection.execute(
+                table.update()
+                .where(table.c.user_id == user_id, table.c.status == status)
+                .values(
+                    deal_count=table.c.deal_count + count,
+                    sum_rate_agreed=table.c.sum_rate_agreed + agreed,
+                    sum_rate_quoted=table.c.sum_rate_quoted + quoted,
+                )
+            )
+            if result.rowcount == 0:
+                # First deal in this bucket. Another request may insert the
+                # same bucket concurrently, so fold into it on conflict
+                # instead of failing the unique constraint.
+                stmt = dialect_insert(connection, table).values(
+                    user_id=user_id,
+                    status=status,
+                    deal_count=count,
+                    sum_rate_agreed=agreed,
+                    sum_rate_quoted=quoted,
+                )
+                if hasattr(stmt, 'on_conflict_do_update'):
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=['user_id', 'status'],
+                        set_={
+                            'deal_count': table.c.deal_count + stmt.excluded.deal_count,
+                            'sum_rate_agreed': table.c.sum_rate_agreed + stmt.excluded.sum_rate_agreed,
+                            'sum_rate_quoted': table.c.sum_rate_quoted + stmt.excluded.sum_rate_quoted,
+                        },
+                    )
+                connection.execute(stmt)
+
+    @classmethod
+    def rebuild(cls, connection, user_id=None):
+        """Recompute rollup rows from sales_pipeline (all users, or one).
+
+        The listener keeps the rollup exact for changes made through this
+        app; this repairs it after out-of-band writes (manual SQL, imports).
+        """
+        table = cls.__table__
+        deals = SalesPipeline.__table__
+
+        delete = table.delete()
+        source = db.select(
+            deals.c.user_id,
+            deals.c.status,
+            db.func.count(),
+            db.func.coalesce(db.func.sum(deals.c.rate_agreed), 0),
+            db.func.coalesce(db.func.sum(deals.c.rate_quoted), 0),
+        ).where(
+            deals.c.user_id.is_not(None)
+        ).group_by(deals.c.user_id, deals.c.status)
+        if user_id is not None:
+            delete = delete.where(table.c.user_id == user_id)
+            source = source.where(deals.c.user_id == user_id)
+
+        connection.execute(delete)
+        connection.execute(table.insert().from_select(
+            ['user_id', 'status', 'deal_count', 'sum_rate_agreed', 'sum_rate_quoted'], source
+        ))
+
+
+def _old_and_new(obj, attr):
+    """Return (old, new) values for an attribute from its flush history."""
+    hist = get_history(obj, attr)
+    if hist.added or hist.deleted:
+        old = hist.deleted[0] if hist.deleted else None
+        new = hist.added[0] if hist.added else None
+        return old, new
+    value = hist.unchanged[0] if hist.unchanged else db.inspect(obj).dict.get(attr)
+    return value, value
+
+
+# Attributes whose old and new values decide a deal's rollup bucket and totals
+_ROLLUP_ATTRS = ('user_id', 'status', 'rate_agreed', 'rate_quoted')
+
+# Execution option a bulk UPDATE/DELETE of deals passes once it has applied
+# its own rollup deltas (or changes no rollup column)
+ROLLUP_SYNCED = 'pipeline_rollup_synced'
+
+
+@event.listens_for(db.session, 'before_flush')
+def _load_pipeline_rollup_attrs(session, flush_context, instances):
+    """Load expired rollup attributes of changed deals while the rows still hold them.
+
+    Otherwise after_flush would read None for them (a deleted row can't be
+    refreshed), and put the deltas in a (user, None) bucket.
+    """
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, SalesPipeline):
+            for attr in _ROLLUP_ATTRS:
+                getattr(obj, attr)
+
+
+@event.listens_for(db.session, 'do_orm_execute')
+def _guard_pipeline_bulk_writes(orm_execute_state):
+    """Refuse bulk UPDATE/DELETE of deals that hasn't synced the stats rollup.
+
+    These skip the flush listener, so callers apply PipelineStatsRollup
+    deltas themselves and opt in with execution_options(**{ROLLUP_SYNCED: True}).
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not SalesPipeline:
+        return
+    if not orm_execute_state.execution_options.get(ROLLUP_SYNCED):
+        raise RuntimeError(
+            'Bulk UPDATE/DELETE of SalesPipeline must apply PipelineStatsRollup '
+            f'deltas and set the {ROLLUP_SYNCED!r} execution option'
+        )
+
+
+@event.listens_for(db.session, 'after_flush')
+def _sync_pipeline_stats_rollup(session, flush_context):
+    """Apply SalesPipeline inserts/updates/deletes to PipelineStatsRollup as deltas."""
+    deltas = {}
+    add = PipelineStatsRollup.add_delta
+
+    for obj in session.new:
+        if isinstance(obj, SalesPipeline):
+            add(deltas, obj.user_id, obj.status, 1, obj.rate_agreed, obj.rate_quoted)
+
+    for obj in session.deleted:
+        if isinstance(obj, SalesPipeline):
+            user_id, status, agreed, quoted = (_old_and_new(obj, attr)[0] for attr in _ROLLUP_ATTRS)
+            add(deltas, user_id, status, -1, -(agreed or 0), -(quoted or 0))
+
+    for obj in session.dirty:
+        if not isinstance(obj, SalesPipeline) or obj in session.deleted:
+            continue
+        old, new = zip(*(_old_and_new(obj, attr) for attr in _ROLLUP_ATTRS))
+        if old == new:
+            continue
+        old_user, old_status, old_agreed, old_quoted = old
+        new_user, new_status, new_agreed, new_quoted = new
+        add(deltas, old_user, old_status, -1, -(old_agreed or 0), -(old_quoted or 0))
+        add(deltas, new_user, new_status, 1, new_agreed, new_quoted)
+
+    if deltas:
+        PipelineStatsRollup.apply_deltas(session.connection(), deltas)
+
+
 class OutreachTemplate(db.Model):
     """Email/message templates for sponsors, collabs, and outreach."""
     __tablename__ = 'outreach_templates'
@@ -1,8 +1,21 @@
 """Content models - episode guides and templates."""
 from datetime import datetime, timezone
+from sqlalchemy.orm import query_expression
 from extensions import db
 
 
+def format_seconds(seconds):
+    """Format a number of seconds as MM:SS, or HH:MM:SS from an hour up."""
+    if seconds is None:
+        return None
+    hrs = seconds // 3600
+    mins = (seconds % 3600) // 60
+    secs = seconds % 60
+    if hrs > 0:
+        return f"{hrs}:{mins:02d}:{secs:02d}"
+    return f"{mins:02d}:{secs:02d}"
+
+
 class EpisodeGuideTemplate(db.Model):
     """Reusable template for episode guides with default sections and static content."""
     __tablename__ = 'episode_guide_templates'
@@ -98,7 +111,13 @@ class EpisodeGuide(db.Model):
     # Format: [{"key": "my_section", "name": "My Section", "parent": null, "color": "blue"}, ...]
     custom_sections = db.Column(db.JSON, nullable=True)
 
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Number of items, populated only by queries using with_expression (list view)
+    item_count = query_expression()
+    # Titles of items matching the list search, joined into one string; only
+    # populated by list_episodes when a search term is given
+    matching_item_titles = query_expression()
+
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     # Relationships
@@ -107,6 +126,36 @@ class EpisodeGuide(db.Model):
     items = db.relationship('EpisodeGuideItem', back_populates='guide', cascade='all, delete-orphan',
                            order_by='EpisodeGuideItem.section, EpisodeGuideItem.position', lazy='select')
 
+    __table_args__ = (
+        # Backs list_episodes' keyset seek on (created_at, id) within a podcast
+        db.Index('ix_episode_guides_podcast_created_at', 'podcast_id', 'created_at', 'id'),
+        # Covers list_episodes' per-status counts, so they read the index only
+        db.Index('ix_episode_guides_podcast_status', 'podcast_id', 'status'),
+        # new_episode looks up the previous episode number within a podcast
+        db.Index('ix_episode_guides_podcast_episode_number', 'podcast_id', 'episode_number'),
+    )
+
+    @classmethod
+    def stats_columns(cls, podcast_id):
+        """Labelled scalar subqueries counting a podcast's guides by status.
+
+        Like PipelineStatsRollup.stats_columns, these can ride along on the
+        list page SELECT or be selected on their own. Each is a count over
+        (podcast_id, status), which ix_episode_guides_podcast_status covers.
+        """
+        table = cls.__table__
+
+        def count(*conditions):
+            return db.select(db.func.count()).select_from(table).where(
+                table.c.podcast_id == podcast_id, *conditions
+            ).scalar_subquery()
+
+        return [
+            count().label('total'),
+            count(table.c.status == 'draft').label('drafts'),
+            count(table.c.status == 'completed').label('completed'),
+        ]
+
     def get_intro_content(self):
         """Get intro static content (from guide, or fallback to template)."""
         if self.intro_static_content:
@@ -147,14 +196,7 @@ class EpisodeGuide(db.Model):
     @property
     def formatted_duration(self):
         """Return formatted duration as HH:MM:SS or MM:SS."""
-        if self.total_duration_seconds is None:
-            return None
-        hrs = self.total_duration_seconds // 3600
-        mins = (self.total_duration_seconds % 3600) // 60
-        secs = self.total_duration_seconds % 60
-        if hrs > 0:
-            return f"{hrs}:{mins:02d}:{secs:02d}"
-        return f"{mins:02d}:{secs:02d}"
+        return format_seconds(self.total_duration_seconds)
 
     def to_dict(self):
         return {
@@ -217,17 +259,16 @@ class EpisodeGuideItem(db.Model):
     # Relationships
     guide = db.relationship('EpisodeGuide', back_populates='items')
 
+    __table_args__ = (
+        # Serves items in (section, position) order per guide, and the
+        # MAX(position) lookup when appending to a section
+        db.Index('ix_episode_guide_items_guide_section_position', 'guide_id', 'section', 'position'),
+    )
+
     @property
     def formatted_timestamp(self):
         """Return MM:SS or HH:MM:SS formatted timestamp."""
-        if self.timestamp_seconds is None:
-            return None
-        hrs = self.timestamp_seconds // 3600
-        mins = (self.timestamp_seconds % 3600) // 60
-        secs = self.timestamp_seconds % 60
-        if hrs > 0:
-            return f"{hrs}:{mins:02d}:{secs:02d}"
-        return f"{mins:02d}:{secs:02d}"
+        return format_seconds(self.timestamp_seconds)
 
     @property
     def all_links(self):
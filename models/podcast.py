@@ -1,6 +1,12 @@
 """Podcast models with role-based access control."""
+import re
 from datetime import datetime, timezone
+from sqlalchemy.exc import IntegrityError
 from extensions import db
+from models.base import dialect_insert
+
+# Runs of characters not allowed in a slug, collapsed to a single hyphen
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
 
 
 class Podcast(db.Model):
@@ -34,13 +40,36 @@ class Podcast(db.Model):
     templates = db.relationship('EpisodeGuideTemplate', back_populates='podcast', lazy='dynamic',
                                 cascade='all, delete-orphan')
 
+    @classmethod
+    def insert_if_slug_free(cls, connection, **values):
+        """INSERT a podcast row unless its slug is already taken.
+
+        Uses INSERT ... ON CONFLICT (slug) DO NOTHING where the dialect has
+        it, so a collision (including a concurrent create) costs no separate
+        uniqueness SELECT and doesn't abort the surrounding transaction.
+
+        Returns:
+            The new podcast's id, or None if the slug was taken.
+        """
+        table = cls.__table__
+        stmt = dialect_insert(connection, table).values(**values).returning(table.c.id)
+        if hasattr(stmt, 'on_conflict_do_nothing'):
+            return connection.execute(stmt.on_conflict_do_nothing(index_elements=['slug'])).scalar()
+
+        try:
+            with connection.begin_nested():
+                return connection.execute(stmt).scalar()
+        except IntegrityError:
+            return None
+
+    @staticmethod
+    def slugify(name):
+        """Convert a podcast name to its base slug (no uniqueness check)."""
+        return _SLUG_SEPARATOR_RE.sub('-', name.lower()).strip('-') or 'podcast'
+
     def generate_slug(self):
         """Generate URL-friendly slug from name."""
-        import re
-        slug = self.name.lower()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
-        slug = slug.strip('-')
-        return slug
+        return self.slugify(self.name)
 
     def get_admins(self):
         """Get all admin members of this podcast."""
@@ -91,6 +120,8 @@ class PodcastMember(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint('podcast_id', 'user_id', name='unique_podcast_member'),
+        # Serves list_members' ORDER BY role, created_at within a podcast
+        db.Index('ix_podcast_members_podcast_role_created_at', 'podcast_id', 'role', 'created_at'),
     )
 
     def to_dict(self):
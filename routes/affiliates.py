@@ -14,6 +14,7 @@ from utils.validation import (
     or_none, ValidationError
 )
 from utils.logging import log_exception
+from utils.queries import get_affiliate_companies_for_dropdown, query_exists
 
 affiliates_bp = Blueprint('affiliates', __name__)
 
@@ -72,7 +73,7 @@ def list_revenue():
         AffiliateRevenue.year, AffiliateRevenue.month
     ).all()
 
-    companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+    companies = get_affiliate_companies_for_dropdown()
 
     return render_template('affiliates/list.html',
         entries=pagination.items,
@@ -117,13 +118,13 @@ def new_revenue():
             sales_count = parse_int(request.form.get('sales_count', ''), 'Sales Count', allow_negative=False)
 
             # Check for existing entry (for this user)
-            existing = AffiliateRevenue.query.filter_by(
+            existing = query_exists(AffiliateRevenue.query.filter_by(
                 user_id=current_user.id, company_id=company_id, year=year, month=month
-            ).first()
+            ))
 
             if existing:
                 flash('Revenue entry for this company/month already exists. Edit it instead.', 'error')
-                companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+                companies = get_affiliate_companies_for_dropdown()
                 current_year = datetime.now().year
                 current_month = datetime.now().month
                 return render_template('affiliates/form.html', entry=None, companies=companies,
@@ -146,7 +147,7 @@ def new_revenue():
 
         except ValidationError as e:
             flash(f'{e.field}: {e.message}', 'error')
-            companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+            companies = get_affiliate_companies_for_dropdown()
             current_year = datetime.now().year
             current_month = datetime.now().month
             return render_template('affiliates/form.html', entry=None, companies=companies,
@@ -155,13 +156,13 @@ def new_revenue():
             db.session.rollback()
             log_exception(current_app.logger, 'Database operation', e)
             flash('Database error occurred. Please try again.', 'error')
-            companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+            companies = get_affiliate_companies_for_dropdown()
             current_year = datetime.now().year
             current_month = datetime.now().month
             return render_template('affiliates/form.html', entry=None, companies=companies,
                                   current_year=current_year, current_month=current_month)
 
-    companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+    companies = get_affiliate_companies_for_dropdown()
     current_year = datetime.now().year
     current_month = datetime.now().month
 
@@ -194,18 +195,18 @@ def edit_revenue(id):
 
         except ValidationError as e:
             flash(f'{e.field}: {e.message}', 'error')
-            companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+            companies = get_affiliate_companies_for_dropdown()
             return render_template('affiliates/form.html', entry=entry, companies=companies,
                                   current_year=None, current_month=None)
         except SQLAlchemyError as e:
             db.session.rollback()
             log_exception(current_app.logger, 'Database operation', e)
             flash('Database error occurred. Please try again.', 'error')
-            companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+            companies = get_affiliate_companies_for_dropdown()
             return render_template('affiliates/form.html', entry=entry, companies=companies,
                                   current_year=None, current_month=None)
 
-    companies = Company.query.filter(Company.affiliate_status == 'yes').order_by(Company.name).all()
+    companies = get_affiliate_companies_for_dropdown()
     return render_template('affiliates/form.html', entry=entry, companies=companies,
                           current_year=None, current_month=None)
 
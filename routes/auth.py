@@ -16,6 +16,7 @@ from constants import (
     MAX_FAILED_LOGIN_ATTEMPTS,
 )
 from utils.logging import log_exception
+from utils.queries import query_exists
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -241,7 +242,7 @@ def register():
             return render_template('auth/register.html')
 
         # Check existing user - don't reveal if email exists (prevents enumeration)
-        if User.query.filter_by(email=email).first():
+        if query_exists(User.query.filter_by(email=email)):
             # Log for admin awareness, but show same success message to user
             current_app.logger.info(f"Registration attempted for existing email: {email}")
             flash('Account created. Please wait for admin approval.', 'success')
@@ -1,6 +1,6 @@
 from flask_login import login_required, current_user
 from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, abort
-from sqlalchemy import func, case
+from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from models import Collaboration, Contact
@@ -10,7 +10,7 @@ from services.options import get_choices_for_type, get_valid_values_for_type
 from utils.validation import ValidationError
 from utils.routes import FormData, make_delete_view, quick_action
 from utils.logging import log_exception
-from utils.queries import get_contacts_for_dropdown
+from utils.queries import clamp_page, get_contacts_for_dropdown
 
 collabs_bp = Blueprint('collabs', __name__)
 
@@ -44,20 +44,21 @@ def list_collabs():
         # Search by contact name
         query = query.join(Contact).filter(Contact.name.ilike(f"%{search}%"))
 
-    # Paginated query
-    pagination = query.order_by(Collaboration.created_at.desc()).paginate(
-        page=page, per_page=DEFAULT_PAGE_SIZE, error_out=False
-    )
-
     # Stats - single aggregated query for all status counts (user's data only)
     stats_result = db.session.query(
-        func.sum(case((Collaboration.status == 'idea', 1), else_=0)).label('idea'),
-        func.sum(case((Collaboration.status == 'reached_out', 1), else_=0)).label('reached_out'),
-        func.sum(case((Collaboration.status == 'confirmed', 1), else_=0)).label('confirmed'),
-        func.sum(case((Collaboration.status == 'completed', 1), else_=0)).label('completed'),
-        func.sum(case((Collaboration.follow_up_needed == True, 1), else_=0)).label('need_follow_up')
+        func.count().filter(Collaboration.status == 'idea').label('idea'),
+        func.count().filter(Collaboration.status == 'reached_out').label('reached_out'),
+        func.count().filter(Collaboration.status == 'confirmed').label('confirmed'),
+        func.count().filter(Collaboration.status == 'completed').label('completed'),
+        func.count().filter(Collaboration.follow_up_needed == True).label('need_follow_up'),
+        func.count().label('total')
     ).filter(Collaboration.user_id == current_user.id).first()
 
+    # Paginated query; the unfiltered total bounds the last page
+    pagination = query.order_by(Collaboration.created_at.desc()).paginate(
+        page=clamp_page(page, stats_result.total), per_page=DEFAULT_PAGE_SIZE, error_out=False
+    )
+
     # Create stats dict for template
     stats = {
         'idea': int(stats_result.idea or 0),
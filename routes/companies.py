@@ -1,11 +1,12 @@
 from flask_login import login_required
-from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 from models import Company
 from app import db
 from constants import (
-    COMPANY_STATUS_CHOICES, COMPANY_PRIORITY_CHOICES, AFFILIATE_STATUS_CHOICES, DEFAULT_PAGE_SIZE
+    COMPANY_STATUS_CHOICES, COMPANY_PRIORITY_CHOICES, AFFILIATE_STATUS_CHOICES, DEFAULT_PAGE_SIZE,
+    DROPDOWN_SEARCH_LIMIT
 )
 from services.crud import CompanyService
 from services.options import get_choices_for_type, get_valid_values_for_type
@@ -14,6 +15,7 @@ from utils.validation import (
     or_none, ValidationError
 )
 from utils.logging import log_exception
+from utils.queries import query_exists, search_companies_for_dropdown
 
 companies_bp = Blueprint('companies', __name__)
 
@@ -58,12 +60,28 @@ def list_companies():
     )
 
 
+@companies_bp.route('/lookup')
+@login_required
+def lookup_companies():
+    """AJAX endpoint for company autocomplete dropdowns."""
+    term = request.args.get('q', '').strip()[:100]
+    limit = request.args.get('limit', DROPDOWN_SEARCH_LIMIT, type=int)
+
+    companies = search_companies_for_dropdown(term, limit)
+    return jsonify({
+        'success': True,
+        'results': [{'id': c.id, 'name': c.name} for c in companies],
+    })
+
+
 @companies_bp.route('/<int:id>')
 @login_required
 def view_company(id):
     """View company details with associated contacts."""
+    # contacts is one-to-many: load it with a second IN query rather than
+    # repeating the company columns on every contact row
     company = Company.query.options(
-        joinedload(Company.contacts)
+        selectinload(Company.contacts)
     ).get_or_404(id)
     contacts = sorted(company.contacts, key=lambda c: (c.name or '').lower())
     return render_template('companies/view.html', company=company, contacts=contacts)
@@ -83,7 +101,7 @@ def new_company():
             name = validate_required(request.form.get('name', ''), 'Company Name')
 
             # Check for duplicate
-            existing = Company.query.filter_by(name=name).first()
+            existing = query_exists(Company.query.filter_by(name=name))
             if existing:
                 flash(f'Company "{name}" already exists.', 'error')
                 return render_template('companies/form.html', company=None,
@@ -164,10 +182,10 @@ def edit_company(id):
             name = validate_required(request.form.get('name', ''), 'Company Name')
 
             # Check for duplicate name (excluding current)
-            existing = Company.query.filter(
+            existing = query_exists(Company.query.filter(
                 Company.name == name,
                 Company.id != id
-            ).first()
+            ))
             if existing:
                 flash(f'Company "{name}" already exists.', 'error')
                 return render_template('companies/form.html', company=company,
@@ -1,15 +1,15 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app
+from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify
 from flask_login import login_required
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from models import Contact, Company
 from extensions import db
-from constants import CONTACT_STATUS_CHOICES, DEFAULT_PAGE_SIZE
+from constants import CONTACT_STATUS_CHOICES, DEFAULT_PAGE_SIZE, DROPDOWN_SEARCH_LIMIT
 from services.options import get_choices_for_type, get_valid_values_for_type
 from utils.validation import ValidationError
 from utils.routes import FormData, make_delete_view
 from utils.logging import log_exception
-from utils.queries import get_companies_for_dropdown
+from utils.queries import get_companies_for_dropdown, search_contacts_for_dropdown
 
 contacts_bp = Blueprint('contacts', __name__)
 
@@ -52,6 +52,27 @@ def list_contacts():
     )
 
 
+@contacts_bp.route('/lookup')
+@login_required
+def lookup_contacts():
+    """AJAX endpoint for contact autocomplete dropdowns."""
+    term = request.args.get('q', '').strip()[:100]
+    limit = request.args.get('limit', DROPDOWN_SEARCH_LIMIT, type=int)
+
+    contacts = search_contacts_for_dropdown(term, limit)
+    return jsonify({
+        'success': True,
+        'results': [
+            {
+                'id': c.id,
+                'name': c.name,
+                'company_name': c.company_name,
+            }
+            for c in contacts
+        ],
+    })
+
+
 def _get_form_context(contact=None):
     """Get common context for contact forms."""
     return {
@@ -63,15 +84,13 @@ def _get_form_context(contact=None):
 
 def _get_valid_roles():
     """Get valid role values for form validation."""
-    return [v for v, _ in get_choices_for_type('contact_role')]
+    return get_valid_values_for_type('contact_role')
 
 
 @contacts_bp.route('/new', methods=['GET', 'POST'])
 @login_required
 def new_contact():
     """Create a new contact."""
-    context = _get_form_context()
-    context['preselect_company_id'] = request.args.get('company_id', type=int)
     valid_roles = _get_valid_roles()
 
     if request.method == 'POST':
@@ -104,6 +123,9 @@ def new_contact():
             log_exception(current_app.logger, 'Create contact', e)
             flash('Database error occurred. Please try again.', 'error')
 
+    # Dropdown rows are only loaded when the form is actually rendered
+    context = _get_form_context()
+    context['preselect_company_id'] = request.args.get('company_id', type=int)
     return render_template('contacts/form.html', **context)
 
 
@@ -112,7 +134,6 @@ def new_contact():
 def edit_contact(id):
     """Edit an existing contact."""
     contact = Contact.query.options(joinedload(Contact.company)).get_or_404(id)
-    context = _get_form_context(contact)
     valid_roles = _get_valid_roles()
 
     if request.method == 'POST':
@@ -142,7 +163,7 @@ def edit_contact(id):
             log_exception(current_app.logger, 'Update contact', e, contact_id=id)
             flash('Database error occurred. Please try again.', 'error')
 
-    return render_template('contacts/form.html', **context)
+    return render_template('contacts/form.html', **_get_form_context(contact))
 
 
 # Use generic delete view factory with cascade protection
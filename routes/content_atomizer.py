@@ -6,7 +6,7 @@ into platform-optimized snippets for Twitter, Instagram, LinkedIn, etc.
 from datetime import datetime, timezone
 from flask_login import login_required, current_user
 from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, abort, jsonify
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from models import ContentAtomicSnippet, ContentAtomicTemplate, EpisodeGuide, SocialConnection
@@ -22,6 +22,7 @@ from utils.validation import ValidationError
 from utils.routes import FormData
 from utils.logging import log_exception
 from utils.podcast_access import get_user_podcasts
+from utils.queries import clamp_page
 
 atomizer_bp = Blueprint('atomizer', __name__)
 
@@ -48,19 +49,19 @@ def list_snippets():
     if source_type and source_type in [s[0] for s in ContentAtomicSnippet.SOURCE_TYPES]:
         query = query.filter_by(source_type=source_type)
 
-    # Paginate
-    pagination = query.order_by(ContentAtomicSnippet.created_at.desc()).paginate(
-        page=page, per_page=DEFAULT_PAGE_SIZE, error_out=False
-    )
-
-    # Stats
+    # Stats (FILTER-clause counts, no per-row cast)
     stats = db.session.query(
         func.count(ContentAtomicSnippet.id).label('total'),
-        func.sum(func.cast(ContentAtomicSnippet.status == 'draft', db.Integer)).label('drafts'),
-        func.sum(func.cast(ContentAtomicSnippet.status == 'approved', db.Integer)).label('approved'),
-        func.sum(func.cast(ContentAtomicSnippet.status == 'published', db.Integer)).label('published'),
+        func.count().filter(ContentAtomicSnippet.status == 'draft').label('drafts'),
+        func.count().filter(ContentAtomicSnippet.status == 'approved').label('approved'),
+        func.count().filter(ContentAtomicSnippet.status == 'published').label('published'),
     ).filter(ContentAtomicSnippet.user_id == current_user.id).first()
 
+    # Paginate; the unfiltered total bounds the last page
+    pagination = query.order_by(ContentAtomicSnippet.created_at.desc()).paginate(
+        page=clamp_page(page, stats.total or 0), per_page=DEFAULT_PAGE_SIZE, error_out=False
+    )
+
     # Check if AI is configured
     service = ContentAtomizerService()
     ai_configured = service.is_configured
@@ -162,20 +163,25 @@ def generate_snippet():
             log_exception(current_app.logger, 'Generate snippet', e)
             flash('Database error occurred. Please try again.', 'error')
 
-    # Get episodes for dropdown (from podcasts user has access to)
+    # Get episodes for dropdown (from podcasts user has access to). The
+    # dropdowns only show a few columns, so select plain rows rather than
+    # hydrating guides and templates with their JSON/text columns.
     user_podcasts = get_user_podcasts()
     podcast_ids = [p.id for p in user_podcasts]
     episodes = []
     if podcast_ids:
-        episodes = EpisodeGuide.query.filter(
-            EpisodeGuide.podcast_id.in_(podcast_ids)
-        ).order_by(EpisodeGuide.created_at.desc()).limit(50).all()
+        episodes = db.session.execute(
+            select(EpisodeGuide.id, EpisodeGuide.title, EpisodeGuide.created_at)
+            .where(EpisodeGuide.podcast_id.in_(podcast_ids))
+            .order_by(EpisodeGuide.created_at.desc()).limit(50)
+        ).all()
 
     # Get user's templates
-    templates = ContentAtomicTemplate.query.filter_by(
-        user_id=current_user.id,
-        is_active=True
-    ).order_by(ContentAtomicTemplate.name).all()
+    templates = db.session.execute(
+        select(ContentAtomicTemplate.id, ContentAtomicTemplate.name, ContentAtomicTemplate.platform)
+        .where(ContentAtomicTemplate.user_id == current_user.id, ContentAtomicTemplate.is_active == True)
+        .order_by(ContentAtomicTemplate.name)
+    ).all()
 
     return render_template('atomizer/generate.html',
         episodes=episodes,
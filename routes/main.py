@@ -1,8 +1,8 @@
 from flask import Blueprint, render_template, jsonify, g, current_app
 from flask_login import login_required, current_user
-from models import Contact, Company, Inventory, AffiliateRevenue, SalesPipeline, Collaboration
+from models import Contact, Company, Inventory, AffiliateRevenue, PipelineStatsRollup, Collaboration
 from app import db
-from sqlalchemy import func, case, and_, text
+from sqlalchemy import func, and_, text
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timedelta, date
@@ -48,26 +48,22 @@ def dashboard():
     user_id = current_user.id
     inventory_stats = db.session.query(
         func.count(Inventory.id).label('total'),
-        func.sum(case((Inventory.status == 'in_queue', 1), else_=0)).label('in_queue'),
-        func.sum(case((Inventory.status == 'reviewing', 1), else_=0)).label('reviewing'),
-        func.sum(case((Inventory.status == 'listed', 1), else_=0)).label('listed'),
-        func.sum(case((Inventory.sold == True, 1), else_=0)).label('sold_count'),
-        func.sum(case((Inventory.source_type == 'review_unit', 1), else_=0)).label('review_units'),
-        func.sum(case((Inventory.source_type == 'personal_purchase', 1), else_=0)).label('personal_purchases'),
+        func.count().filter(Inventory.status == 'in_queue').label('in_queue'),
+        func.count().filter(Inventory.status == 'reviewing').label('reviewing'),
+        func.count().filter(Inventory.status == 'listed').label('listed'),
+        func.count().filter(Inventory.sold == True).label('sold_count'),
+        func.count().filter(Inventory.source_type == 'review_unit').label('review_units'),
+        func.count().filter(Inventory.source_type == 'personal_purchase').label('personal_purchases'),
     ).filter(Inventory.user_id == user_id).first()
 
     # Calculate total P/L using database aggregation - filtered by user
     total_profit_loss = db.session.query(
         func.sum(
-            case(
-                (Inventory.sold == True,
-                 func.coalesce(Inventory.sale_price, 0) -
-                 func.coalesce(Inventory.fees, 0) -
-                 func.coalesce(Inventory.shipping, 0) -
-                 func.coalesce(Inventory.cost, 0)),
-                else_=0
-            )
-        )
+            func.coalesce(Inventory.sale_price, 0) -
+            func.coalesce(Inventory.fees, 0) -
+            func.coalesce(Inventory.shipping, 0) -
+            func.coalesce(Inventory.cost, 0)
+        ).filter(Inventory.sold == True)
     ).filter(Inventory.user_id == user_id).scalar() or 0
 
     # Upcoming deadlines (next 14 days) - filtered by user
@@ -97,7 +93,7 @@ def dashboard():
 
     # Single query for yearly and total affiliate revenue (user's data only)
     affiliate_stats = db.session.query(
-        func.coalesce(func.sum(case((AffiliateRevenue.year == current_year, AffiliateRevenue.revenue), else_=0)), 0).label('yearly'),
+        func.coalesce(func.sum(AffiliateRevenue.revenue).filter(AffiliateRevenue.year == current_year), 0).label('yearly'),
         func.coalesce(func.sum(AffiliateRevenue.revenue), 0).label('total')
     ).filter(AffiliateRevenue.user_id == user_id).first()
 
@@ -140,21 +136,15 @@ def dashboard():
     # Total revenue from all sources
     total_revenue = total_affiliate_revenue + total_profit_loss
 
-    # Pipeline conversion funnel (user's data only)
-    pipeline_funnel = db.session.query(
-        func.sum(case((SalesPipeline.status == 'lead', 1), else_=0)).label('leads'),
-        func.sum(case((SalesPipeline.status == 'negotiating', 1), else_=0)).label('negotiating'),
-        func.sum(case((SalesPipeline.status == 'confirmed', 1), else_=0)).label('confirmed'),
-        func.sum(case((SalesPipeline.status == 'completed', 1), else_=0)).label('completed'),
-        func.sum(case((SalesPipeline.status == 'lost', 1), else_=0)).label('lost'),
-    ).filter(SalesPipeline.user_id == user_id).first()
-
+    # Pipeline conversion funnel (user's data only), read from the per-status
+    # rollup rather than re-aggregating every deal
+    status_counts = PipelineStatsRollup.counts_by_status(user_id)
     funnel = {
-        'leads': int(pipeline_funnel.leads or 0),
-        'negotiating': int(pipeline_funnel.negotiating or 0),
-        'confirmed': int(pipeline_funnel.confirmed or 0),
-        'completed': int(pipeline_funnel.completed or 0),
-        'lost': int(pipeline_funnel.lost or 0),
+        'leads': status_counts.get('lead', 0),
+        'negotiating': status_counts.get('negotiating', 0),
+        'confirmed': status_counts.get('confirmed', 0),
+        'completed': status_counts.get('completed', 0),
+        'lost': status_counts.get('lost', 0),
     }
     # Calculate conversion rate
     total_leads = funnel['leads'] + funnel['negotiating'] + funnel['confirmed'] + funnel['completed'] + funnel['lost']
@@ -163,9 +153,9 @@ def dashboard():
     # Collaboration stats (user's data only)
     collab_stats = db.session.query(
         func.count(Collaboration.id).label('total'),
-        func.sum(case((Collaboration.status == 'confirmed', 1), else_=0)).label('confirmed'),
-        func.sum(case((Collaboration.status == 'completed', 1), else_=0)).label('completed'),
-        func.sum(case((Collaboration.follow_up_needed == True, 1), else_=0)).label('needs_follow_up'),
+        func.count().filter(Collaboration.status == 'confirmed').label('confirmed'),
+        func.count().filter(Collaboration.status == 'completed').label('completed'),
+        func.count().filter(Collaboration.follow_up_needed == True).label('needs_follow_up'),
     ).filter(Collaboration.user_id == user_id).first()
 
     return render_template('dashboard.html',
@@ -1,21 +1,55 @@
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from flask_login import login_required, current_user
 from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, abort, jsonify
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, joinedload, raiseload, selectinload, with_expression
+from sqlalchemy import func, update
 from sqlalchemy.exc import SQLAlchemyError
-from models import SalesPipeline, Company, Contact, AffiliateRevenue, DealDeliverable
+from models import SalesPipeline, PipelineStatsRollup, Company, Contact, AffiliateRevenue, DealDeliverable
+from models.business import ROLLUP_SYNCED
 from extensions import db
-from constants import DEAL_STATUS_CHOICES, PAYMENT_STATUS_CHOICES, DEFAULT_PAGE_SIZE
-from services.options import get_choices_for_type, get_valid_values_for_type
+from constants import (
+    DEAL_STATUS_CHOICES_SET, PAYMENT_STATUS_CHOICES_SET, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE,
+    DELIVERABLES_PREVIEW_LENGTH,
+)
+from services.options import get_choices_for_type, get_valid_values_for_type, is_valid_option
 from utils.validation import ValidationError
-from utils.routes import FormData, make_delete_view, quick_action
+from utils.routes import FormData, make_delete_view, quick_action, quick_action_sql
 from utils.logging import log_exception
-from utils.queries import get_companies_for_dropdown, get_contacts_for_dropdown
+from utils.queries import KeysetPagination, parse_keyset_cursor
 
 pipeline_bp = Blueprint('pipeline', __name__)
 
 
+@lru_cache(maxsize=None)
+def _list_deals_options():
+    """Loader options for the deal list, built once on first use.
+
+    Eager load relationships to avoid N+1: both are many-to-one, so
+    joinedload folds them into the page SELECT as LEFT JOINs (no subquery
+    wrap, no follow-up round-trips); raiseload makes any other relationship
+    the template touches fail loudly instead of lazy-loading per row.
+    Text/JSON columns the list doesn't show are deferred; deliverables comes
+    back as a short preview. Filter values are bound parameters, so each
+    filter combination compiles once and is then served from the engine's
+    compiled cache.
+
+    Building options configures the mappers, so this is deferred to the
+    first request rather than paid on import by every app startup (CLI
+    commands and migrations included).
+    """
+    return (
+        joinedload(SalesPipeline.company).load_only(Company.name),
+        joinedload(SalesPipeline.contact).load_only(Contact.name),
+        defer(SalesPipeline.notes, raiseload=True),
+        defer(SalesPipeline.deliverables, raiseload=True),
+        defer(SalesPipeline.performance_report, raiseload=True),
+        with_expression(SalesPipeline.deliverables_preview,
+                        func.substr(SalesPipeline.deliverables, 1, DELIVERABLES_PREVIEW_LENGTH)),
+        raiseload('*'),
+    )
+
+
 @pipeline_bp.route('/')
 @login_required
 def list_deals():
@@ -24,61 +58,37 @@ def list_deals():
     status = request.args.get('status')
     payment = request.args.get('payment')
     follow_up = request.args.get('follow_up')
-    page = request.args.get('page', 1, type=int)
-
-    # Get valid values for filtering (includes custom options)
-    valid_deal_types = get_valid_values_for_type('deal_type')
 
-    # Eager load relationships to avoid N+1
-    # Filter by current user for data isolation
-    query = SalesPipeline.query.options(
-        joinedload(SalesPipeline.company),
-        joinedload(SalesPipeline.contact)
-    ).filter_by(user_id=current_user.id)
-
-    if deal_type and deal_type in valid_deal_types:
-        query = query.filter_by(deal_type=deal_type)
-    if status and status in DEAL_STATUS_CHOICES:
-        query = query.filter_by(status=status)
-    if payment and payment in PAYMENT_STATUS_CHOICES:
-        query = query.filter_by(payment_status=payment)
+    query = SalesPipeline.query.options(*_list_deals_options())
+
+    # Collect the valid filters and apply them in one filter_by() call,
+    # always scoped to the current user for data isolation. Valid types
+    # include custom options; only look them up when filtering
+    filters = {'user_id': current_user.id}
+    if deal_type and is_valid_option('deal_type', deal_type):
+        filters['deal_type'] = deal_type
+    if status and status in DEAL_STATUS_CHOICES_SET:
+        filters['status'] = status
+    if payment and payment in PAYMENT_STATUS_CHOICES_SET:
+        filters['payment_status'] = payment
     if follow_up == 'yes':
-        query = query.filter_by(follow_up_needed=True)
-
-    # Paginated query
-    pagination = query.order_by(SalesPipeline.created_at.desc()).paginate(
-        page=page, per_page=DEFAULT_PAGE_SIZE, error_out=False
+        filters['follow_up_needed'] = True
+    query = query.filter_by(**filters)
+
+    # Seek to the page after (or before) the cursor; page rows, total and the user's
+    # rollup stats come back in one SELECT
+    pagination = KeysetPagination(
+        query, SalesPipeline.created_at, SalesPipeline.id,
+        after=parse_keyset_cursor(request.args),
+        before=parse_keyset_cursor(request.args, 'before'),
+        per_page=DEFAULT_PAGE_SIZE,
+        extra_columns=PipelineStatsRollup.stats_columns(current_user.id),
     )
-
-    # Stats using database aggregation - compute what the template expects (user's data only)
-    stats_query = db.session.query(
-        func.sum(func.cast(SalesPipeline.status == 'lead', db.Integer)).label('lead'),
-        func.sum(func.cast(SalesPipeline.status == 'negotiating', db.Integer)).label('negotiating'),
-        func.coalesce(func.sum(
-            func.cast(SalesPipeline.status == 'completed', db.Integer) *
-            func.coalesce(SalesPipeline.rate_agreed, 0)
-        ), 0).label('total_revenue'),
-        func.coalesce(func.sum(
-            func.cast(SalesPipeline.status.in_(['lead', 'negotiating', 'confirmed']), db.Integer) *
-            func.coalesce(SalesPipeline.rate_quoted, 0)
-        ), 0).label('pipeline_value'),
-    ).filter(SalesPipeline.user_id == current_user.id).first()
-
-    stats = {
-        'lead': stats_query.lead or 0,
-        'negotiating': stats_query.negotiating or 0,
-        'total_revenue': stats_query.total_revenue or 0,
-        'pipeline_value': stats_query.pipeline_value or 0,
-    }
-
-    companies = get_companies_for_dropdown()
-    contacts = get_contacts_for_dropdown()
+    stats = pagination.extras
 
     return render_template('pipeline/list.html',
         deals=pagination.items,
         pagination=pagination,
-        companies=companies,
-        contacts=contacts,
         current_type=deal_type,
         current_status=status,
         current_payment=payment,
@@ -87,35 +97,42 @@ def list_deals():
     )
 
 
+def _render_deal_form(deal):
+    """Render the deal form for create/edit, including validation re-renders.
+
+    Company and contact are picked through the lookup endpoints, so the form
+    needs no dropdown rows from the database. Deal type choices are looked up
+    here so a successful POST, which redirects, never builds them.
+    """
+    return render_template('pipeline/form.html', deal=deal,
+                           deal_type_choices=get_choices_for_type('deal_type'))
+
+
 @pipeline_bp.route('/new', methods=['GET', 'POST'])
 @login_required
 def new_deal():
     """Create a new deal."""
-    # Get dynamic choices for form
-    deal_type_choices = get_choices_for_type('deal_type')
-    valid_deal_types = [v for v, _ in deal_type_choices]
-
     if request.method == 'POST':
         try:
             form = FormData(request.form)
 
-            # Validate required company
-            company_id = form.foreign_key('company_id', Company)
+            # Validate company (required) and contact in one query
+            company_id, contact_id = form.foreign_keys(('company_id', Company), ('contact_id', Contact))
             if not company_id:
                 raise ValidationError('Company', 'This field is required.')
 
             deal = SalesPipeline(
                 user_id=current_user.id,
                 company_id=company_id,
-                contact_id=form.foreign_key('contact_id', Contact),
-                deal_type=form.choice('deal_type', valid_deal_types, default='paid_review'),
-                status=form.choice('status', DEAL_STATUS_CHOICES, default='lead'),
+                contact_id=contact_id,
+                deal_type=form.choice('deal_type', get_valid_values_for_type('deal_type'), default='paid_review'),
+                status=form.choice('status', DEAL_STATUS_CHOICES_SET, default='lead'),
                 rate_quoted=form.decimal('rate_quoted'),
                 rate_agreed=form.decimal('rate_agreed'),
                 deliverables=form.optional('deliverables'),
                 deadline=form.date('deadline'),
                 deliverable_date=form.date('deliverable_date'),
-                payment_status=form.choice('payment_status', PAYMENT_STATUS_CHOICES, default='pending'),
+                payment_status=form.choice('payment_status', PAYMENT_STATUS_CHOICES_SET, default='pending'),
                 payment_date=form.date('payment_date'),
                 notes=form.optional('notes'),
                 follow_up_needed=form.boolean('follow_up_needed'),
@@ -129,58 +146,51 @@ def new_deal():
 
         except ValidationError as e:
             flash(f'{e.field}: {e.message}', 'error')
-            companies = get_companies_for_dropdown()
-            contacts = get_contacts_for_dropdown()
-            return render_template('pipeline/form.html', deal=None, companies=companies, contacts=contacts,
-                                   deal_type_choices=deal_type_choices)
+            return _render_deal_form(None)
         except SQLAlchemyError as e:
             db.session.rollback()
             log_exception(current_app.logger, 'Database operation', e)
             flash('Database error occurred. Please try again.', 'error')
-            companies = get_companies_for_dropdown()
-            contacts = get_contacts_for_dropdown()
-            return render_template('pipeline/form.html', deal=None, companies=companies, contacts=contacts,
-                                   deal_type_choices=deal_type_choices)
+            return _render_deal_form(None)
 
-    companies = get_companies_for_dropdown()
-    contacts = get_contacts_for_dropdown()
-    return render_template('pipeline/form.html', deal=None, companies=companies, contacts=contacts,
-                           deal_type_choices=deal_type_choices)
+    return _render_deal_form(None)
 
 
 @pipeline_bp.route('/<int:id>/edit', methods=['GET', 'POST'])
 @login_required
 def edit_deal(id):
     """Edit an existing deal."""
-    # Query with ownership check to prevent TOCTTOU information disclosure
-    deal = SalesPipeline.query.options(
-        joinedload(SalesPipeline.company),
-        joinedload(SalesPipeline.contact)
-    ).filter_by(id=id, user_id=current_user.id).first_or_404()
-
-    # Get dynamic choices for form
-    deal_type_choices = get_choices_for_type('deal_type')
-    valid_deal_types = [v for v, _ in deal_type_choices]
+    # Primary-key lookup; other users' deals 404 to avoid information disclosure.
+    # Only the form render shows the company/contact names; a POST that
+    # succeeds just redirects, so it skips the joins (an error re-render
+    # lazy-loads the two names instead).
+    options = [] if request.method == 'POST' else [
+        joinedload(SalesPipeline.company).load_only(Company.name),
+        joinedload(SalesPipeline.contact).load_only(Contact.name)
+    ]
+    deal = db.session.get(SalesPipeline, id, options=options)
+    if deal is None or deal.user_id != current_user.id:
+        abort(404)
 
     if request.method == 'POST':
         try:
             form = FormData(request.form)
 
-            # Validate required company
-            company_id = form.foreign_key('company_id', Company)
+            # Validate company (required) and contact in one query
+            company_id, contact_id = form.foreign_keys(('company_id', Company), ('contact_id', Contact))
             if not company_id:
                 raise ValidationError('Company', 'This field is required.')
 
             deal.company_id = company_id
-            deal.contact_id = form.foreign_key('contact_id', Contact)
-            deal.deal_type = form.choice('deal_type', valid_deal_types, default='paid_review')
-            deal.status = form.choice('status', DEAL_STATUS_CHOICES, default='lead')
+            deal.contact_id = contact_id
+            deal.deal_type = form.choice('deal_type', get_valid_values_for_type('deal_type'), default='paid_review')
+            deal.status = form.choice('status', DEAL_STATUS_CHOICES_SET, default='lead')
             deal.rate_quoted = form.decimal('rate_quoted')
             deal.rate_agreed = form.decimal('rate_agreed')
             deal.deliverables = form.optional('deliverables')
             deal.deadline = form.date('deadline')
             deal.deliverable_date = form.date('deliverable_date')
-            deal.payment_status = form.choice('payment_status', PAYMENT_STATUS_CHOICES, default='pending')
+            deal.payment_status = form.choice('payment_status', PAYMENT_STATUS_CHOICES_SET, default='pending')
             deal.payment_date = form.date('payment_date')
             deal.notes = form.optional('notes')
             deal.follow_up_needed = form.boolean('follow_up_needed')
@@ -192,23 +202,14 @@ def edit_deal(id):
 
         except ValidationError as e:
             flash(f'{e.field}: {e.message}', 'error')
-            companies = get_companies_for_dropdown()
-            contacts = get_contacts_for_dropdown()
-            return render_template('pipeline/form.html', deal=deal, companies=companies, contacts=contacts,
-                                   deal_type_choices=deal_type_choices)
+            return _render_deal_form(deal)
         except SQLAlchemyError as e:
             db.session.rollback()
             log_exception(current_app.logger, 'Database operation', e)
             flash('Database error occurred. Please try again.', 'error')
-            companies = get_companies_for_dropdown()
-            contacts = get_contacts_for_dropdown()
-            return render_template('pipeline/form.html', deal=deal, companies=companies, contacts=contacts,
-                                   deal_type_choices=deal_type_choices)
+            return _render_deal_form(deal)
 
-    companies = get_companies_for_dropdown()
-    contacts = get_contacts_for_dropdown()
-    return render_template('pipeline/form.html', deal=deal, companies=companies, contacts=contacts,
-                           deal_type_choices=deal_type_choices)
+    return _render_deal_form(deal)
 
 
 # Use generic delete view factory with user ownership check
@@ -220,6 +221,29 @@ pipeline_bp.add_url_rule(
 )
 
 
+def _record_deal_revenue(user_id, deals):
+    """Add each deal's agreed rate to this month's affiliate revenue for its company.
+
+    Deals only need company_id, rate_agreed and deliverables, so ORM objects
+    and column-only rows both work. Each company's entry is upserted with one
+    statement instead of a SELECT followed by an UPDATE or INSERT.
+    """
+    today = date.today()
+    by_company = {}
+    for deal in deals:
+        by_company.setdefault(deal.company_id, []).append(deal)
+
+    connection = db.session.connection()
+    for company_id, company_deals in by_company.items():
+        lines = [deal.deliverables or 'N/A' for deal in company_deals]
+        AffiliateRevenue.add_revenue(
+            connection, user_id, company_id, today.year, today.month,
+            amount=sum(deal.rate_agreed for deal in company_deals),
+            new_notes='From deal: ' + '\n+ Deal: '.join(lines),
+            appended_notes=''.join(f'\n+ Deal: {line}' for line in lines),
+        )
+
+
 @pipeline_bp.route('/<int:id>/mark-complete', methods=['POST'])
 @quick_action(SalesPipeline, 'pipeline.list_deals', check_user_id=True)
 def mark_complete(deal):
@@ -231,82 +255,127 @@ def mark_complete(deal):
 
     # Auto-create revenue entry if fully paid with agreed rate
     if deal.payment_status == 'paid' and deal.rate_agreed and deal.company_id:
-        today = date.today()
-
-        # Check if entry already exists for this user/company/month
-        existing = AffiliateRevenue.query.filter_by(
-            user_id=deal.user_id,
-            company_id=deal.company_id,
-            year=today.year,
-            month=today.month
-        ).first()
-
-        if existing:
-            existing.revenue = (existing.revenue or 0) + deal.rate_agreed
-            if existing.notes:
-                existing.notes += f"\n+ Deal: {deal.deliverables or 'N/A'}"
-            else:
-                existing.notes = f"From deal: {deal.deliverables or 'N/A'}"
-        else:
-            revenue = AffiliateRevenue(
-                user_id=deal.user_id,
-                company_id=deal.company_id,
-                year=today.year,
-                month=today.month,
-                revenue=deal.rate_agreed,
-                notes=f"From deal: {deal.deliverables or 'N/A'}"
-            )
-            db.session.add(revenue)
-
+        _record_deal_revenue(deal.user_id, [deal])
         return 'Deal marked as completed. Revenue entry created.'
 
     return 'Deal marked as completed.'
 
 
 @pipeline_bp.route('/<int:id>/mark-paid', methods=['POST'])
-@quick_action(SalesPipeline, 'pipeline.list_deals', check_user_id=True)
-def mark_paid(deal):
+@quick_action_sql(SalesPipeline, 'pipeline.list_deals', check_user_id=True)
+def mark_paid(stmt):
     """Quick action to mark a deal as paid.
 
-    If deal is completed with an agreed rate, auto-creates an affiliate revenue entry.
+    Runs a single UPDATE ... RETURNING instead of loading the deal; the status
+    doesn't change, so the stats rollup is unaffected. If deal is completed
+    with an agreed rate, auto-creates an affiliate revenue entry.
     """
-    deal.payment_status = 'paid'
-    deal.payment_date = db.func.current_date()
+    deal = db.session.execute(
+        stmt.values(payment_status='paid', payment_date=db.func.current_date())
+        .execution_options(**{ROLLUP_SYNCED: True})
+        .returning(SalesPipeline.status, SalesPipeline.rate_agreed,
+                   SalesPipeline.company_id, SalesPipeline.deliverables)
+    ).first()
+    if deal is None:
+        return None
 
     # Auto-create revenue entry if completed with agreed rate
     if deal.status == 'completed' and deal.rate_agreed and deal.company_id:
-        today = date.today()
-
-        # Check if entry already exists for this user/company/month
-        existing = AffiliateRevenue.query.filter_by(
-            user_id=deal.user_id,
-            company_id=deal.company_id,
-            year=today.year,
-            month=today.month
-        ).first()
-
-        if existing:
-            existing.revenue = (existing.revenue or 0) + deal.rate_agreed
-            if existing.notes:
-                existing.notes += f"\n+ Deal: {deal.deliverables or 'N/A'}"
-            else:
-                existing.notes = f"From deal: {deal.deliverables or 'N/A'}"
-        else:
-            revenue = AffiliateRevenue(
-                user_id=deal.user_id,
-                company_id=deal.company_id,
-                year=today.year,
-                month=today.month,
-                revenue=deal.rate_agreed,
-                notes=f"From deal: {deal.deliverables or 'N/A'}"
-            )
-            db.session.add(revenue)
-
+        _record_deal_revenue(current_user.id, [deal])
         return 'Deal marked as paid. Revenue entry created.'
 
     return 'Deal marked as paid.'
 
 
+def _selected_deal_ids():
+    """Parse a bulk action's selected deal ids (deduplicated, capped at one page)."""
+    return list(dict.fromkeys(request.form.getlist('ids', type=int)))[:MAX_PAGE_SIZE]
+
+
+def _bulk_update_deals(pending, values, earns_revenue, verb):
+    """Apply values to the current user's selected deals with a single UPDATE.
+
+    Args:
+        pending: Filter selecting deals that still need the change
+        values: Column values for the UPDATE
+        earns_revenue: Predicate on a selected row deciding if it books revenue
+        verb: Past-tense action for the flash message
+
+    The UPDATE bypasses the ORM, so the stats rollup is adjusted here from
+    the rows selected beforehand.
+    """
+    ids = _selected_deal_ids()
+    if not ids:
+        flash('No deals selected.', 'error')
+        return redirect(url_for('pipeline.list_deals'))
+
+    try:
+        rows = db.session.execute(
+            db.select(
+                SalesPipeline.id, SalesPipeline.status, SalesPipeline.payment_status,
+                SalesPipeline.company_id, SalesPipeline.rate_agreed,
+                SalesPipeline.rate_quoted, SalesPipeline.deliverables,
+            ).where(
+                SalesPipeline.id.in_(ids),
+                SalesPipeline.user_id == current_user.id,
+                pending,
+            )
+        ).all()
+
+        if rows:
+            db.session.execute(
+                update(SalesPipeline)
+                .where(SalesPipeline.id.in_([row.id for row in rows]))
+                .values(values)
+                .execution_options(synchronize_session=False, **{ROLLUP_SYNCED: True})
+            )
+
+            new_status = values.get('status')
+            if new_status:
+                deltas = {}
+                for row in rows:
+                    PipelineStatsRollup.add_delta(deltas, current_user.id, row.status,
+                                                  -1, -(row.rate_agreed or 0), -(row.rate_quoted or 0))
+                    PipelineStatsRollup.add_delta(deltas, current_user.id, new_status,
+                                                  1, row.rate_agreed, row.rate_quoted)
+                PipelineStatsRollup.apply_deltas(db.session.connection(), deltas)
+
+            _record_deal_revenue(current_user.id, [row for row in rows if earns_revenue(row)])
+
+        db.session.commit()
+        flash(f'{len(rows)} deal(s) marked as {verb}.', 'success')
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        log_exception(current_app.logger, f'Bulk mark {verb}', e, deal_ids=ids)
+        flash('Database error occurred. Please try again.', 'error')
+
+    return redirect(url_for('pipeline.list_deals'))
+
+
+@pipeline_bp.route('/bulk/mark-complete', methods=['POST'])
+@login_required
+def bulk_mark_complete():
+    """Mark the selected deals as completed in one statement."""
+    return _bulk_update_deals(
+        SalesPipeline.status.is_distinct_from('completed'),
+        {'status': 'completed'},
+        lambda row: row.payment_status == 'paid' and row.rate_agreed and row.company_id,
+        'completed',
+    )
+
+
+@pipeline_bp.route('/bulk/mark-paid', methods=['POST'])
+@login_required
+def bulk_mark_paid():
+    """Mark the selected deals as paid in one statement."""
+    return _bulk_update_deals(
+        SalesPipeline.payment_status.is_distinct_from('paid'),
+        {'payment_status': 'paid', 'payment_date': db.func.current_date()},
+        lambda row: row.status == 'completed' and row.rate_agreed and row.company_id,
+        'paid',
+    )
+
+
 # ---- Deal Deliverables Routes ----
 
 @pipeline_bp.route('/<int:id>/deliverables')
@@ -317,7 +386,7 @@ def list_deliverables(id):
     deal = SalesPipeline.query.options(
         joinedload(SalesPipeline.company),
         joinedload(SalesPipeline.contact),
-        joinedload(SalesPipeline.deliverables_list)
+        selectinload(SalesPipeline.deliverables_list)
     ).filter_by(id=id, user_id=current_user.id).first_or_404()
 
     # Calculate stats
@@ -468,7 +537,7 @@ def delete_deliverable(id, deliverable_id):
 @login_required
 def mark_delivered(id, deliverable_id):
     """Quick action to mark a deliverable as delivered."""
-    deal = SalesPipeline.query.get_or_404(id)
+    deal = db.get_or_404(SalesPipeline, id)
     if deal.user_id != current_user.id:
         abort(403)
 
@@ -491,7 +560,7 @@ def mark_delivered(id, deliverable_id):
 def generate_report(id):
     """Generate a proof-of-performance report for a deal."""
     deal = SalesPipeline.query.options(
-        joinedload(SalesPipeline.deliverables_list)
+        selectinload(SalesPipeline.deliverables_list)
     ).get_or_404(id)
 
     if deal.user_id != current_user.id:
@@ -1,16 +1,16 @@
 """Podcast CRUD operations: list, create, settings, delete."""
-import re
 import secrets
 from flask import render_template, request, redirect, url_for, flash, g, current_app
 from flask_login import login_required, current_user
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from extensions import db
-from models import Podcast, PodcastMember
+from models import EpisodeGuide, Podcast, PodcastMember
 from utils.validation import ValidationError
 from utils.routes import FormData
 from utils.logging import log_exception
-from utils.podcast_access import get_user_podcasts, get_user_role, require_podcast_access, require_podcast_admin
+from utils.podcast_access import require_podcast_access, require_podcast_admin
 
 from . import podcast_bp
 
@@ -26,12 +26,7 @@ def generate_unique_slug(name, exclude_id=None, add_random=False):
     Returns:
         Unique slug string.
     """
-    slug = name.lower()
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    slug = slug.strip('-')
-
-    if not slug:
-        slug = 'podcast'
+    slug = Podcast.slugify(name)
 
     # Add random suffix for race condition handling
     if add_random:
@@ -40,12 +35,17 @@ def generate_unique_slug(name, exclude_id=None, add_random=False):
     base_slug = slug
     counter = 1
 
-    while True:
-        query = Podcast.query.filter_by(slug=slug)
-        if exclude_id:
-            query = query.filter(Podcast.id != exclude_id)
-        if not query.first():
-            break
+    # Fetch every slug the candidates could collide with in one query, then
+    # pick the first free counter in Python
+    stmt = select(Podcast.slug).where(or_(
+        Podcast.slug == base_slug,
+        Podcast.slug.startswith(f"{base_slug}-", autoescape=True),
+    ))
+    if exclude_id:
+        stmt = stmt.where(Podcast.id != exclude_id)
+    taken = set(db.session.scalars(stmt))
+
+    while slug in taken:
         counter += 1
         slug = f"{base_slug}-{counter}"
 
@@ -56,15 +56,26 @@ def generate_unique_slug(name, exclude_id=None, add_random=False):
 @login_required
 def list_podcasts():
     """List all podcasts the user has access to."""
-    podcasts = get_user_podcasts()
-
-    podcast_roles = {}
-    for p in podcasts:
-        podcast_roles[p.id] = get_user_role(p.id)
+    # One query for the cards: each active podcast the user belongs to, with
+    # their role from the membership join and a correlated episode count
+    episode_count = select(func.count()).where(
+        EpisodeGuide.podcast_id == Podcast.id
+    ).correlate(Podcast).scalar_subquery()
+    rows = db.session.execute(
+        select(Podcast, PodcastMember.role, episode_count)
+        .join(PodcastMember, PodcastMember.podcast_id == Podcast.id)
+        .where(PodcastMember.user_id == current_user.id, Podcast.is_active == True)
+        .order_by(Podcast.name)
+    ).all()
+
+    podcasts = [podcast for podcast, _, _ in rows]
+    podcast_roles = {podcast.id: role for podcast, role, _ in rows}
+    episode_counts = {podcast.id: count for podcast, _, count in rows}
 
     return render_template('podcasts/list.html',
         podcasts=podcasts,
         podcast_roles=podcast_roles,
+        episode_counts=episode_counts,
     )
 
 
@@ -80,41 +91,43 @@ def new_podcast():
             website_url = form.optional('website_url')
             rss_feed_url = form.optional('rss_feed_url')
 
-            # Retry with random suffix on slug collision (race condition handling)
+            # Try the plain slug first: when it is free the INSERT is the
+            # only round-trip. On a collision, fall back to the next free
+            # counter, then to a random suffix if another request races us.
+            podcast_id = None
             max_retries = 3
             for attempt in range(max_retries):
-                try:
-                    slug = generate_unique_slug(name, add_random=(attempt > 0))
-
-                    podcast = Podcast(
-                        name=name,
-                        slug=slug,
-                        description=description,
-                        website_url=website_url,
-                        rss_feed_url=rss_feed_url,
-                        created_by=current_user.id,
-                        is_active=True,
-                    )
-                    db.session.add(podcast)
-                    db.session.flush()
-
-                    member = PodcastMember(
-                        podcast_id=podcast.id,
-                        user_id=current_user.id,
-                        role='admin',
-                        added_by=current_user.id,
-                    )
-                    db.session.add(member)
-                    db.session.commit()
-
-                    flash(f'Podcast "{podcast.name}" created.', 'success')
-                    return redirect(url_for('podcasts.view_podcast', podcast_id=podcast.id))
-
-                except IntegrityError:
-                    db.session.rollback()
-                    if attempt == max_retries - 1:
-                        raise  # Re-raise on final attempt
-                    # Continue to next attempt with random suffix
+                slug = (
+                    Podcast.slugify(name) if attempt == 0
+                    else generate_unique_slug(name, add_random=(attempt > 1))
+                )
+                podcast_id = Podcast.insert_if_slug_free(
+                    db.session.connection(),
+                    name=name,
+                    slug=slug,
+                    description=description,
+                    website_url=website_url,
+                    rss_feed_url=rss_feed_url,
+                    created_by=current_user.id,
+                    is_active=True,
+                )
+                if podcast_id:
+                    break
+
+            if not podcast_id:
+                raise ValidationError('Name', 'Could not generate a unique URL for this podcast. Please try again.')
+
+            member = PodcastMember(
+                podcast_id=podcast_id,
+                user_id=current_user.id,
+                role='admin',
+                added_by=current_user.id,
+            )
+            db.session.add(member)
+            db.session.commit()
+
+            flash(f'Podcast "{name}" created.', 'success')
+            return redirect(url_for('podcasts.view_podcast', podcast_id=podcast_id))
 
         except ValidationError as e:
             flash(f'{e.field}: {e.message}', 'error')
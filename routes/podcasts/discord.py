@@ -9,14 +9,22 @@ from models import (
     EpisodeGuide, EpisodeGuideItem, EpisodeGuideTemplate,
     DiscordIntegration, DiscordEmojiMapping, DiscordImportLog
 )
-from constants import EPISODE_GUIDE_SECTION_CHOICES, EPISODE_GUIDE_SECTION_NAMES
+from constants import EPISODE_GUIDE_SECTION_CHOICES_SET, EPISODE_GUIDE_SECTION_NAMES
 from utils.logging import log_exception
 from utils.podcast_access import require_podcast_admin
+from utils.queries import query_exists
 
 from .items import get_valid_sections_for_guide
 from . import podcast_bp
 
 
+def get_valid_sections_for_template(template):
+    """Get all valid section keys for a template (builtins + its default sections)."""
+    if not template.default_sections:
+        return EPISODE_GUIDE_SECTION_CHOICES_SET
+    return EPISODE_GUIDE_SECTION_CHOICES_SET.union(s['key'] for s in template.default_sections)
+
+
 @podcast_bp.route('/<int:podcast_id>/templates/<int:template_id>/discord', methods=['GET', 'POST'])
 @login_required
 @require_podcast_admin
@@ -167,15 +175,12 @@ def manage_emoji_mappings(podcast_id, template_id):
             if not emoji or not section_key:
                 return jsonify({'success': False, 'error': 'Emoji and section are required'}), 400
 
-            valid_sections = list(EPISODE_GUIDE_SECTION_CHOICES)
-            if template.default_sections:
-                valid_sections.extend([s['key'] for s in template.default_sections])
-            if section_key not in valid_sections:
+            if section_key not in get_valid_sections_for_template(template):
                 return jsonify({'success': False, 'error': 'Invalid section'}), 400
 
-            existing = DiscordEmojiMapping.query.filter_by(
+            existing = query_exists(DiscordEmojiMapping.query.filter_by(
                 integration_id=integration.id, emoji=emoji
-            ).first()
+            ))
             if existing:
                 return jsonify({'success': False, 'error': 'This emoji is already mapped'}), 400
 
@@ -240,11 +245,11 @@ def update_or_delete_emoji_mapping(podcast_id, template_id, mapping_id):
         if 'emoji' in data:
             new_emoji = (data['emoji'] or '').strip()
             if new_emoji and new_emoji != mapping.emoji:
-                existing = DiscordEmojiMapping.query.filter(
+                existing = query_exists(DiscordEmojiMapping.query.filter(
                     DiscordEmojiMapping.integration_id == integration.id,
                     DiscordEmojiMapping.emoji == new_emoji,
                     DiscordEmojiMapping.id != mapping_id
-                ).first()
+                ))
                 if existing:
                     return jsonify({'success': False, 'error': 'This emoji is already mapped'}), 400
                 mapping.emoji = new_emoji
@@ -255,10 +260,7 @@ def update_or_delete_emoji_mapping(podcast_id, template_id, mapping_id):
         if 'section_key' in data:
             section_key = (data['section_key'] or '').strip()
             if section_key:
-                valid_sections = list(EPISODE_GUIDE_SECTION_CHOICES)
-                if template.default_sections:
-                    valid_sections.extend([s['key'] for s in template.default_sections])
-                if section_key not in valid_sections:
+                if section_key not in get_valid_sections_for_template(template):
                     return jsonify({'success': False, 'error': 'Invalid section'}), 400
                 mapping.section_key = section_key
 
@@ -307,23 +309,21 @@ def discord_fetch_messages(podcast_id, episode_id):
         except ValueError:
             return jsonify({'success': False, 'error': 'Invalid date format. Use YYYY-MM-DD.'}), 400
     else:
-        # Auto-detect from last completed episode
-        last_episode = EpisodeGuide.query.filter(
+        # Auto-detect from last completed episode; only its date is needed
+        last_scheduled_date = db.session.query(db.func.max(EpisodeGuide.scheduled_date)).filter(
             EpisodeGuide.template_id == guide.template_id,
             EpisodeGuide.id != episode_id,
-            EpisodeGuide.status == 'completed',
-            EpisodeGuide.scheduled_date.isnot(None)
-        ).order_by(EpisodeGuide.scheduled_date.desc()).first()
+            EpisodeGuide.status == 'completed'
+        ).scalar()
 
-        if last_episode and last_episode.scheduled_date:
-            cutoff_date = last_episode.scheduled_date + timedelta(days=1)
+        if last_scheduled_date:
+            cutoff_date = last_scheduled_date + timedelta(days=1)
             after_snowflake = date_to_snowflake(cutoff_date)
-            last_episode_date = last_episode.scheduled_date.isoformat()
+            last_episode_date = last_scheduled_date.isoformat()
 
-    imported_ids = {
-        log.discord_message_id for log in
-        DiscordImportLog.query.filter_by(guide_id=episode_id).all()
-    }
+    imported_ids = set(db.session.scalars(
+        db.select(DiscordImportLog.discord_message_id).where(DiscordImportLog.guide_id == episode_id)
+    ))
 
     # Get channel list (unified approach)
     channel_ids = integration.get_scan_channel_list()
@@ -412,6 +412,26 @@ def discord_import_messages(podcast_id, episode_id):
         items_to_import = data['items']
         imported = []
 
+        # Look up which of the requested messages were already imported, and
+        # each section's last position, once up front instead of per item
+        requested_ids = [
+            item_data.get('discord_message_id') for item_data in items_to_import
+            if item_data.get('discord_message_id')
+        ]
+        already_imported = set()
+        if requested_ids:
+            already_imported = set(db.session.scalars(
+                db.select(DiscordImportLog.discord_message_id).where(
+                    DiscordImportLog.guide_id == episode_id,
+                    DiscordImportLog.discord_message_id.in_(requested_ids)
+                )
+            ))
+        max_positions = dict(db.session.execute(
+            db.select(EpisodeGuideItem.section, db.func.max(EpisodeGuideItem.position))
+            .where(EpisodeGuideItem.guide_id == episode_id)
+            .group_by(EpisodeGuideItem.section)
+        ).all())
+
         for item_data in items_to_import:
             section = item_data.get('section')
             if section not in valid_sections:
@@ -425,15 +445,13 @@ def discord_import_messages(podcast_id, episode_id):
             if not discord_message_id:
                 continue
 
-            existing = DiscordImportLog.query.filter_by(
-                guide_id=episode_id, discord_message_id=discord_message_id
-            ).first()
-            if existing:
+            if discord_message_id in already_imported:
                 continue
+            already_imported.add(discord_message_id)
 
-            max_pos = db.session.query(db.func.max(EpisodeGuideItem.position)).filter_by(
-                guide_id=episode_id, section=section
-            ).scalar() or -1
+            last_position = max_positions.get(section)
+            position = 0 if last_position is None else last_position + 1
+            max_positions[section] = position
 
             links = item_data.get('links', [])
             if isinstance(links, str):
@@ -446,7 +464,7 @@ def discord_import_messages(podcast_id, episode_id):
                 title=title[:500],
                 links=links,
                 notes=item_data.get('notes', '').strip()[:1000] or None,
-                position=max_pos + 1,
+                position=position,
             )
             db.session.add(item)
             db.session.flush()
@@ -502,9 +520,9 @@ def discord_skip_message(podcast_id, episode_id):
             return jsonify({'success': False, 'error': 'No message ID provided'}), 400
 
         # Check if already logged (imported or skipped)
-        existing = DiscordImportLog.query.filter_by(
+        existing = query_exists(DiscordImportLog.query.filter_by(
             guide_id=episode_id, discord_message_id=discord_message_id
-        ).first()
+        ))
         if existing:
             return jsonify({'success': True, 'already_skipped': True})
 
@@ -1,25 +1,32 @@
 """Episode CRUD routes: list, create, view, edit, delete, live mode."""
 from datetime import date
-from flask import render_template, request, redirect, url_for, flash, g, current_app
+from itertools import groupby
+from operator import attrgetter
+from flask import render_template, request, redirect, url_for, flash, g, current_app, make_response, abort
 from flask_login import login_required
-from sqlalchemy import or_, exists
+from sqlalchemy import or_, func, select, union_all, update, insert, literal, null, false
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import load_only, raiseload, selectinload, with_expression
 
 from extensions import db
 from models import EpisodeGuide, EpisodeGuideItem, EpisodeGuideTemplate
 from constants import (
     EPISODE_GUIDE_SECTIONS, EPISODE_GUIDE_SECTION_NAMES,
-    EPISODE_GUIDE_SECTION_PARENTS, EPISODE_GUIDE_STATUS_CHOICES,
+    EPISODE_GUIDE_SECTION_PARENTS, EPISODE_GUIDE_STATUS_CHOICES_SET,
     DEFAULT_PAGE_SIZE
 )
 from utils.validation import ValidationError
 from utils.routes import FormData
 from utils.logging import log_exception
 from utils.podcast_access import require_podcast_access, require_podcast_admin
+from utils.queries import KeysetPagination, WindowedPagination, clamp_page, parse_keyset_cursor
 
 from . import podcast_bp
 
+# Joins matching item titles in list_episodes (ASCII unit separator, which
+# real titles don't contain)
+MATCHING_TITLES_SEPARATOR = '\x1f'
+
 
 def get_sections_with_items(guide):
     """Organize guide items by section for template rendering."""
@@ -55,11 +62,28 @@ def list_episodes(podcast_id):
 
     status = request.args.get('status')
     search = request.args.get('search', '').strip()[:100]
-    page = request.args.get('page', 1, type=int)
-
-    query = EpisodeGuide.query.filter_by(podcast_id=podcast_id)
-
-    if status and status in EPISODE_GUIDE_STATUS_CHOICES:
+    page = request.args.get('page', type=int)
+
+    # The table only shows how many items each guide has, so count them in a
+    # correlated subquery instead of loading every guide's items. load_only
+    # skips the notes/poll/JSON columns the table never shows; both it and
+    # raiseload make anything else the template touches fail loudly rather
+    # than lazy-loading per row.
+    item_count = select(func.count()).where(
+        EpisodeGuideItem.guide_id == EpisodeGuide.id
+    ).correlate(EpisodeGuide).scalar_subquery()
+    query = EpisodeGuide.query.options(
+        load_only(
+            EpisodeGuide.id, EpisodeGuide.title, EpisodeGuide.episode_number,
+            EpisodeGuide.scheduled_date, EpisodeGuide.status,
+            EpisodeGuide.total_duration_seconds, EpisodeGuide.created_at,
+            raiseload=True
+        ),
+        with_expression(EpisodeGuide.item_count, item_count),
+        raiseload('*')
+    ).filter_by(podcast_id=podcast_id)
+
+    if status and status in EPISODE_GUIDE_STATUS_CHOICES_SET:
         query = query.filter_by(status=status)
 
     if search:
@@ -70,52 +94,79 @@ def list_episodes(podcast_id):
             EpisodeGuide.previous_poll.ilike(search_term),
             EpisodeGuide.new_poll.ilike(search_term),
         )
-        item_exists = exists().where(
-            EpisodeGuideItem.guide_id == EpisodeGuide.id,
-            or_(
-                EpisodeGuideItem.title.ilike(search_term),
-                EpisodeGuideItem.link.ilike(search_term),
-                EpisodeGuideItem.links.cast(db.String).ilike(search_term),
-                EpisodeGuideItem.notes.ilike(search_term),
-            )
+        item_conditions = or_(
+            EpisodeGuideItem.title.ilike(search_term),
+            EpisodeGuideItem.link.ilike(search_term),
+            EpisodeGuideItem.links.cast(db.String).ilike(search_term),
+            EpisodeGuideItem.notes.ilike(search_term),
         )
-        query = query.filter(or_(guide_conditions, item_exists))
-
-    pagination = query.order_by(EpisodeGuide.created_at.desc()).paginate(
-        page=page, per_page=DEFAULT_PAGE_SIZE, error_out=False
-    )
+        # Guides matching on their own columns and guides with a matching
+        # item are found by separate branches, each able to use its table's
+        # trigram indexes, instead of one OR spanning a correlated EXISTS
+        matching_guide_ids = union_all(
+            select(EpisodeGuide.id).where(
+                EpisodeGuide.podcast_id == podcast_id, guide_conditions
+            ),
+            select(EpisodeGuideItem.guide_id).where(item_conditions),
+        )
+        # The matching item titles ride along on the page SELECT as one
+        # aggregated string per guide, rather than a second query afterwards
+        matching_titles = select(
+            func.aggregate_strings(EpisodeGuideItem.title, MATCHING_TITLES_SEPARATOR)
+        ).where(
+            EpisodeGuideItem.guide_id == EpisodeGuide.id, item_conditions
+        ).correlate(EpisodeGuide).scalar_subquery()
+        query = query.options(
+            with_expression(EpisodeGuide.matching_item_titles, matching_titles)
+        ).filter(EpisodeGuide.id.in_(matching_guide_ids))
+
+    stats_columns = EpisodeGuide.stats_columns(podcast_id)
+
+    if page:
+        # Deprecated page-number links (?page=N) keep working; the total comes
+        # back on the page rows via COUNT(*) OVER (). The podcast's unfiltered
+        # total bounds the last page, so out-of-range pages are clamped up front.
+        stats = dict(db.session.execute(select(*stats_columns)).one()._mapping)
+        pagination = WindowedPagination(
+            query=query.order_by(EpisodeGuide.created_at.desc(), EpisodeGuide.id.desc()),
+            page=clamp_page(page, stats['total']), per_page=DEFAULT_PAGE_SIZE, error_out=False
+        )
+    else:
+        # Seek past the (created_at, id) cursor so deep pages cost the same;
+        # the status counts ride along on the page SELECT
+        pagination = KeysetPagination(
+            query, EpisodeGuide.created_at, EpisodeGuide.id,
+            after=parse_keyset_cursor(request.args),
+            before=parse_keyset_cursor(request.args, 'before'),
+            per_page=DEFAULT_PAGE_SIZE,
+            extra_columns=stats_columns,
+        )
+        stats = pagination.extras
 
     matching_items = {}
     if search:
-        search_term = f"%{search}%"
-        guide_ids = [g.id for g in pagination.items]
-        if guide_ids:
-            items = EpisodeGuideItem.query.filter(
-                EpisodeGuideItem.guide_id.in_(guide_ids),
-                or_(
-                    EpisodeGuideItem.title.ilike(search_term),
-                    EpisodeGuideItem.link.ilike(search_term),
-                    EpisodeGuideItem.links.cast(db.String).ilike(search_term),
-                    EpisodeGuideItem.notes.ilike(search_term),
-                )
-            ).all()
-            for item in items:
-                matching_items.setdefault(item.guide_id, []).append(item)
-
-    total = podcast.episodes.count()
-    drafts = podcast.episodes.filter_by(status='draft').count()
-    completed = podcast.episodes.filter_by(status='completed').count()
-    stats = {'total': total, 'drafts': drafts, 'completed': completed}
+        matching_items = {
+            guide.id: guide.matching_item_titles.split(MATCHING_TITLES_SEPARATOR)
+            for guide in pagination.items if guide.matching_item_titles
+        }
 
     if request.args.get('ajax') == '1':
-        return render_template('podcasts/episodes/_table.html',
+        response = make_response(render_template('podcasts/episodes/_table.html',
             podcast=podcast,
             guides=pagination.items,
             search=search,
             matching_items=matching_items,
             stats=stats,
             user_role=g.user_podcast_role,
-        )
+        ))
+        # Repeated identical searches (retyping, toggling a filter back) are
+        # answered from the browser cache instead of re-running the ILIKE
+        # scan; private keeps shared proxies from storing member-only pages
+        cache_seconds = current_app.config.get('EPISODE_SEARCH_CACHE_SECONDS', 0)
+        if search and cache_seconds > 0:
+            response.cache_control.private = True
+            response.cache_control.max_age = cache_seconds
+        return response
 
     today = date.today()
     upcoming_episode = podcast.episodes.filter(
@@ -130,10 +181,11 @@ def list_episodes(podcast_id):
         items = EpisodeGuideItem.query.filter_by(guide_id=upcoming_episode.id).order_by(
             EpisodeGuideItem.section, EpisodeGuideItem.position
         ).all()
-        for item in items:
-            if item.section not in upcoming_items_by_section:
-                upcoming_items_by_section[item.section] = []
-            upcoming_items_by_section[item.section].append(item)
+        # Rows arrive ordered by section, so each section is one run
+        upcoming_items_by_section = {
+            section: list(section_items)
+            for section, section_items in groupby(items, key=attrgetter('section'))
+        }
 
     return render_template('podcasts/episodes/list.html',
         podcast=podcast,
@@ -157,13 +209,6 @@ def new_episode(podcast_id):
     """Create a new episode for a podcast."""
     podcast = g.podcast
 
-    templates = EpisodeGuideTemplate.query.filter_by(
-        podcast_id=podcast_id
-    ).order_by(
-        EpisodeGuideTemplate.is_default.desc(),
-        EpisodeGuideTemplate.name
-    ).all()
-
     if request.method == 'POST':
         try:
             form = FormData(request.form)
@@ -172,13 +217,15 @@ def new_episode(podcast_id):
             previous_poll = None
             previous_poll_link = None
             if episode_number:
-                prev_guide = EpisodeGuide.query.filter(
-                    EpisodeGuide.podcast_id == podcast_id,
-                    EpisodeGuide.episode_number == episode_number - 1
+                # Only the poll carries over, so skip hydrating the whole guide
+                prev_poll = db.session.execute(
+                    select(EpisodeGuide.new_poll, EpisodeGuide.new_poll_link).where(
+                        EpisodeGuide.podcast_id == podcast_id,
+                        EpisodeGuide.episode_number == episode_number - 1
+                    ).limit(1)
                 ).first()
-                if prev_guide and prev_guide.new_poll:
-                    previous_poll = prev_guide.new_poll
-                    previous_poll_link = prev_guide.new_poll_link
+                if prev_poll and prev_poll.new_poll:
+                    previous_poll, previous_poll_link = prev_poll
 
             template_id = form.integer('template_id')
             template = None
@@ -219,6 +266,18 @@ def new_episode(podcast_id):
             log_exception(current_app.logger, 'Create episode', e)
             flash('Database error occurred. Please try again.', 'error')
 
+    # The picker only needs id/name/is_default, not the templates' JSON content
+    templates = db.session.execute(
+        select(
+            EpisodeGuideTemplate.id, EpisodeGuideTemplate.name, EpisodeGuideTemplate.is_default
+        ).where(
+            EpisodeGuideTemplate.podcast_id == podcast_id
+        ).order_by(
+            EpisodeGuideTemplate.is_default.desc(),
+            EpisodeGuideTemplate.name
+        )
+    ).all()
+
     return render_template('podcasts/episodes/form.html',
         podcast=podcast,
         guide=None,
@@ -234,7 +293,7 @@ def view_episode(podcast_id, episode_id):
     """View a completed episode guide with timestamps."""
     podcast = g.podcast
     guide = EpisodeGuide.query.options(
-        joinedload(EpisodeGuide.items)
+        selectinload(EpisodeGuide.items)
     ).filter_by(id=episode_id, podcast_id=podcast_id).first_or_404()
 
     sections = get_sections_with_items(guide)
@@ -255,9 +314,12 @@ def view_episode(podcast_id, episode_id):
 def edit_episode(podcast_id, episode_id):
     """Edit episode guide metadata and items."""
     podcast = g.podcast
-    guide = EpisodeGuide.query.options(
-        joinedload(EpisodeGuide.items)
-    ).filter_by(id=episode_id, podcast_id=podcast_id).first_or_404()
+    # A POST only writes scalar metadata and redirects on success, so the
+    # items are only loaded up front for the form (re-renders lazy-load them)
+    options = [] if request.method == 'POST' else [selectinload(EpisodeGuide.items)]
+    guide = EpisodeGuide.query.options(*options).filter_by(
+        id=episode_id, podcast_id=podcast_id
+    ).first_or_404()
 
     if request.method == 'POST':
         try:
@@ -330,7 +392,7 @@ def live_episode(podcast_id, episode_id):
     """Live recording mode for an episode."""
     podcast = g.podcast
     guide = EpisodeGuide.query.options(
-        joinedload(EpisodeGuide.items)
+        selectinload(EpisodeGuide.items)
     ).filter_by(id=episode_id, podcast_id=podcast_id).first_or_404()
 
     sections = get_sections_with_items(guide)
@@ -355,11 +417,12 @@ def live_episode(podcast_id, episode_id):
 @require_podcast_access
 def copy_episode(podcast_id, episode_id):
     """Create new episode by copying items from an existing episode."""
-    source = EpisodeGuide.query.options(
-        joinedload(EpisodeGuide.items)
-    ).filter_by(
+    # Only the copied columns, as a plain row rather than an ORM instance
+    source = EpisodeGuide.query.filter_by(
         id=episode_id,
         podcast_id=podcast_id
+    ).with_entities(
+        EpisodeGuide.id, EpisodeGuide.title, EpisodeGuide.episode_number, EpisodeGuide.template_id
     ).first_or_404()
 
     try:
@@ -373,18 +436,27 @@ def copy_episode(podcast_id, episode_id):
         db.session.add(guide)
         db.session.flush()
 
-        for item in source.items:
-            new_item = EpisodeGuideItem(
-                guide_id=guide.id,
-                section=item.section,
-                title=item.title,
-                links=item.all_links.copy() if item.all_links else None,
-                notes=item.notes,
-                position=item.position,
-                timestamp_seconds=None,
-                discussed=False,
+        # Copy the items with one INSERT ... SELECT instead of loading them.
+        # Legacy single links come along as-is, so all_links reads the same.
+        db.session.execute(
+            insert(EpisodeGuideItem).from_select(
+                ['guide_id', 'section', 'title', 'link', 'links', 'notes', 'position',
+                 'timestamp_seconds', 'discussed'],
+                select(
+                    literal(guide.id),
+                    EpisodeGuideItem.section,
+                    EpisodeGuideItem.title,
+                    EpisodeGuideItem.link,
+                    EpisodeGuideItem.links,
+                    EpisodeGuideItem.notes,
+                    EpisodeGuideItem.position,
+                    null(),
+                    false(),
+                ).where(
+                    EpisodeGuideItem.guide_id == source.id
+                ).order_by(EpisodeGuideItem.section, EpisodeGuideItem.position)
             )
-            db.session.add(new_item)
+        )
 
         db.session.commit()
         flash(f'Episode copied as "{guide.title}".', 'success')
@@ -402,15 +474,20 @@ def copy_episode(podcast_id, episode_id):
 @require_podcast_access
 def reopen_episode(podcast_id, episode_id):
     """Reopen a completed episode guide as a draft for further editing."""
-    guide = EpisodeGuide.query.filter_by(
-        id=episode_id,
-        podcast_id=podcast_id
-    ).first_or_404()
-
     try:
-        guide.status = 'draft'
+        # UPDATE ... RETURNING the title for the flash, without loading the guide
+        title = db.session.execute(
+            update(EpisodeGuide)
+            .where(EpisodeGuide.id == episode_id, EpisodeGuide.podcast_id == podcast_id)
+            .values(status='draft')
+            .returning(EpisodeGuide.title)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if title is None:
+            abort(404)
+
         db.session.commit()
-        flash(f'Episode "{guide.title}" reopened as draft.', 'success')
+        flash(f'Episode "{title}" reopened as draft.', 'success')
         return redirect(url_for('podcasts.edit_episode', podcast_id=podcast_id, episode_id=episode_id))
 
     except SQLAlchemyError as e:
@@ -1,28 +1,52 @@
 """Episode items, sections, and recording AJAX endpoints."""
 from datetime import datetime, timezone
-from flask import request, jsonify, redirect, url_for, flash, current_app
+from itertools import count
+from flask import request, jsonify, redirect, url_for, flash, current_app, abort
 from flask_login import login_required
+from sqlalchemy import and_, case, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import contains_eager
 
 from extensions import db
 from models import EpisodeGuide, EpisodeGuideItem
-from constants import EPISODE_GUIDE_SECTION_CHOICES
+from models.content import format_seconds
+from constants import EPISODE_GUIDE_SECTION_CHOICES_SET
 from utils.logging import log_exception
+from utils.routes import json_body
 from utils.podcast_access import require_podcast_access
 
 from . import podcast_bp
 
 
 def get_valid_sections_for_guide(guide):
-    """Get all valid section keys for a guide (builtins + custom)."""
-    valid = set(EPISODE_GUIDE_SECTION_CHOICES)
-    if guide.custom_sections:
-        for cs in guide.custom_sections:
-            if isinstance(cs, dict):
-                valid.add(cs['key'])
-            elif isinstance(cs, str):
-                valid.add(cs)
-    return valid
+    """Get all valid section keys for a guide (builtins + custom) as a frozenset."""
+    if not guide.custom_sections:
+        return EPISODE_GUIDE_SECTION_CHOICES_SET
+    return EPISODE_GUIDE_SECTION_CHOICES_SET.union(
+        cs['key'] if isinstance(cs, dict) else cs
+        for cs in guide.custom_sections
+        if isinstance(cs, (dict, str))
+    )
+
+
+def parse_elapsed_seconds(data):
+    """Read elapsed_seconds (default 0) as a non-negative int, or None if invalid."""
+    try:
+        seconds = int(data.get('elapsed_seconds', 0))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def get_item_or_404(podcast_id, episode_id, item_id):
+    """Load an item scoped to its guide and podcast, with item.guide, in one query."""
+    return EpisodeGuideItem.query.join(EpisodeGuideItem.guide).options(
+        contains_eager(EpisodeGuideItem.guide)
+    ).filter(
+        EpisodeGuideItem.id == item_id,
+        EpisodeGuideItem.guide_id == episode_id,
+        EpisodeGuide.podcast_id == podcast_id,
+    ).first_or_404()
 
 
 @podcast_bp.route('/<int:podcast_id>/episodes/<int:episode_id>/metadata', methods=['PUT'])
@@ -36,8 +60,8 @@ def update_episode_metadata(podcast_id, episode_id):
     ).first_or_404()
 
     try:
-        data = request.get_json()
-        if not data:
+        data = json_body()
+        if data is None:
             return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
 
         if 'title' in data:
@@ -98,7 +122,7 @@ def episode_items(podcast_id, episode_id):
 
     # POST - create new item
     try:
-        data = request.get_json()
+        data = json_body()
         if not data:
             return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
 
@@ -108,14 +132,18 @@ def episode_items(podcast_id, episode_id):
         if not title:
             return jsonify({'success': False, 'error': 'Title is required'}), 400
 
-        valid_sections = [s[0] for s in guide.get_all_sections()]
+        valid_sections = get_valid_sections_for_guide(guide)
         if section not in valid_sections:
             return jsonify({'success': False, 'error': 'Invalid section'}), 400
 
-        max_pos = db.session.query(db.func.max(EpisodeGuideItem.position)).filter_by(
-            guide_id=episode_id,
-            section=section
-        ).scalar() or 0
+        # Computed inside the INSERT, so appending costs no separate
+        # SELECT MAX round trip
+        next_position = db.select(
+            db.func.coalesce(db.func.max(EpisodeGuideItem.position), 0) + 1
+        ).where(
+            EpisodeGuideItem.guide_id == episode_id,
+            EpisodeGuideItem.section == section,
+        ).scalar_subquery()
 
         # Handle links (support both 'links' array and legacy 'link' single value)
         links = data.get('links') or []
@@ -130,7 +158,7 @@ def episode_items(podcast_id, episode_id):
             title=title,
             links=links,
             notes=(data.get('notes') or '').strip() or None,
-            position=max_pos + 1,
+            position=next_position,
         )
         db.session.add(item)
         db.session.commit()
@@ -148,15 +176,7 @@ def episode_items(podcast_id, episode_id):
 @require_podcast_access
 def episode_item(podcast_id, episode_id, item_id):
     """Update or delete an episode item."""
-    guide = EpisodeGuide.query.filter_by(
-        id=episode_id,
-        podcast_id=podcast_id
-    ).first_or_404()
-
-    item = EpisodeGuideItem.query.filter_by(
-        id=item_id,
-        guide_id=episode_id
-    ).first_or_404()
+    item = get_item_or_404(podcast_id, episode_id, item_id)
 
     if request.method == 'DELETE':
         try:
@@ -170,7 +190,9 @@ def episode_item(podcast_id, episode_id, item_id):
 
     # PUT - update item
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
 
         if 'title' in data:
             title = data['title'].strip() if data['title'] else ''
@@ -188,7 +210,7 @@ def episode_item(podcast_id, episode_id, item_id):
             item.notes = data['notes'].strip() if data['notes'] else None
 
         if 'section' in data:
-            valid_sections = [s[0] for s in guide.get_all_sections()]
+            valid_sections = get_valid_sections_for_guide(item.guide)
             if data['section'] in valid_sections:
                 item.section = data['section']
 
@@ -221,7 +243,7 @@ def toggle_recording(podcast_id, episode_id):
     ).first_or_404()
 
     try:
-        data = request.get_json()
+        data = json_body()
         if not data:
             return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
         action = data.get('action')
@@ -247,9 +269,11 @@ def toggle_recording(podcast_id, episode_id):
             guide.recording_started_at = None
             guide.recording_ended_at = None
             guide.total_duration_seconds = None
-            for item in guide.items:
-                item.timestamp_seconds = None
-                item.discussed = False
+            # One UPDATE for all items rather than loading and flushing each
+            EpisodeGuideItem.query.filter_by(guide_id=guide.id).update(
+                {EpisodeGuideItem.timestamp_seconds: None, EpisodeGuideItem.discussed: False},
+                synchronize_session=False
+            )
 
         db.session.commit()
         return jsonify({'success': True, 'guide': guide.to_dict()})
@@ -271,7 +295,9 @@ def move_item(podcast_id, episode_id):
     ).first_or_404()
 
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
         item_id = data.get('item_id')
         target_section = data.get('target_section')
         new_position = data.get('new_position', 0)
@@ -288,47 +314,48 @@ def move_item(podcast_id, episode_id):
         old_section = item.section
         old_position = item.position
 
+        position = EpisodeGuideItem.position
         if old_section != target_section:
-            # Cross-section move
-            EpisodeGuideItem.query.filter(
-                EpisodeGuideItem.guide_id == episode_id,
-                EpisodeGuideItem.section == old_section,
-                EpisodeGuideItem.position > old_position
-            ).update({EpisodeGuideItem.position: EpisodeGuideItem.position - 1}, synchronize_session=False)
-
-            EpisodeGuideItem.query.filter(
+            # Cross-section move: close the gap in the old section and open
+            # one at new_position in the target
+            shifts = [
+                (and_(EpisodeGuideItem.section == old_section, position > old_position), position - 1),
+                (and_(EpisodeGuideItem.section == target_section, position >= new_position), position + 1),
+            ]
+        else:
+            # Same section reorder: shift the items between the two slots
+            # (only one of these ranges is non-empty)
+            in_section = EpisodeGuideItem.section == old_section
+            shifts = [
+                (and_(in_section, position > old_position, position <= new_position), position - 1),
+                (and_(in_section, position >= new_position, position < old_position), position + 1),
+            ]
+
+        # The moved item and its neighbours are rewritten by one UPDATE;
+        # every CASE branch reads the pre-update values
+        moved = EpisodeGuideItem.id == item.id
+        db.session.execute(
+            update(EpisodeGuideItem)
+            .where(
                 EpisodeGuideItem.guide_id == episode_id,
-                EpisodeGuideItem.section == target_section,
-                EpisodeGuideItem.position >= new_position
-            ).update({EpisodeGuideItem.position: EpisodeGuideItem.position + 1}, synchronize_session=False)
+                or_(moved, *(condition for condition, _ in shifts)),
+            )
+            .values(
+                section=case((moved, target_section), else_=EpisodeGuideItem.section),
+                position=case((moved, new_position), *shifts, else_=position),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-            item.section = target_section
-            item.position = new_position
-        else:
-            # Same section reorder
-            if new_position > old_position:
-                EpisodeGuideItem.query.filter(
-                    EpisodeGuideItem.guide_id == episode_id,
-                    EpisodeGuideItem.section == old_section,
-                    EpisodeGuideItem.position > old_position,
-                    EpisodeGuideItem.position <= new_position
-                ).update({EpisodeGuideItem.position: EpisodeGuideItem.position - 1}, synchronize_session=False)
-            elif new_position < old_position:
-                EpisodeGuideItem.query.filter(
-                    EpisodeGuideItem.guide_id == episode_id,
-                    EpisodeGuideItem.section == old_section,
-                    EpisodeGuideItem.position >= new_position,
-                    EpisodeGuideItem.position < old_position
-                ).update({EpisodeGuideItem.position: EpisodeGuideItem.position + 1}, synchronize_session=False)
-
-            item.position = new_position
+        # The UPDATE only moved the item, so serialize it now with the new
+        # slot rather than re-SELECTing it after the commit expires it
+        item_data = {**item.to_dict(), 'section': target_section, 'position': new_position}
 
         db.session.commit()
-        db.session.refresh(item)
 
         return jsonify({
             'success': True,
-            'item': item.to_dict(),
+            'item': item_data,
             'old_section': old_section,
             'new_section': target_section
         })
@@ -350,32 +377,37 @@ def add_custom_section(podcast_id, episode_id):
     ).first_or_404()
 
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
         name = (data.get('name') or '').strip()
         if not name:
             return jsonify({'success': False, 'error': 'Section name is required'}), 400
 
         key = name.lower().replace(' ', '_').replace('-', '_')
         key = ''.join(c for c in key if c.isalnum() or c == '_')
-        base_key = key
-        counter = 1
         existing_keys = get_valid_sections_for_guide(guide)
-        while key in existing_keys:
-            key = f"{base_key}_{counter}"
-            counter += 1
+        if key in existing_keys:
+            # Take the lowest free numeric suffix, collected in one pass
+            prefix = f"{key}_"
+            used = {
+                int(k[len(prefix):]) for k in existing_keys
+                if k.startswith(prefix) and k[len(prefix):].isdigit()
+            }
+            key = f"{prefix}{next(n for n in count(1) if n not in used)}"
 
         parent = data.get('parent') or None
         color = data.get('color') or 'gray'
 
-        custom_sections = guide.custom_sections or []
         new_section = {
             'key': key,
             'name': name,
             'parent': parent,
             'color': color,
         }
-        custom_sections.append(new_section)
-        guide.custom_sections = custom_sections
+        # Assign a new list: appending to the loaded one in place isn't seen
+        # as a change to the JSON column, so it would never be saved
+        guide.custom_sections = (guide.custom_sections or []) + [new_section]
 
         db.session.commit()
 
@@ -402,7 +434,7 @@ def delete_custom_section(podcast_id, episode_id, section_key):
     ).first_or_404()
 
     try:
-        if section_key in EPISODE_GUIDE_SECTION_CHOICES:
+        if section_key in EPISODE_GUIDE_SECTION_CHOICES_SET:
             return jsonify({'success': False, 'error': 'Cannot delete built-in sections'}), 400
 
         item_count = EpisodeGuideItem.query.filter_by(guide_id=episode_id, section=section_key).count()
@@ -428,22 +460,29 @@ def delete_custom_section(podcast_id, episode_id, section_key):
 @require_podcast_access
 def start_recording(podcast_id, episode_id):
     """Start the timer / begin recording (AJAX)."""
-    guide = EpisodeGuide.query.filter_by(
-        id=episode_id,
-        podcast_id=podcast_id
-    ).first_or_404()
+    started_at = datetime.now(timezone.utc)
 
     try:
-        guide.status = 'recording'
-        guide.recording_started_at = datetime.now(timezone.utc)
-        guide.recording_ended_at = None
-        guide.total_duration_seconds = None
+        # Scoped UPDATE without loading the guide; no match means a 404
+        result = db.session.execute(
+            update(EpisodeGuide)
+            .where(EpisodeGuide.id == episode_id, EpisodeGuide.podcast_id == podcast_id)
+            .values(
+                status='recording',
+                recording_started_at=started_at,
+                recording_ended_at=None,
+                total_duration_seconds=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            abort(404)
 
         db.session.commit()
 
         return jsonify({
             'success': True,
-            'started_at': guide.recording_started_at.isoformat(),
+            'started_at': started_at.isoformat(),
         })
 
     except SQLAlchemyError as e:
@@ -457,24 +496,31 @@ def start_recording(podcast_id, episode_id):
 @require_podcast_access
 def stop_recording(podcast_id, episode_id):
     """Stop the timer / end recording (AJAX)."""
-    guide = EpisodeGuide.query.filter_by(
-        id=episode_id,
-        podcast_id=podcast_id
-    ).first_or_404()
-
     try:
-        data = request.get_json() or {}
-
-        guide.status = 'completed'
-        guide.recording_ended_at = datetime.now(timezone.utc)
-        guide.total_duration_seconds = data.get('elapsed_seconds', 0)
+        duration = parse_elapsed_seconds(json_body() or {})
+        if duration is None:
+            return jsonify({'success': False, 'error': 'Invalid elapsed time'}), 400
+
+        # Scoped UPDATE without loading the guide; no match means a 404
+        result = db.session.execute(
+            update(EpisodeGuide)
+            .where(EpisodeGuide.id == episode_id, EpisodeGuide.podcast_id == podcast_id)
+            .values(
+                status='completed',
+                recording_ended_at=datetime.now(timezone.utc),
+                total_duration_seconds=duration,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            abort(404)
 
         db.session.commit()
 
         return jsonify({
             'success': True,
-            'duration': guide.total_duration_seconds,
-            'formatted_duration': guide.formatted_duration,
+            'duration': duration,
+            'formatted_duration': format_seconds(duration),
         })
 
     except SQLAlchemyError as e:
@@ -488,25 +534,36 @@ def stop_recording(podcast_id, episode_id):
 @require_podcast_access
 def capture_timestamp(podcast_id, episode_id, item_id):
     """Capture current timestamp for an item (AJAX)."""
-    guide = EpisodeGuide.query.filter_by(
-        id=episode_id,
-        podcast_id=podcast_id
-    ).first_or_404()
-
     try:
-        item = EpisodeGuideItem.query.filter_by(id=item_id, guide_id=episode_id).first_or_404()
-        data = request.get_json() or {}
-
-        elapsed_seconds = data.get('elapsed_seconds', 0)
-        item.timestamp_seconds = int(elapsed_seconds)
-        item.discussed = True
+        timestamp_seconds = parse_elapsed_seconds(json_body() or {})
+        if timestamp_seconds is None:
+            return jsonify({'success': False, 'error': 'Invalid elapsed time'}), 400
+
+        # One UPDATE scoped to the guide and podcast replaces loading the
+        # item; no match means a 404
+        result = db.session.execute(
+            update(EpisodeGuideItem)
+            .where(
+                EpisodeGuideItem.id == item_id,
+                EpisodeGuideItem.guide_id.in_(
+                    select(EpisodeGuide.id).where(
+                        EpisodeGuide.id == episode_id,
+                        EpisodeGuide.podcast_id == podcast_id,
+                    )
+                ),
+            )
+            .values(timestamp_seconds=timestamp_seconds, discussed=True)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            abort(404)
 
         db.session.commit()
 
         return jsonify({
             'success': True,
-            'timestamp_seconds': item.timestamp_seconds,
-            'timestamp_formatted': item.formatted_timestamp,
+            'timestamp_seconds': timestamp_seconds,
+            'timestamp_formatted': format_seconds(timestamp_seconds),
         })
 
     except SQLAlchemyError as e:
@@ -526,7 +583,9 @@ def update_static_content(podcast_id, episode_id):
     ).first_or_404()
 
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'success': False, 'error': 'Invalid JSON data'}), 400
 
         if 'intro_static_content' in data:
             content = data['intro_static_content']
@@ -1,8 +1,9 @@
 """Podcast member management: list, add, change role, remove."""
 from flask import render_template, request, redirect, url_for, flash, g, current_app
 from flask_login import login_required
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only, raiseload
 
 from extensions import db
 from models import PodcastMember, User
@@ -23,17 +24,29 @@ def list_members(podcast_id):
     """List and manage podcast members (admin only)."""
     podcast = g.podcast
 
+    # 'admin' sorts before 'contributor', so admins are listed first; the
+    # (podcast_id, role, created_at) index returns rows already in order.
+    # Both joins to users only carry the name and email the table shows,
+    # not the whole (wide) user row twice per member.
     members = PodcastMember.query.filter_by(
         podcast_id=podcast_id
     ).options(
-        joinedload(PodcastMember.user),
-        joinedload(PodcastMember.adder)
+        joinedload(PodcastMember.user).load_only(User.name, User.email),
+        joinedload(PodcastMember.adder).load_only(User.name, User.email),
+        raiseload('*')
     ).order_by(PodcastMember.role, PodcastMember.created_at).all()
 
-    member_user_ids = [m.user_id for m in members]
-    available_users = User.query.filter(
+    # Correlated NOT EXISTS instead of binding every member id, so the
+    # statement is the same whatever the member count
+    is_member = exists().where(
+        PodcastMember.user_id == User.id,
+        PodcastMember.podcast_id == podcast_id
+    )
+    available_users = User.query.options(
+        load_only(User.id, User.name, User.email)
+    ).filter(
         User.is_approved == True,
-        ~User.id.in_(member_user_ids) if member_user_ids else True
+        ~is_member
     ).order_by(User.name).all()
 
     return render_template('podcasts/members.html',
@@ -56,15 +69,26 @@ def add_member(podcast_id):
         user_id = form.integer('user_id')
         role = form.choice('role', ['admin', 'contributor'], default='contributor')
 
-        user = User.query.get(user_id)
-        if not user or not user.is_approved:
+        # Validate the user and check membership in one SELECT, reading
+        # only the columns the flash message needs
+        candidate = db.session.execute(
+            select(
+                User.name,
+                User.email,
+                exists().where(
+                    PodcastMember.podcast_id == podcast_id,
+                    PodcastMember.user_id == User.id
+                ).label('is_member')
+            ).where(User.id == user_id, User.is_approved == True)
+        ).first()
+        if not candidate:
             flash('Invalid user selected.', 'error')
             return redirect(url_for('podcasts.list_members', podcast_id=podcast_id))
 
-        member = add_podcast_member(podcast_id, user_id, role)
+        member = None if candidate.is_member else add_podcast_member(podcast_id, user_id, role)
         if member:
             db.session.commit()
-            flash(f'{user.name or user.email} added as {role}.', 'success')
+            flash(f'{candidate.name or candidate.email} added as {role}.', 'success')
         else:
             flash('User is already a member.', 'error')
 
@@ -1,6 +1,7 @@
 """Episode template routes: list, create, edit, delete."""
 from flask import render_template, request, redirect, url_for, flash, g, current_app
 from flask_login import login_required, current_user
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 
 from extensions import db
@@ -65,10 +66,17 @@ def new_template(podcast_id):
             template.outro_static_content = outro_content if outro_content else None
 
             if template.is_default:
-                EpisodeGuideTemplate.query.filter(
-                    EpisodeGuideTemplate.podcast_id == podcast_id,
-                    EpisodeGuideTemplate.is_default == True
-                ).update({'is_default': False})
+                # Unset the old default in the same transaction as the INSERT;
+                # nothing in the session needs syncing with the UPDATE
+                db.session.execute(
+                    update(EpisodeGuideTemplate)
+                    .where(
+                        EpisodeGuideTemplate.podcast_id == podcast_id,
+                        EpisodeGuideTemplate.is_default.is_(True),
+                    )
+                    .values(is_default=False)
+                    .execution_options(synchronize_session=False)
+                )
 
             db.session.add(template)
             db.session.commit()
@@ -121,11 +129,18 @@ def edit_template(podcast_id, template_id):
             template.outro_static_content = outro_content if outro_content else None
 
             if template.is_default:
-                EpisodeGuideTemplate.query.filter(
-                    EpisodeGuideTemplate.podcast_id == podcast_id,
-                    EpisodeGuideTemplate.id != template.id,
-                    EpisodeGuideTemplate.is_default == True
-                ).update({'is_default': False})
+                # Only other templates' rows change, and none are loaded,
+                # so the session needs no syncing with the UPDATE
+                db.session.execute(
+                    update(EpisodeGuideTemplate)
+                    .where(
+                        EpisodeGuideTemplate.podcast_id == podcast_id,
+                        EpisodeGuideTemplate.id != template.id,
+                        EpisodeGuideTemplate.is_default.is_(True),
+                    )
+                    .values(is_default=False)
+                    .execution_options(synchronize_session=False)
+                )
 
             db.session.commit()
             flash('Template updated.', 'success')
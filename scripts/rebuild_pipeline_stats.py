@@ -0,0 +1,39 @@
+"""Recompute the pipeline stats rollup from sales_pipeline.
+
+The rollup is maintained incrementally by the app, so this is only needed
+after out-of-band writes to sales_pipeline (manual SQL, bulk imports).
+Idempotent — safe to re-run.
+
+Usage:
+    python scripts/rebuild_pipeline_stats.py [--user-id N]
+    # or
+    cd /opt/apps/infra && docker compose exec mouse-domination python scripts/rebuild_pipeline_stats.py
+"""
+import sys
+
+from app import create_app
+from extensions import db
+from models import PipelineStatsRollup
+
+
+def rebuild_pipeline_stats(user_id=None):
+    """Rebuild rollup rows for one user, or every user if user_id is None."""
+    try:
+        PipelineStatsRollup.rebuild(db.session.connection(), user_id)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f'Error rebuilding pipeline stats: {e}', file=sys.stderr)
+        raise
+
+    scope = f'user {user_id}' if user_id is not None else 'all users'
+    print(f'Done: pipeline stats rebuilt for {scope}.')
+
+
+if __name__ == '__main__':
+    app = create_app()
+    with app.app_context():
+        user_id = None
+        if '--user-id' in sys.argv:
+            user_id = int(sys.argv[sys.argv.index('--user-id') + 1])
+        rebuild_pipeline_stats(user_id)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.orm import joinedload
 from app import db
 from constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from utils.queries import query_exists
 
 T = TypeVar('T')
 
@@ -203,7 +204,7 @@ class BaseService(Generic[T]):
         for field, value in filters.items():
             if hasattr(cls.model, field):
                 query = query.filter(getattr(cls.model, field) == value)
-        return query.first() is not None
+        return query_exists(query)
 
     @classmethod
     def count(cls, **filters) -> int:
@@ -80,15 +80,15 @@ class InventoryService(BaseService[Inventory]):
     def get_stats(cls) -> dict:
         """Get inventory statistics in a single query."""
         from app import db
-        from sqlalchemy import func, case
+        from sqlalchemy import func
 
         result = db.session.query(
             func.count(Inventory.id).label('total'),
-            func.sum(case((Inventory.status == 'in_queue', 1), else_=0)).label('in_queue'),
-            func.sum(case((Inventory.status == 'reviewing', 1), else_=0)).label('reviewing'),
-            func.sum(case((Inventory.status == 'reviewed', 1), else_=0)).label('reviewed'),
-            func.sum(case((Inventory.sold == True, 1), else_=0)).label('sold'),
-            func.sum(case((Inventory.deadline != None, 1), else_=0)).label('with_deadline'),
+            func.count().filter(Inventory.status == 'in_queue').label('in_queue'),
+            func.count().filter(Inventory.status == 'reviewing').label('reviewing'),
+            func.count().filter(Inventory.status == 'reviewed').label('reviewed'),
+            func.count().filter(Inventory.sold == True).label('sold'),
+            func.count().filter(Inventory.deadline != None).label('with_deadline'),
         ).first()
 
         return {
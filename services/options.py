@@ -1,6 +1,21 @@
 """Service for managing dynamic options (built-in + custom)."""
+from sqlalchemy import event, select
+from extensions import db
 from models import CustomOption
 from constants import BUILTIN_CHOICES, OPTION_TYPE_LABELS
+from utils.queries import cached_rows, clear_dropdown_cache_on_commit
+
+
+def _choices_key(option_type: str) -> str:
+    return f'options:{option_type}'
+
+
+@event.listens_for(CustomOption, 'after_insert')
+@event.listens_for(CustomOption, 'after_update')
+@event.listens_for(CustomOption, 'after_delete')
+def _invalidate_choices(mapper, connection, target):
+    # Clear every type: an update may have moved the option between types
+    clear_dropdown_cache_on_commit(target, *(_choices_key(t) for t in OPTION_TYPE_LABELS))
 
 
 def get_choices_for_type(option_type: str) -> list[tuple[str, str]]:
@@ -12,14 +27,22 @@ def get_choices_for_type(option_type: str) -> list[tuple[str, str]]:
     Returns:
         List of (value, label) tuples for use in form dropdowns.
     """
-    # Get built-in defaults
-    defaults = BUILTIN_CHOICES.get(option_type, [])
+    def load():
+        # Get built-in defaults
+        defaults = BUILTIN_CHOICES.get(option_type, [])
 
-    # Get custom options from database
-    custom = CustomOption.query.filter_by(option_type=option_type).order_by(CustomOption.label).all()
-    custom_choices = [(opt.value, opt.label) for opt in custom]
+        # Get custom options from database (just the two columns, no instances)
+        custom = db.session.execute(
+            select(CustomOption.value, CustomOption.label)
+            .where(CustomOption.option_type == option_type)
+            .order_by(CustomOption.label)
+        ).all()
+        return tuple(defaults) + tuple((value, label) for value, label in custom)
 
-    return defaults + custom_choices
+    # Cached per process for display only (cleared after commits that change
+    # custom options, TTL-bound for other workers); copy so callers can't
+    # mutate the shared tuple
+    return list(cached_rows(_choices_key(option_type), load))
 
 
 def get_all_custom_options() -> dict[str, list[CustomOption]]:
@@ -58,16 +81,11 @@ def get_label_for_value(option_type: str, value: str) -> str:
     Returns:
         The display label, or the value itself if not found.
     """
-    # Check built-in choices first
-    for v, label in BUILTIN_CHOICES.get(option_type, []):
+    # Built-in and custom choices (cached)
+    for v, label in get_choices_for_type(option_type):
         if v == value:
             return label
 
-    # Check custom options
-    custom = CustomOption.query.filter_by(option_type=option_type, value=value).first()
-    if custom:
-        return custom.label
-
     # Fallback to the value itself (titlecased)
     return value.replace('_', ' ').title()
 
@@ -82,23 +100,27 @@ def is_valid_option(option_type: str, value: str) -> bool:
     Returns:
         True if valid (exists in built-in or custom), False otherwise.
     """
-    # Check built-in
-    for v, _ in BUILTIN_CHOICES.get(option_type, []):
-        if v == value:
-            return True
-
-    # Check custom
-    return CustomOption.query.filter_by(option_type=option_type, value=value).first() is not None
+    if any(v == value for v, _ in BUILTIN_CHOICES.get(option_type, [])):
+        return True
+    return db.session.execute(
+        select(CustomOption.id)
+        .where(CustomOption.option_type == option_type, CustomOption.value == value)
+        .limit(1)
+    ).first() is not None
 
 
-def get_valid_values_for_type(option_type: str) -> list[str]:
-    """Get list of valid values (not tuples) for validation.
+def get_valid_values_for_type(option_type: str) -> frozenset[str]:
+    """Get the set of valid values (not tuples) for validation.
 
     Args:
         option_type: One of the keys in BUILTIN_CHOICES
 
     Returns:
-        List of valid value strings for use in form validation.
+        Frozenset of valid value strings for O(1) membership checks in form
+        validation. Read from the database rather than the choices cache, so
+        an option another worker just added is never rejected.
     """
-    choices = get_choices_for_type(option_type)
-    return [value for value, _ in choices]
+    custom = db.session.execute(
+        select(CustomOption.value).where(CustomOption.option_type == option_type)
+    ).scalars()
+    return frozenset(v for v, _ in BUILTIN_CHOICES.get(option_type, [])).union(custom)
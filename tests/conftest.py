@@ -1,5 +1,7 @@
 import pytest
 import re
+from contextlib import contextmanager
+from sqlalchemy import event
 from flask_login import login_user
 from app import create_app, db
 from models import User, EpisodeGuide, EpisodeGuideItem
@@ -23,6 +25,25 @@ def app():
         db.drop_all()
 
 
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting the SQL statements executed inside it."""
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+    return counter
+
+
 @pytest.fixture
 def test_user(app):
     """Create an approved test user."""
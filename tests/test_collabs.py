@@ -128,6 +128,15 @@ class TestListCollabs:
         response = auth_client.get('/collabs/')
         assert response.status_code == 200
 
+    def test_stats_use_filter_aggregates(self, auth_client, collab, count_queries):
+        """Test status counts are COUNT(*) FILTER aggregates, not SUM(CASE ...)."""
+        with count_queries() as statements:
+            response = auth_client.get('/collabs/')
+        assert response.status_code == 200
+        stats_sql = next(s for s in statements if 'AS need_follow_up' in s)
+        assert 'FILTER (WHERE' in stats_sql
+        assert 'CASE' not in stats_sql
+
     def test_invalid_filter_ignored(self, auth_client, collab):
         """Test invalid filter values are ignored."""
         response = auth_client.get('/collabs/?type=invalid_type&status=invalid_status')
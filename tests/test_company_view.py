@@ -38,6 +38,22 @@ class TestCompanyViewRoute:
         assert b'Bob Reviewer' in response.data
         assert b'Contacts (2)' in response.data
 
+    def test_view_company_loads_contacts_separately(self, auth_client, app, company, count_queries):
+        """Contacts come from an IN query, not a JOIN repeating the company row."""
+        with app.app_context():
+            db.session.add_all([
+                Contact(name=f'Rep {i}', company_id=company['id']) for i in range(3)
+            ])
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/companies/{company["id"]}')
+        assert response.status_code == 200
+        company_selects = [s for s in statements if 'FROM companies' in s]
+        assert company_selects
+        assert not any('JOIN contacts' in s for s in company_selects)
+        assert any('FROM contacts' in s and ' IN (' in s for s in statements)
+
     def test_view_company_does_not_show_other_contacts(self, auth_client, app, company):
         """Contacts from other companies do not appear."""
         with app.app_context():
@@ -476,6 +476,15 @@ class TestSnippetListRoute:
         response = auth_client.get('/atomizer/?status=draft')
         assert response.status_code == 200
 
+    def test_list_stats_use_filter_aggregates(self, auth_client, multiple_snippets, count_queries):
+        """Test the stats query counts each status with FILTER aggregates."""
+        with count_queries() as statements:
+            response = auth_client.get('/atomizer/')
+        assert response.status_code == 200
+        stats_sql = next(s for s in statements if 'AS drafts' in s)
+        assert 'FILTER (WHERE' in stats_sql
+        assert 'CAST' not in stats_sql
+
     def test_list_pagination(self, auth_client, multiple_snippets):
         """Test pagination works."""
         response = auth_client.get('/atomizer/?page=1')
@@ -499,6 +508,22 @@ class TestSnippetGenerateRoute:
         assert response.status_code == 200
         assert b'platform' in response.data.lower()
 
+    def test_generate_form_dropdowns_select_only_shown_columns(self, auth_client, app, test_user, count_queries):
+        """Test dropdown options are loaded as plain rows, not whole models."""
+        with app.app_context():
+            db.session.add(ContentAtomicTemplate(
+                user_id=test_user['id'], name='Launch Thread', platform='twitter',
+                prompt_template='{content}', is_active=True
+            ))
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get('/atomizer/generate')
+        assert response.status_code == 200
+        assert b'Launch Thread (twitter)' in response.data
+        template_sql = next(s for s in statements if 'FROM content_atomic_templates' in s)
+        assert 'prompt_template' not in template_sql
+
 
 # ============== Snippet Edit Route Tests ==============
 
@@ -256,6 +256,32 @@ class TestDiscordIntegrationRoutes:
         assert data['success'] is True
         assert data['integration']['scan_emoji'] == '🐭'
 
+    def test_emoji_mapping_accepts_template_sections(self, auth_client, test_user):
+        """Test emoji mappings may target builtin or template-defined sections only."""
+        podcast = create_podcast_with_user(test_user, 'test-podcast-routes-6')
+
+        template = EpisodeGuideTemplate(
+            podcast_id=podcast.id,
+            name='Test Template',
+            default_sections=[{'key': 'listener_mail', 'name': 'Listener Mail'}]
+        )
+        db.session.add(template)
+        db.session.flush()
+        db.session.add(DiscordIntegration(
+            template_id=template.id,
+            name='Test Discord',
+            guild_id='123456789',
+            channel_id='111222333'
+        ))
+        db.session.commit()
+
+        url = f'/podcasts/{podcast.id}/templates/{template.id}/discord/emoji-mappings'
+        for emoji, section_key, status in (('📬', 'listener_mail', 200),
+                                           ('🖱️', 'introduction', 200),
+                                           ('❓', 'not_a_section', 400)):
+            response = auth_client.post(url, json={'emoji': emoji, 'section_key': section_key})
+            assert response.status_code == status, section_key
+
 
 class TestDiscordFetch:
     """Test Discord message fetching."""
@@ -359,6 +385,53 @@ class TestDiscordFetch:
         assert data['success'] is True
         assert 'sections' in data  # Should include available sections for selection
 
+    @patch('services.discord.DiscordService.get_messages_multi_channel')
+    def test_fetch_starts_after_last_completed_episode(self, mock_fetch, auth_client, test_user):
+        """Test the scan cutoff comes from the latest completed episode of the template."""
+        from datetime import date
+
+        mock_fetch.return_value = {
+            'success': True, 'messages': [], 'channels_scanned': 1,
+            'total_channels': 1, 'errors': []
+        }
+
+        podcast = create_podcast_with_user(test_user, 'test-podcast-fetch-3')
+
+        template = EpisodeGuideTemplate(podcast_id=podcast.id, name='Test Template')
+        db.session.add(template)
+        db.session.flush()
+
+        db.session.add(DiscordIntegration(
+            template_id=template.id,
+            name='Test Discord',
+            guild_id='123456789',
+            channel_id='111222333',
+            scan_channel_ids='111222333',
+            scan_emoji='🐭',
+            bot_token_env_var='DISCORD_BOT_TOKEN',
+            is_active=True
+        ))
+        db.session.add_all([
+            EpisodeGuide(podcast_id=podcast.id, template_id=template.id, title='Old',
+                         status='completed', scheduled_date=date(2026, 1, 5)),
+            EpisodeGuide(podcast_id=podcast.id, template_id=template.id, title='Latest',
+                         status='completed', scheduled_date=date(2026, 1, 12)),
+            EpisodeGuide(podcast_id=podcast.id, template_id=template.id, title='Upcoming',
+                         status='draft', scheduled_date=date(2026, 1, 19)),
+        ])
+        guide = EpisodeGuide(podcast_id=podcast.id, template_id=template.id, title='Test Episode')
+        db.session.add(guide)
+        db.session.commit()
+
+        with patch.dict('os.environ', {'DISCORD_BOT_TOKEN': 'fake_token'}):
+            response = auth_client.post(
+                f'/podcasts/{podcast.id}/episodes/{guide.id}/discord/fetch',
+                json={'limit': 50}
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()['last_episode_date'] == '2026-01-12'
+
 
 class TestDiscordImport:
     """Test Discord message import."""
@@ -474,6 +547,45 @@ class TestDiscordImport:
         assert log is not None
         assert log.guide_id == guide.id
 
+    def test_import_batch_positions_and_duplicates(self, auth_client, test_user):
+        """Test a batch appends after existing items and skips repeated message ids."""
+        podcast = create_podcast_with_user(test_user, 'test-podcast-import-batch')
+
+        template = EpisodeGuideTemplate(podcast_id=podcast.id, name='Test Template')
+        db.session.add(template)
+        db.session.flush()
+
+        db.session.add(DiscordIntegration(
+            template_id=template.id,
+            name='Test Discord',
+            guild_id='123456789',
+            channel_id='111222333',
+            scan_channel_ids='111222333',
+            scan_emoji='🐭',
+            is_active=True
+        ))
+        guide = EpisodeGuide(podcast_id=podcast.id, template_id=template.id, title='Test Episode')
+        db.session.add(guide)
+        db.session.flush()
+        db.session.add(EpisodeGuideItem(guide_id=guide.id, section='news_mice', title='Existing', position=0))
+        db.session.commit()
+
+        response = auth_client.post(
+            f'/podcasts/{podcast.id}/episodes/{guide.id}/discord/import',
+            json={'items': [
+                {'discord_message_id': '901', 'title': 'First', 'section': 'news_mice'},
+                {'discord_message_id': '902', 'title': 'Second', 'section': 'news_mice'},
+                {'discord_message_id': '901', 'title': 'First again', 'section': 'news_mice'},
+            ]}
+        )
+
+        assert response.get_json()['count'] == 2
+        positions = {
+            item.title: item.position
+            for item in EpisodeGuideItem.query.filter_by(guide_id=guide.id, section='news_mice')
+        }
+        assert positions == {'Existing': 0, 'First': 1, 'Second': 2}
+
     def test_import_prevents_duplicates(self, auth_client, test_user):
         """Test that same message can't be imported twice."""
         podcast = create_podcast_with_user(test_user, 'test-podcast-import-3')
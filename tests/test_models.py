@@ -369,6 +369,25 @@ class TestAffiliateRevenueModel:
             assert revenue.company.name == 'MCHOSE'
             assert revenue in company.affiliate_revenues
 
+    def test_add_revenue_without_user_folds_into_one_entry(self, app):
+        """Test repeated add_revenue calls for a NULL user update one row instead of duplicating it."""
+        with app.app_context():
+            company = Company(name='Lamzu')
+            db.session.add(company)
+            db.session.commit()
+
+            for _ in range(2):
+                AffiliateRevenue.add_revenue(
+                    db.session.connection(), None, company.id, 2025, 3,
+                    amount=50.0, new_notes='first', appended_notes='\n+ more',
+                )
+            db.session.commit()
+
+            entry = AffiliateRevenue.query.filter_by(company_id=company.id).one()
+            assert entry.user_id is None
+            assert entry.revenue == 100.0
+            assert entry.notes == 'first\n+ more'
+
     def test_month_year_property(self, app):
         """Test month_year formatted string."""
         with app.app_context():
@@ -1,9 +1,10 @@
 """Performance tests for the Mouse Domination application."""
 import pytest
+from flask import g
 from app import create_app, db
 from config import TestConfig
 from models import Collaboration, Contact, Company
-from utils.queries import get_companies_for_dropdown, get_contacts_for_dropdown
+from utils.queries import get_companies_for_dropdown, get_contacts_for_dropdown, clear_dropdown_cache, clamp_page
 
 
 class TestQueryOptimizations:
@@ -57,6 +58,133 @@ class TestQueryOptimizations:
                 assert companies1 is companies2
                 assert len(companies1) == 3
 
+    def test_dropdown_cache_shared_across_requests(self, app):
+        """Test dropdown rows are reused across requests while the TTL holds."""
+        app.config['DROPDOWN_CACHE_TTL'] = 60
+        clear_dropdown_cache()
+        try:
+            with app.app_context():
+                db.session.add(Company(name='Cached Co'))
+                db.session.commit()
+
+                with app.test_request_context():
+                    first = get_companies_for_dropdown()
+                    # g outlives the request here (fixture app context), so reset it
+                    g.pop('_companies_dropdown')
+                    second = get_companies_for_dropdown()
+
+                assert first is second
+                assert [c.name for c in first] == ['Cached Co']
+        finally:
+            clear_dropdown_cache()
+
+    def test_dropdown_cache_invalidated_on_write(self, app):
+        """Test company/contact writes clear the cached dropdown rows."""
+        app.config['DROPDOWN_CACHE_TTL'] = 60
+        clear_dropdown_cache()
+        try:
+            with app.app_context():
+                company = Company(name='Before')
+                db.session.add(company)
+                db.session.add(Contact(name='Rep', company=company))
+                db.session.commit()
+
+                with app.test_request_context():
+                    assert [c.company_name for c in get_contacts_for_dropdown()] == ['Before']
+                    g.pop('_contacts_dropdown')
+
+                company.name = 'After'
+                db.session.commit()
+
+                with app.test_request_context():
+                    assert [c.name for c in get_companies_for_dropdown()] == ['After']
+                    assert [c.company_name for c in get_contacts_for_dropdown()] == ['After']
+        finally:
+            clear_dropdown_cache()
+
+    def test_option_choices_cached_and_invalidated(self, app, count_queries):
+        """Test option choices skip the DB when cached and refresh on writes."""
+        from models import CustomOption
+        from services.options import get_choices_for_type
+
+        app.config['DROPDOWN_CACHE_TTL'] = 60
+        clear_dropdown_cache()
+        try:
+            with app.app_context():
+                get_choices_for_type('deal_type')
+                with count_queries() as statements:
+                    get_choices_for_type('deal_type')
+                assert statements == []
+
+                db.session.add(CustomOption(option_type='deal_type', value='newsletter', label='Newsletter'))
+                db.session.commit()
+
+                assert ('newsletter', 'Newsletter') in get_choices_for_type('deal_type')
+        finally:
+            clear_dropdown_cache()
+
+    def test_option_cache_not_left_with_rolled_back_rows(self, app):
+        """Test choices cached mid-transaction are dropped when it rolls back."""
+        from models import CustomOption
+        from services.options import get_choices_for_type
+
+        app.config['DROPDOWN_CACHE_TTL'] = 60
+        clear_dropdown_cache()
+        try:
+            with app.app_context():
+                db.session.add(CustomOption(option_type='deal_type', value='ghost', label='Ghost'))
+                db.session.flush()
+                # Reloaded from the flushed, uncommitted row
+                assert ('ghost', 'Ghost') in get_choices_for_type('deal_type')
+
+                db.session.rollback()
+
+                assert ('ghost', 'Ghost') not in get_choices_for_type('deal_type')
+        finally:
+            clear_dropdown_cache()
+
+    def test_deal_type_validation_ignores_stale_cache(self, app, auth_client, company):
+        """Test a custom deal type added by another worker is accepted while the cache is stale."""
+        from sqlalchemy import insert
+        from models import CustomOption, SalesPipeline
+        from services.options import get_choices_for_type
+
+        app.config['DROPDOWN_CACHE_TTL'] = 60
+        clear_dropdown_cache()
+        try:
+            with app.app_context():
+                get_choices_for_type('deal_type')
+                # Written without ORM events, as another process would
+                db.session.execute(insert(CustomOption).values(
+                    option_type='deal_type', value='newsletter', label='Newsletter'))
+                db.session.commit()
+                assert ('newsletter', 'Newsletter') not in get_choices_for_type('deal_type')
+
+            response = auth_client.post('/pipeline/new', data={
+                'company_id': company['id'],
+                'deal_type': 'newsletter',
+            })
+
+            assert response.status_code == 302
+            with app.app_context():
+                assert SalesPipeline.query.one().deal_type == 'newsletter'
+        finally:
+            clear_dropdown_cache()
+
+    def test_pipeline_filters_reuse_compiled_statements(self, auth_client, count_queries):
+        """Test filter values are bound parameters, so every value shares one SQL string."""
+        auth_client.get('/pipeline/?status=lead')
+
+        with count_queries() as confirmed:
+            auth_client.get('/pipeline/?status=confirmed')
+        with count_queries() as negotiating:
+            auth_client.get('/pipeline/?status=negotiating')
+
+        assert confirmed
+        assert confirmed == negotiating
+        assert not any("'confirmed'" in s or "'negotiating'" in s for s in confirmed + negotiating)
+
+
 class TestConnectionPoolingConfig:
     """Test database connection pooling configuration."""
 
@@ -81,6 +209,7 @@ class TestConnectionPoolingConfig:
         assert 'pool_size' in engine_options
         assert 'pool_recycle' in engine_options
         assert 'pool_pre_ping' in engine_options
+        assert engine_options['query_cache_size'] >= 500
 
         # Clean up - reload with original settings
         monkeypatch.delenv('DATABASE_URL', raising=False)
@@ -161,3 +290,28 @@ class TestAggregatedQueries:
             html = response.data.decode('utf-8')
             # Total should be 3
             assert '3' in html
+
+
+class TestPageClamping:
+    """Test out-of-range page numbers are clamped before the OFFSET query."""
+
+    def test_clamp_page_bounds(self):
+        """Test pages clamp to 1..ceil(total / per_page)."""
+        assert clamp_page(999999, 51, per_page=25) == 3
+        assert clamp_page(0, 51, per_page=25) == 1
+        assert clamp_page(None, 0, per_page=25) == 1
+        assert clamp_page(2, 51, per_page=25) == 2
+
+    def test_huge_page_shows_last_page(self, app, auth_client, test_user):
+        """Test a crawler-style page number renders the last page instead of an empty one."""
+        with app.app_context():
+            contact = Contact(name='Clamp Contact')
+            db.session.add(contact)
+            db.session.flush()
+            db.session.add(Collaboration(contact_id=contact.id, collab_type='collab_video',
+                                         status='idea', user_id=test_user['id']))
+            db.session.commit()
+
+        response = auth_client.get('/collabs/?page=999999')
+        assert response.status_code == 200
+        assert b'Clamp Contact' in response.data
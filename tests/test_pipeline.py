@@ -1,6 +1,6 @@
 """Tests for pipeline (sales) routes."""
 import pytest
-from models import SalesPipeline, Company, Contact
+from models import SalesPipeline, PipelineStatsRollup, Company, Contact
 from extensions import db
 
 
@@ -108,6 +108,140 @@ class TestListDeals:
         response = auth_client.get('/pipeline/')
         assert response.status_code == 200
 
+    def test_list_total_and_stats_from_page_query(self, auth_client, deal):
+        """Test the windowed page query reports the total and stats."""
+        response = auth_client.get('/pipeline/')
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert '1 deals' in html
+        assert '$500' in html
+
+    def test_list_keyset_next_page(self, auth_client, app, company, test_user):
+        """Test the Next link seeks past the last row of the first page."""
+        from constants import DEFAULT_PAGE_SIZE
+        from utils.queries import KeysetPagination
+
+        with app.app_context():
+            db.session.add_all([
+                SalesPipeline(user_id=test_user['id'], company_id=company['id'],
+                              deal_type='podcast_ad', status='lead')
+                for _ in range(DEFAULT_PAGE_SIZE + 1)
+            ])
+            db.session.commit()
+
+            query = SalesPipeline.query.filter_by(user_id=test_user['id'])
+            first = KeysetPagination(query, SalesPipeline.created_at, SalesPipeline.id)
+            assert len(first.items) == DEFAULT_PAGE_SIZE
+            assert first.has_next
+            assert first.total == DEFAULT_PAGE_SIZE + 1
+
+        response = auth_client.get('/pipeline/', query_string=first.next_cursor)
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert f'{DEFAULT_PAGE_SIZE + 1} deals' in html
+        assert 'Showing 1 of' in html
+
+    def test_list_keyset_previous_page(self, auth_client, app, company, test_user):
+        """Test the Previous link seeks back to the page before the first row."""
+        from constants import DEFAULT_PAGE_SIZE
+        from utils.queries import KeysetPagination
+
+        with app.app_context():
+            db.session.add_all([
+                SalesPipeline(user_id=test_user['id'], company_id=company['id'],
+                              deal_type='podcast_ad', status='lead')
+                for _ in range(DEFAULT_PAGE_SIZE + 1)
+            ])
+            db.session.commit()
+
+            query = SalesPipeline.query.filter_by(user_id=test_user['id'])
+            first = KeysetPagination(query, SalesPipeline.created_at, SalesPipeline.id)
+            after = (first.items[-1].created_at, first.items[-1].id)
+            second = KeysetPagination(query, SalesPipeline.created_at, SalesPipeline.id, after=after)
+            assert second.has_prev
+            assert not first.has_prev
+
+            before = (second.items[0].created_at, second.items[0].id)
+            back = KeysetPagination(query, SalesPipeline.created_at, SalesPipeline.id, before=before)
+            assert [d.id for d in back.items] == [d.id for d in first.items]
+            assert back.has_next
+            assert not back.has_prev
+
+        response = auth_client.get('/pipeline/', query_string=first.next_cursor)
+        html = response.data.decode('utf-8')
+        assert 'before_id=' in html
+        assert 'Previous' in html
+
+        response = auth_client.get('/pipeline/', query_string=second.prev_cursor)
+        assert response.status_code == 200
+        assert f'Showing {DEFAULT_PAGE_SIZE} of' in response.data.decode('utf-8')
+
+    def test_list_deal_queries_do_not_scale_with_rows(self, auth_client, app, test_user, count_queries):
+        """Test a page render issues a fixed number of deal-related statements."""
+        with app.app_context():
+            for i in range(5):
+                c = Company(name=f'Sponsor {i}')
+                db.session.add(c)
+                db.session.flush()
+                rep = Contact(name=f'Rep {i}', company_id=c.id)
+                db.session.add(rep)
+                db.session.flush()
+                db.session.add(SalesPipeline(user_id=test_user['id'], company_id=c.id,
+                                             contact_id=rep.id, deal_type='podcast_ad'))
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get('/pipeline/')
+        assert response.status_code == 200
+
+        deal_statements = [s for s in statements
+                           if any(t in s for t in ('sales_pipeline', 'FROM companies', 'FROM contacts'))]
+        # Page SELECT joins company/contact and carries the total + stats
+        assert len(deal_statements) == 1
+
+    def test_list_defers_text_columns(self, auth_client, app, company, test_user, count_queries):
+        """Test the page query skips notes and only fetches a deliverables preview."""
+        with app.app_context():
+            db.session.add(SalesPipeline(user_id=test_user['id'], company_id=company['id'],
+                                         deal_type='podcast_ad', notes='Private notes',
+                                         deliverables='One 60s read ' + 'x' * 500))
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get('/pipeline/')
+        html = response.data.decode('utf-8')
+        assert 'One 60s read' in html
+        assert 'x' * 200 not in html
+        assert not any('sales_pipeline.notes' in s for s in statements)
+
+    def test_list_empty_page_stats_in_one_query(self, auth_client, deal, count_queries):
+        """Test a filter matching nothing still reads total and stats in one statement."""
+        with count_queries() as statements:
+            response = auth_client.get('/pipeline/?status=lost')
+        assert response.status_code == 200
+
+        stats_statements = [s for s in statements if 'pipeline_stats_rollup' in s]
+        # Empty page SELECT, then one SELECT for the total + stats
+        assert len(stats_statements) == 2
+        assert not any(s.lstrip().upper().startswith('SELECT COUNT') for s in statements)
+
+    def test_list_unfiltered_skips_option_lookup(self, auth_client, deal, count_queries):
+        """Test custom deal types are only read when filtering by a non-builtin type."""
+        with count_queries() as statements:
+            auth_client.get('/pipeline/')
+        assert not any('FROM custom_options' in s for s in statements)
+
+        with count_queries() as statements:
+            response = auth_client.get('/pipeline/?type=newsletter')
+        assert response.status_code == 200
+        assert any('FROM custom_options' in s for s in statements)
+
+    def test_list_invalid_cursor_ignored(self, auth_client, deal):
+        """Test a malformed cursor falls back to the first page."""
+        response = auth_client.get('/pipeline/?after_ts=garbage&after_id=1')
+        assert response.status_code == 200
+        assert '1 deals' in response.data.decode('utf-8')
+
     def test_invalid_filter_ignored(self, auth_client, deal):
         """Test invalid filter values are ignored."""
         response = auth_client.get('/pipeline/?type=invalid_type&status=invalid_status')
@@ -138,6 +272,16 @@ class TestNewDeal:
             assert deal is not None
             assert deal.deal_type == 'podcast_ad'
 
+    def test_create_deal_reads_options_once(self, auth_client, company, count_queries):
+        """Test a successful create validates deal_type without building form choices again."""
+        with count_queries() as statements:
+            response = auth_client.post('/pipeline/new', data={
+                'company_id': company['id'],
+                'deal_type': 'podcast_ad',
+            })
+        assert response.status_code == 302
+        assert len([s for s in statements if 'FROM custom_options' in s]) == 1
+
     def test_create_deal_missing_company(self, auth_client):
         """Test creating deal without company fails."""
         response = auth_client.post('/pipeline/new', data={
@@ -203,6 +347,51 @@ class TestEditDeal:
         response = auth_client.get(f'/pipeline/{deal["id"]}/edit')
         assert response.status_code == 200
 
+    def test_edit_deal_loads_only_related_names(self, auth_client, app, deal, count_queries):
+        """Test the edit form joins just the company/contact names it displays."""
+        with app.app_context():
+            db.session.expunge_all()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/pipeline/{deal["id"]}/edit')
+        assert response.status_code == 200
+        deal_sql = next(s for s in statements if 'FROM sales_pipeline' in s)
+        assert 'companies_1.name' in deal_sql
+        assert 'companies_1.website' not in deal_sql
+
+    def test_update_deal_skips_related_joins(self, auth_client, app, deal, count_queries):
+        """Test a successful edit POST loads the deal without joining company/contact."""
+        with app.app_context():
+            db.session.expunge_all()
+
+        with count_queries() as statements:
+            response = auth_client.post(f'/pipeline/{deal["id"]}/edit', data={
+                'company_id': deal['company_id'],
+                'deal_type': 'podcast_ad',
+            })
+        assert response.status_code == 302
+        deal_sql = next(s for s in statements if 'FROM sales_pipeline' in s)
+        assert 'JOIN' not in deal_sql
+
+    def test_update_deal_writes_only_changed_columns(self, auth_client, app, deal, count_queries):
+        """Test an unchanged form writes nothing, and a changed field costs one UPDATE."""
+        data = {'company_id': deal['company_id'], 'deal_type': 'podcast_ad',
+                'status': 'lead', 'rate_quoted': '500.00'}
+        auth_client.post(f'/pipeline/{deal["id"]}/edit', data=data)
+
+        with count_queries() as statements:
+            auth_client.post(f'/pipeline/{deal["id"]}/edit', data=data)
+        assert not any(s.startswith('UPDATE sales_pipeline') for s in statements)
+
+        with count_queries() as statements:
+            auth_client.post(f'/pipeline/{deal["id"]}/edit', data=dict(data, rate_quoted='600'))
+        assert len([s for s in statements if s.startswith('UPDATE sales_pipeline')]) == 1
+
+        with app.app_context():
+            updated = db.session.get(SalesPipeline, deal['id'])
+            assert float(updated.rate_quoted) == 600
+            assert (updated.status, updated.deal_type) == ('lead', 'podcast_ad')
+
     def test_edit_deal_nonexistent_404(self, auth_client):
         """Test editing non-existent deal returns 404."""
         response = auth_client.get('/pipeline/99999/edit')
@@ -308,6 +497,80 @@ class TestQuickActions:
         response = auth_client.post('/pipeline/99999/mark-paid')
         assert response.status_code == 404
 
+    def test_mark_paid_skips_select(self, auth_client, app, deal, count_queries):
+        """Test marking paid updates the deal without loading it first."""
+        with count_queries() as statements:
+            auth_client.post(f'/pipeline/{deal["id"]}/mark-paid')
+
+        deal_selects = [s for s in statements
+                        if s.lstrip().upper().startswith('SELECT') and 'FROM sales_pipeline' in s]
+        assert deal_selects == []
+
+    def test_mark_paid_completed_deal_books_revenue(self, auth_client, app, company, test_user):
+        """Test paying a completed deal creates an affiliate revenue entry."""
+        from models import AffiliateRevenue
+
+        with app.app_context():
+            d = SalesPipeline(user_id=test_user['id'], company_id=company['id'], deal_type='podcast_ad',
+                              status='completed', rate_agreed=250)
+            db.session.add(d)
+            db.session.commit()
+            deal_id = d.id
+
+        response = auth_client.post(f'/pipeline/{deal_id}/mark-paid', follow_redirects=True)
+        assert b'Revenue entry created' in response.data
+
+        with app.app_context():
+            assert AffiliateRevenue.query.filter_by(user_id=test_user['id']).one().revenue == 250
+
+    def test_mark_paid_upserts_existing_revenue(self, auth_client, app, company, test_user, count_queries):
+        """Test an existing month entry is topped up and annotated by one upsert."""
+        from datetime import date
+        from models import AffiliateRevenue
+
+        today = date.today()
+        with app.app_context():
+            db.session.add(AffiliateRevenue(user_id=test_user['id'], company_id=company['id'],
+                                            year=today.year, month=today.month, revenue=100,
+                                            notes='Affiliate sales'))
+            d = SalesPipeline(user_id=test_user['id'], company_id=company['id'], deal_type='podcast_ad',
+                              status='completed', rate_agreed=250, deliverables='Sponsor read')
+            db.session.add(d)
+            db.session.commit()
+            deal_id = d.id
+
+        with count_queries() as statements:
+            auth_client.post(f'/pipeline/{deal_id}/mark-paid')
+        revenue_statements = [s for s in statements if 'affiliate_revenue' in s]
+        assert len(revenue_statements) == 1
+        assert 'ON CONFLICT' in revenue_statements[0]
+
+        with app.app_context():
+            entry = AffiliateRevenue.query.filter_by(user_id=test_user['id']).one()
+            assert entry.revenue == 350
+            assert entry.notes == 'Affiliate sales\n+ Deal: Sponsor read'
+
+    def test_mark_paid_other_users_deal_404(self, admin_client, deal):
+        """Test marking another user's deal as paid returns 404."""
+        response = admin_client.post(f'/pipeline/{deal["id"]}/mark-paid')
+        assert response.status_code == 404
+
+    def test_mark_complete_json(self, auth_client, app, deal):
+        """Test fetch clients get the new state as JSON instead of a redirect."""
+        response = auth_client.post(f'/pipeline/{deal["id"]}/mark-complete',
+                                    headers={'Accept': 'application/json'})
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'success': True, 'id': deal['id'], 'message': 'Deal marked as completed.'
+        }
+
+    def test_mark_paid_json(self, auth_client, deal):
+        """Test mark paid returns JSON when requested."""
+        response = auth_client.post(f'/pipeline/{deal["id"]}/mark-paid',
+                                    headers={'Accept': 'application/json'})
+        assert response.status_code == 200
+        assert response.get_json()['success'] is True
+
     def test_mark_complete_redirects(self, auth_client, deal):
         """Test mark complete redirects to list."""
         response = auth_client.post(f'/pipeline/{deal["id"]}/mark-complete')
@@ -319,3 +582,197 @@ class TestQuickActions:
         response = auth_client.post(f'/pipeline/{deal["id"]}/mark-paid')
         assert response.status_code == 302
         assert '/pipeline/' in response.location
+
+
+class TestBulkActions:
+    """Tests for bulk quick actions."""
+
+    @pytest.fixture
+    def deals(self, app, company, test_user, admin_user):
+        """Two confirmed, paid deals for test_user and one for admin_user."""
+        with app.app_context():
+            mine = [
+                SalesPipeline(user_id=test_user['id'], company_id=company['id'], deal_type='podcast_ad',
+                              status='confirmed', payment_status='paid', rate_agreed=100, rate_quoted=100)
+                for _ in range(2)
+            ]
+            theirs = SalesPipeline(user_id=admin_user['id'], company_id=company['id'],
+                                   deal_type='podcast_ad', status='confirmed')
+            db.session.add_all(mine + [theirs])
+            db.session.commit()
+            return {'mine': [d.id for d in mine], 'theirs': theirs.id}
+
+    def test_bulk_mark_complete(self, auth_client, app, deals, test_user):
+        """Test selected deals are completed, rolled up and booked as revenue."""
+        from models import AffiliateRevenue
+
+        response = auth_client.post('/pipeline/bulk/mark-complete',
+                                    data={'ids': deals['mine'] + [deals['theirs']]})
+        assert response.status_code == 302
+
+        with app.app_context():
+            statuses = {d.id: d.status for d in SalesPipeline.query.all()}
+            assert all(statuses[i] == 'completed' for i in deals['mine'])
+            assert statuses[deals['theirs']] == 'confirmed'
+
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats['total_revenue'] == 200
+            assert stats['pipeline_value'] == 0
+
+            revenue = AffiliateRevenue.query.filter_by(user_id=test_user['id']).one()
+            assert revenue.revenue == 200
+
+    def test_bulk_mark_complete_skips_already_completed(self, auth_client, app, deals, test_user):
+        """Test repeating the action doesn't double-count the rollup or revenue."""
+        from models import AffiliateRevenue
+
+        auth_client.post('/pipeline/bulk/mark-complete', data={'ids': deals['mine']})
+        auth_client.post('/pipeline/bulk/mark-complete', data={'ids': deals['mine']})
+
+        with app.app_context():
+            assert PipelineStatsRollup.stats_for_user(test_user['id'])['total_revenue'] == 200
+            assert AffiliateRevenue.query.filter_by(user_id=test_user['id']).one().revenue == 200
+
+    def test_bulk_mark_paid(self, auth_client, app, company, test_user):
+        """Test selected deals are marked paid with a payment date."""
+        with app.app_context():
+            d = SalesPipeline(user_id=test_user['id'], company_id=company['id'],
+                              deal_type='podcast_ad', status='lead')
+            db.session.add(d)
+            db.session.commit()
+            deal_id = d.id
+
+        auth_client.post('/pipeline/bulk/mark-paid', data={'ids': [deal_id]})
+
+        with app.app_context():
+            updated = db.session.get(SalesPipeline, deal_id)
+            assert updated.payment_status == 'paid'
+            assert updated.payment_date is not None
+
+    def test_bulk_without_selection(self, auth_client):
+        """Test submitting with no deals selected flashes an error."""
+        response = auth_client.post('/pipeline/bulk/mark-complete', follow_redirects=True)
+        assert response.status_code == 200
+        assert b'No deals selected' in response.data
+
+
+class TestStatsRollup:
+    """Tests for the incrementally maintained pipeline stats rollup."""
+
+    def test_rollup_tracks_insert(self, app, deal, test_user):
+        """Test creating a deal increments its status bucket."""
+        with app.app_context():
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats['lead'] == 1
+            assert stats['pipeline_value'] == 500.00
+
+    def test_rollup_moves_bucket_on_status_change(self, auth_client, app, deal, test_user):
+        """Test editing a deal moves its totals to the new status."""
+        auth_client.post(f'/pipeline/{deal["id"]}/edit', data={
+            'company_id': deal['company_id'],
+            'deal_type': 'podcast_ad',
+            'status': 'completed',
+            'rate_agreed': '450.00',
+        })
+
+        with app.app_context():
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats['lead'] == 0
+            assert stats['pipeline_value'] == 0
+            assert stats['total_revenue'] == 450.00
+
+    def test_rollup_tracks_delete(self, auth_client, app, deal, test_user):
+        """Test deleting a deal removes it from the rollup."""
+        auth_client.post(f'/pipeline/{deal["id"]}/delete')
+
+        with app.app_context():
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats == {'lead': 0, 'negotiating': 0, 'total_revenue': 0, 'pipeline_value': 0}
+
+    def test_counts_by_status(self, auth_client, app, deal, test_user):
+        """Test per-status counts follow status changes."""
+        auth_client.post(f'/pipeline/{deal["id"]}/mark-complete')
+
+        with app.app_context():
+            counts = PipelineStatsRollup.counts_by_status(test_user['id'])
+            assert counts.get('completed') == 1
+            assert counts.get('lead', 0) == 0
+
+    def test_rebuild_repairs_out_of_band_writes(self, app, deal, test_user):
+        """Test rebuild recomputes a user's rollup from sales_pipeline."""
+        with app.app_context():
+            # Bypass the ORM so the listener doesn't see the change
+            db.session.execute(
+                SalesPipeline.__table__.update()
+                .where(SalesPipeline.__table__.c.id == deal['id'])
+                .values(status='negotiating')
+            )
+            assert PipelineStatsRollup.stats_for_user(test_user['id'])['lead'] == 1
+
+            PipelineStatsRollup.rebuild(db.session.connection(), test_user['id'])
+            db.session.commit()
+
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats['lead'] == 0
+            assert stats['negotiating'] == 1
+            assert stats['pipeline_value'] == 500.00
+
+    def test_rollup_is_per_user(self, app, deal, admin_user):
+        """Test other users' deals are not counted."""
+        with app.app_context():
+            stats = PipelineStatsRollup.stats_for_user(admin_user['id'])
+            assert stats['lead'] == 0
+
+    def test_rollup_moves_bucket_when_set_while_expired(self, app, deal, test_user):
+        """Test assigning an expired status still takes the deal out of its old bucket."""
+        with app.app_context():
+            d = db.session.get(SalesPipeline, deal['id'])
+            db.session.expire(d)
+            d.status = 'negotiating'
+            db.session.commit()
+
+            counts = PipelineStatsRollup.counts_by_status(test_user['id'])
+            assert counts.get('lead') == 0
+            assert counts.get('negotiating') == 1
+            assert None not in counts
+
+    def test_rollup_tracks_delete_of_expired_deal(self, app, deal, test_user):
+        """Test deleting a deal whose attributes are expired still decrements its bucket."""
+        with app.app_context():
+            d = db.session.get(SalesPipeline, deal['id'])
+            db.session.expire(d)
+            db.session.delete(d)
+            db.session.commit()
+
+            stats = PipelineStatsRollup.stats_for_user(test_user['id'])
+            assert stats['lead'] == 0
+            assert stats['pipeline_value'] == 0
+
+    def test_rollup_skips_deals_without_user(self, app, company):
+        """Test deals with no user never create rollup rows, however often they change."""
+        with app.app_context():
+            d = SalesPipeline(company_id=company['id'], deal_type='podcast_ad', status='lead')
+            db.session.add(d)
+            db.session.commit()
+            d.status = 'negotiating'
+            db.session.commit()
+            PipelineStatsRollup.rebuild(db.session.connection())
+            db.session.commit()
+
+            assert PipelineStatsRollup.query.filter_by(user_id=None).count() == 0
+
+    def test_bulk_update_without_rollup_sync_refused(self, app, deal):
+        """Test an ORM bulk UPDATE of deals must opt in after syncing the rollup."""
+        from sqlalchemy import update
+        from models.business import ROLLUP_SYNCED
+
+        with app.app_context():
+            with pytest.raises(RuntimeError):
+                db.session.execute(update(SalesPipeline).values(status='lost'))
+            db.session.rollback()
+
+            db.session.execute(
+                update(SalesPipeline).values(notes='bulk').execution_options(**{ROLLUP_SYNCED: True})
+            )
+            db.session.commit()
+            assert db.session.get(SalesPipeline, deal['id']).notes == 'bulk'
@@ -32,6 +32,19 @@ class TestPodcastEpisodeItems:
         assert data['item']['title'] == 'Test Item Title Only'
         assert data['item']['links'] == []
 
+    def test_add_item_appends_position_inside_insert(self, auth_client, podcast_episode, count_queries):
+        """Test new items go to the end of their section without a separate MAX query."""
+        url = f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}/items'
+        first = auth_client.post(url, json={'section': 'introduction', 'title': 'First'})
+        other = auth_client.post(url, json={'section': 'news_mice', 'title': 'Other'})
+        with count_queries() as statements:
+            second = auth_client.post(url, json={'section': 'introduction', 'title': 'Second'})
+
+        assert first.get_json()['item']['position'] == 1
+        assert other.get_json()['item']['position'] == 1
+        assert second.get_json()['item']['position'] == 2
+        assert not any(s.lstrip().startswith('SELECT max(') for s in statements)
+
     def test_add_item_with_empty_links_array(self, auth_client, app, podcast_episode):
         """Test adding item with explicit empty links array."""
         response = auth_client.post(
@@ -135,6 +148,145 @@ class TestPodcastEpisodeItems:
         assert data['success'] is False
         assert 'section' in data['error'].lower()
 
+    def test_update_item_loads_item_and_guide_in_one_query(self, auth_client, podcast_episode_with_items, count_queries):
+        """Test the item and its guide come back from a single joined SELECT."""
+        item_id = podcast_episode_with_items['item_ids'][0]
+        podcast_id = podcast_episode_with_items['podcast_id']
+        episode_id = podcast_episode_with_items['episode_id']
+
+        with count_queries() as statements:
+            response = auth_client.put(
+                f'/podcasts/{podcast_id}/episodes/{episode_id}/items/{item_id}',
+                json={'section': 'news_mice'},
+                content_type='application/json'
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()['item']['section'] == 'news_mice'
+        # (the post-commit refresh of the item for to_dict() is separate)
+        guide_selects = [s for s in statements
+                         if s.lstrip().startswith('SELECT') and 'FROM episode_guides' in s]
+        joined_selects = [s for s in statements if 'JOIN episode_guides' in s]
+        assert guide_selects == []
+        assert len(joined_selects) == 1
+
+    def test_update_item_wrong_episode_404(self, auth_client, podcast_episode_with_items):
+        """Test an item can't be reached through another episode's URL."""
+        item_id = podcast_episode_with_items['item_ids'][0]
+        podcast_id = podcast_episode_with_items['podcast_id']
+        episode_id = podcast_episode_with_items['episode_id']
+
+        response = auth_client.put(
+            f'/podcasts/{podcast_id}/episodes/{episode_id + 1}/items/{item_id}',
+            json={'title': 'Hijacked'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 404
+
+    def _make_sections(self, app, podcast_episode, layout):
+        """Create items from {section: [title, ...]} with positions 1..n; return {title: id}."""
+        ids = {}
+        with app.app_context():
+            for section, titles in layout.items():
+                for position, title in enumerate(titles, start=1):
+                    item = EpisodeGuideItem(guide_id=podcast_episode['id'], section=section,
+                                            title=title, position=position)
+                    db.session.add(item)
+                    db.session.flush()
+                    ids[title] = item.id
+            db.session.commit()
+        return ids
+
+    def _section_order(self, app, podcast_episode, section):
+        with app.app_context():
+            items = EpisodeGuideItem.query.filter_by(
+                guide_id=podcast_episode['id'], section=section
+            ).order_by(EpisodeGuideItem.position).all()
+            return [(i.title, i.position) for i in items]
+
+    @pytest.mark.parametrize('title, new_position, expected', [
+        ('A', 3, [('B', 1), ('C', 2), ('A', 3), ('D', 4)]),
+        ('D', 1, [('D', 1), ('A', 2), ('B', 3), ('C', 4)]),
+    ])
+    def test_move_item_within_section(self, auth_client, app, podcast_episode, count_queries,
+                                      title, new_position, expected):
+        """Test reordering within a section shifts the items in between with one UPDATE."""
+        ids = self._make_sections(app, podcast_episode, {'introduction': ['A', 'B', 'C', 'D']})
+
+        with count_queries() as statements:
+            response = auth_client.post(
+                f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}/items/move',
+                json={'item_id': ids[title], 'target_section': 'introduction', 'new_position': new_position}
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()['item']['position'] == new_position
+        assert self._section_order(app, podcast_episode, 'introduction') == expected
+        assert len([s for s in statements if s.startswith('UPDATE episode_guide_items')]) == 1
+        # The moved item isn't re-read after the UPDATE to build the response
+        update_at = next(i for i, s in enumerate(statements) if s.startswith('UPDATE episode_guide_items'))
+        assert not any(s.lstrip().startswith('SELECT') for s in statements[update_at:])
+
+    def test_move_item_across_sections(self, auth_client, app, podcast_episode, count_queries):
+        """Test a cross-section move closes the old gap and opens the new slot in one UPDATE."""
+        ids = self._make_sections(app, podcast_episode, {
+            'introduction': ['A', 'B', 'C'],
+            'news_mice': ['X', 'Y'],
+        })
+
+        with count_queries() as statements:
+            response = auth_client.post(
+                f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}/items/move',
+                json={'item_id': ids['B'], 'target_section': 'news_mice', 'new_position': 2}
+            )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert (data['old_section'], data['new_section']) == ('introduction', 'news_mice')
+        assert (data['item']['section'], data['item']['position']) == ('news_mice', 2)
+        assert self._section_order(app, podcast_episode, 'introduction') == [('A', 1), ('C', 2)]
+        assert self._section_order(app, podcast_episode, 'news_mice') == [('X', 1), ('B', 2), ('Y', 3)]
+        assert len([s for s in statements if s.startswith('UPDATE episode_guide_items')]) == 1
+
+    def test_add_custom_sections_get_unique_keys(self, auth_client, app, podcast_episode):
+        """Test custom section keys avoid builtin and earlier custom keys, and all persist."""
+        url = f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}/sections'
+        keys = [auth_client.post(url, json={'name': name}).get_json()['section']['key']
+                for name in ('Introduction', 'Listener Mail', 'Listener Mail')]
+
+        assert keys == ['introduction_1', 'listener_mail', 'listener_mail_1']
+        with app.app_context():
+            guide = db.session.get(EpisodeGuide, podcast_episode['id'])
+            assert [s['key'] for s in guide.custom_sections] == keys
+
+    def test_add_custom_section_takes_lowest_free_suffix(self, auth_client, podcast_episode):
+        """Test a colliding key gets the lowest unused suffix, filling gaps."""
+        url = f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}/sections'
+        for name in ('Mail', 'Mail 2', 'Mail 10'):
+            auth_client.post(url, json={'name': name})
+
+        keys = [auth_client.post(url, json={'name': 'Mail'}).get_json()['section']['key']
+                for _ in range(2)]
+
+        assert keys == ['mail_1', 'mail_3']
+
+    @pytest.mark.parametrize('path, method', [
+        ('items/move', 'post'),
+        ('sections', 'post'),
+        ('static-content', 'put'),
+        ('items/{item_id}', 'put'),
+    ])
+    @pytest.mark.parametrize('body', ['not json', '[1, 2]'])
+    def test_ajax_rejects_non_object_json(self, auth_client, podcast_episode_with_items, path, method, body):
+        """Test AJAX handlers answer 400 for bodies that aren't a JSON object."""
+        url = (f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+               f'/episodes/{podcast_episode_with_items["episode_id"]}/'
+               + path.format(item_id=podcast_episode_with_items['item_ids'][0]))
+        response = getattr(auth_client, method)(url, data=body, content_type='application/json')
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid JSON data'
+
     def test_delete_item(self, auth_client, app, podcast_episode_with_items):
         """Test deleting an item."""
         item_id = podcast_episode_with_items['item_ids'][0]
@@ -242,6 +394,36 @@ class TestPodcastList:
         assert b'My Podcast' in response.data
         assert b'Other Podcast' not in response.data
 
+    def test_list_podcasts_query_count_is_constant(self, auth_client, app, test_user, count_queries):
+        """Test roles and episode counts don't cost a query per podcast."""
+        def add_podcast(n):
+            with app.app_context():
+                p = Podcast(name=f'Show {n}', slug=f'show-{n}', created_by=test_user['id'])
+                db.session.add(p)
+                db.session.flush()
+                db.session.add_all([
+                    PodcastMember(podcast_id=p.id, user_id=test_user['id'], role='contributor'),
+                    EpisodeGuide(title=f'Show {n} Episode', podcast_id=p.id),
+                ])
+                db.session.commit()
+
+        add_podcast(1)
+        with count_queries() as one_podcast:
+            auth_client.get('/podcasts/')
+
+        add_podcast(2)
+        add_podcast(3)
+        with count_queries() as three_podcasts:
+            response = auth_client.get('/podcasts/')
+
+        html = response.data.decode('utf-8')
+        assert html.count('1 episodes') == 3
+        assert 'Contributor' in html
+        assert len(three_podcasts) == len(one_podcast)
+        podcast_selects = [s for s in three_podcasts if 'FROM podcasts' in s]
+        assert len(podcast_selects) == 1
+        assert 'JOIN podcast_members' in podcast_selects[0]
+
 
 class TestPodcastCreate:
     """Tests for podcast creation."""
@@ -289,6 +471,33 @@ class TestPodcastCreate:
             assert 'duplicate-name' in slugs
             assert 'duplicate-name-2' in slugs
 
+    def test_create_podcast_free_slug_skips_uniqueness_select(self, auth_client, count_queries):
+        """Test a podcast with an unused slug is created without a slug pre-check."""
+        with count_queries() as statements:
+            response = auth_client.post('/podcasts/new', data={'name': 'Fresh Show'})
+        assert response.status_code == 302
+        assert not any(s.lstrip().startswith('SELECT podcasts.slug') for s in statements)
+        assert any('ON CONFLICT' in s for s in statements)
+
+    def test_unique_slug_checks_collisions_in_one_query(self, app, test_user, count_queries):
+        """Test the first free counter is found with a single slug lookup."""
+        from routes.podcasts.core import generate_unique_slug
+
+        with app.app_context():
+            db.session.add_all([
+                Podcast(name='Mouse Talk', slug=slug, created_by=test_user['id'])
+                for slug in ('mouse-talk', 'mouse-talk-2', 'mouse-talk-3', 'mouse-talkers')
+            ])
+            db.session.commit()
+
+            with count_queries() as statements:
+                slug = generate_unique_slug('Mouse Talk')
+            assert slug == 'mouse-talk-4'
+            assert len(statements) == 1
+
+            existing = Podcast.query.filter_by(slug='mouse-talk-2').first()
+            assert generate_unique_slug('Mouse Talk', exclude_id=existing.id) == 'mouse-talk-2'
+
     def test_create_podcast_requires_name(self, auth_client):
         """Test name is required."""
         response = auth_client.post('/podcasts/new', data={
@@ -432,6 +641,48 @@ class TestMemberManagement:
         response = auth_client.get(f'/podcasts/{podcast["id"]}/members')
         assert response.status_code == 200
 
+    def test_members_list_admins_first(self, auth_client, app, podcast):
+        """Test admins are listed before contributors, even older contributors."""
+        from datetime import datetime
+
+        with app.app_context():
+            contrib = User(email='early@test.com', name='Early Contributor', is_approved=True)
+            contrib.set_password('EarlyPass123!')
+            db.session.add(contrib)
+            db.session.flush()
+            db.session.add(PodcastMember(podcast_id=podcast['id'], user_id=contrib.id,
+                                         role='contributor', created_at=datetime(2020, 1, 1)))
+            db.session.commit()
+
+        html = auth_client.get(f'/podcasts/{podcast["id"]}/members').data.decode('utf-8')
+        assert html.index('Test User') < html.index('Early Contributor')
+
+    def test_members_list_loads_only_shown_user_columns(self, auth_client, podcast, count_queries):
+        """Test the member and adder joins don't pull whole user rows."""
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/members')
+        assert response.status_code == 200
+        members_sql = next(s for s in statements if 'FROM podcast_members' in s and 'JOIN users' in s)
+        assert 'password_hash' not in members_sql
+
+    def test_available_users_exclude_members(self, auth_client, app, podcast, count_queries):
+        """Test the add-member dropdown lists only approved non-members, via NOT EXISTS."""
+        with app.app_context():
+            for email, approved in (('candidate@test.com', True), ('pending@test.com', False)):
+                user = User(email=email, is_approved=approved)
+                user.set_password('CandidatePass123!')
+                db.session.add(user)
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/members')
+        html = response.data.decode('utf-8')
+        assert 'candidate@test.com</option>' in html
+        assert 'pending@test.com' not in html
+        assert 'Test User</option>' not in html
+        users_sql = next(s for s in statements if 'NOT (EXISTS' in s)
+        assert ' IN (' not in users_sql
+
     def test_admin_can_add_member(self, auth_client, app, podcast):
         """Test admin can add a new member."""
         with app.app_context():
@@ -456,6 +707,19 @@ class TestMemberManagement:
             assert member is not None
             assert member.role == 'contributor'
 
+    def test_add_existing_member_reports_duplicate(self, auth_client, app, podcast, test_user):
+        """Test re-adding a current member is rejected without a second row."""
+        response = auth_client.post(f'/podcasts/{podcast["id"]}/members/add', data={
+            'user_id': test_user['id'],
+            'role': 'contributor'
+        }, follow_redirects=True)
+
+        assert b'already a member' in response.data
+        with app.app_context():
+            assert PodcastMember.query.filter_by(
+                podcast_id=podcast['id'], user_id=test_user['id']
+            ).count() == 1
+
     def test_add_member_invalid_user_fails(self, auth_client, podcast):
         """Test adding non-existent user fails gracefully."""
         response = auth_client.post(f'/podcasts/{podcast["id"]}/members/add', data={
@@ -582,6 +846,159 @@ class TestPodcastEpisodes:
         response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/')
         assert response.status_code == 200
 
+    def test_list_episodes_stats_single_query(self, auth_client, app, podcast, count_queries):
+        """Test the status counts ride along on the page SELECT."""
+        with app.app_context():
+            db.session.add_all([
+                EpisodeGuide(title='Draft', podcast_id=podcast['id'], status='draft'),
+                EpisodeGuide(title='Done', podcast_id=podcast['id'], status='completed'),
+            ])
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/?status=draft')
+        assert response.status_code == 200
+        count_statements = [s for s in statements if 'count(' in s.lower() and 'episode_guides' in s]
+        assert len(count_statements) == 1  # page rows + total + status counts
+        html = response.data.decode('utf-8')
+        assert 'totalCount: 2' in html
+        assert 'draftsCount: 1' in html
+        assert 'completedCount: 1' in html
+
+    def test_list_episodes_counts_items_in_page_select(self, auth_client, podcast_episode_with_items, count_queries):
+        """Test item counts come from a subquery instead of loading each guide's items."""
+        podcast_id = podcast_episode_with_items['podcast_id']
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast_id}/episodes/')
+        assert response.status_code == 200
+        assert b'2 items' in response.data
+        item_loads = [s for s in statements
+                      if 'FROM episode_guide_items' in s and 'count(' not in s.lower()]
+        assert not item_loads
+
+    def test_list_episodes_groups_upcoming_items_by_section(self, auth_client, app, podcast):
+        """Test the upcoming episode panel lists its items under each section."""
+        from datetime import date, timedelta
+        with app.app_context():
+            guide = EpisodeGuide(title='Next Week', podcast_id=podcast['id'],
+                                 scheduled_date=date.today() + timedelta(days=7))
+            db.session.add(guide)
+            db.session.flush()
+            db.session.add_all([
+                EpisodeGuideItem(guide_id=guide.id, section='news_mice', title='Mouse B', position=2),
+                EpisodeGuideItem(guide_id=guide.id, section='introduction', title='Hello', position=1),
+                EpisodeGuideItem(guide_id=guide.id, section='news_mice', title='Mouse A', position=1),
+            ])
+            db.session.commit()
+
+        response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/')
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert '(3 items)' in html
+        assert html.index('data-section="introduction"') < html.index('Hello') \
+            < html.index('data-section="news_mice"') < html.index('Mouse A') < html.index('Mouse B')
+
+    def test_list_episodes_skips_unrendered_columns(self, auth_client, podcast_episode, count_queries):
+        """Test the list SELECT leaves out notes and the JSON content columns."""
+        podcast_id = podcast_episode['podcast_id']
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast_id}/episodes/?search=Podcast')
+        assert response.status_code == 200
+        page_selects = [s for s in statements if 'episode_guides.title AS' in s]
+        assert page_selects
+        for column in ('notes', 'intro_static_content', 'custom_sections'):
+            assert f'episode_guides.{column} AS' not in page_selects[0]
+
+    def test_list_episodes_search_unions_guide_and_item_matches(self, auth_client, app, podcast, count_queries):
+        """Test search finds guides by their own columns or by an item, via UNION ALL."""
+        with app.app_context():
+            by_notes = EpisodeGuide(title='Alpha', notes='all about sensors', podcast_id=podcast['id'])
+            by_item = EpisodeGuide(title='Bravo', podcast_id=podcast['id'])
+            neither = EpisodeGuide(title='Charlie', podcast_id=podcast['id'])
+            db.session.add_all([by_notes, by_item, neither])
+            db.session.flush()
+            db.session.add_all([
+                EpisodeGuideItem(guide_id=by_item.id, section='news_mice', title='New sensor roundup'),
+                EpisodeGuideItem(guide_id=neither.id, section='news_mice', title='Mousepads'),
+            ])
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/?search=sensor')
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert 'Alpha' in html and 'Bravo' in html
+        assert 'Charlie' not in html
+        page_sql = next(s for s in statements if 'episode_guides.title AS' in s)
+        assert 'UNION ALL' in page_sql
+        assert 'EXISTS' not in page_sql
+
+    def test_list_episodes_search_matches_items_in_page_select(self, auth_client, podcast_episode_with_items, count_queries):
+        """Test matching item titles come back with the page rows, not a second query."""
+        podcast_id = podcast_episode_with_items['podcast_id']
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast_id}/episodes/?search=Item 2')
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert 'Podcast Item 2' in html
+        assert 'Podcast Item 1' not in html
+        assert len([s for s in statements if 'episode_guide_items' in s]) == 1
+
+    def test_list_episodes_search_fragment_is_privately_cacheable(self, auth_client, podcast_episode):
+        """Test AJAX search results may be reused briefly by the browser only."""
+        podcast_id = podcast_episode['podcast_id']
+        response = auth_client.get(f'/podcasts/{podcast_id}/episodes/?search=Podcast&ajax=1')
+        assert response.status_code == 200
+        assert response.cache_control.private
+        assert response.cache_control.max_age == 30
+
+        response = auth_client.get(f'/podcasts/{podcast_id}/episodes/?ajax=1')
+        assert response.cache_control.max_age is None
+
+    def test_list_episodes_keyset_pagination(self, auth_client, app, podcast):
+        """Test the Next link seeks past the last row instead of using an offset."""
+        from datetime import datetime, timedelta
+        from constants import DEFAULT_PAGE_SIZE
+
+        base = datetime(2026, 1, 1)
+        with app.app_context():
+            db.session.add_all([
+                EpisodeGuide(title=f'Episode {i:03d}', podcast_id=podcast['id'],
+                             created_at=base + timedelta(minutes=i))
+                for i in range(DEFAULT_PAGE_SIZE + 2)
+            ])
+            db.session.commit()
+
+        response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/')
+        html = response.data.decode('utf-8')
+        assert 'after_ts=' in html
+        assert 'Episode 000' not in html
+
+        cursor = (base + timedelta(minutes=2)).isoformat()
+        response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/?after_ts={cursor}&after_id=0')
+        html = response.data.decode('utf-8')
+        assert 'Episode 000' in html
+        assert 'Episode 001' in html
+        assert 'Episode 002' not in html
+
+    def test_list_episodes_total_from_window_count(self, auth_client, app, podcast, count_queries):
+        """Test legacy page links read the total from the page SELECT, with no separate COUNT."""
+        from constants import DEFAULT_PAGE_SIZE
+
+        with app.app_context():
+            db.session.add_all([
+                EpisodeGuide(title=f'Episode {i}', podcast_id=podcast['id'])
+                for i in range(DEFAULT_PAGE_SIZE + 2)
+            ])
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/?page=2')
+        assert response.status_code == 200
+        assert b'Episode 0' in response.data
+        assert any('OVER ()' in s for s in statements)
+        assert not any(s.lstrip().upper().startswith('SELECT COUNT(*) AS COUNT_1') for s in statements)
+
     def test_create_episode(self, auth_client, app, podcast):
         """Test can create episode for a podcast."""
         response = auth_client.post(f'/podcasts/{podcast["id"]}/episodes/new', data={
@@ -598,6 +1015,43 @@ class TestPodcastEpisodes:
             assert ep.podcast_id == podcast['id']
             assert ep.episode_number == 42
 
+    def test_create_episode_carries_previous_poll(self, auth_client, app, podcast):
+        """Test a new episode inherits the previous episode's new poll."""
+        with app.app_context():
+            db.session.add(EpisodeGuide(title='Ep 41', podcast_id=podcast['id'], episode_number=41,
+                                        new_poll='Best sensor?', new_poll_link='https://example.com/p'))
+            db.session.commit()
+
+        response = auth_client.post(f'/podcasts/{podcast["id"]}/episodes/new', data={
+            'title': 'Ep 42',
+            'episode_number': 42
+        })
+        assert response.status_code == 302
+
+        with app.app_context():
+            ep = EpisodeGuide.query.filter_by(title='Ep 42').first()
+            assert ep.previous_poll == 'Best sensor?'
+            assert ep.previous_poll_link == 'https://example.com/p'
+
+    def test_new_episode_form_lists_templates_without_content(self, auth_client, app, podcast, count_queries):
+        """Test the template picker selects only the columns it renders."""
+        with app.app_context():
+            db.session.add_all([
+                EpisodeGuideTemplate(name='Weekly', podcast_id=podcast['id'], is_default=True,
+                                     intro_static_content=['Welcome']),
+                EpisodeGuideTemplate(name='Special', podcast_id=podcast['id']),
+            ])
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.get(f'/podcasts/{podcast["id"]}/episodes/new')
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert 'Weekly (Default)' in html
+        assert html.index('Weekly') < html.index('Special')
+        template_sql = next(s for s in statements if 'FROM episode_guide_templates' in s)
+        assert 'intro_static_content' not in template_sql
+
     def test_view_episode(self, auth_client, podcast_episode):
         """Test can view episode."""
         response = auth_client.get(
@@ -605,6 +1059,33 @@ class TestPodcastEpisodes:
         )
         assert response.status_code == 200
 
+    def test_view_episode_loads_items_separately(self, auth_client, app, podcast_episode_with_items, count_queries):
+        """Test items load in their own IN query instead of widening the guide row."""
+        with app.app_context():
+            db.session.expunge_all()
+
+        with count_queries() as statements:
+            response = auth_client.get(
+                f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+                f'/episodes/{podcast_episode_with_items["episode_id"]}/'
+            )
+        assert response.status_code == 200
+        assert b'Podcast Item 1' in response.data
+        guide_sql = next(s for s in statements if 'FROM episode_guides' in s)
+        assert 'episode_guide_items' not in guide_sql
+        assert any('FROM episode_guide_items' in s and ' IN ' in s for s in statements)
+
+    def test_edit_episode_post_skips_items(self, auth_client, podcast_episode_with_items, count_queries):
+        """Test a successful metadata POST doesn't load the guide's items."""
+        with count_queries() as statements:
+            response = auth_client.post(
+                f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+                f'/episodes/{podcast_episode_with_items["episode_id"]}/edit',
+                data={'title': 'Renamed'}
+            )
+        assert response.status_code == 302
+        assert not any('FROM episode_guide_items' in s for s in statements)
+
     def test_edit_episode(self, auth_client, podcast_episode):
         """Test can access edit page."""
         response = auth_client.get(
@@ -628,6 +1109,38 @@ class TestPodcastEpisodes:
             ep = EpisodeGuide.query.get(ep_id)
             assert ep is None
 
+    def test_copy_episode_copies_items_in_one_insert(self, auth_client, app, podcast_episode_with_items, count_queries):
+        """Test copying an episode copies its items with INSERT ... SELECT, resetting recording state."""
+        podcast_id = podcast_episode_with_items['podcast_id']
+        episode_id = podcast_episode_with_items['episode_id']
+        with app.app_context():
+            EpisodeGuideItem.query.filter_by(guide_id=episode_id).update(
+                {'timestamp_seconds': 42, 'discussed': True}
+            )
+            db.session.add(EpisodeGuideItem(guide_id=episode_id, section='introduction',
+                                            title='Legacy', link='https://legacy.example', position=1))
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.post(f'/podcasts/{podcast_id}/episodes/{episode_id}/copy')
+
+        assert response.status_code == 302
+        item_inserts = [s for s in statements if s.startswith('INSERT INTO episode_guide_items')]
+        assert len(item_inserts) == 1 and 'SELECT' in item_inserts[0]
+        # The source is read as four columns, with no items or other guide fields
+        source_select = next(s for s in statements
+                             if s.lstrip().startswith('SELECT') and 'FROM episode_guides' in s)
+        assert 'episode_guides.status' not in source_select
+        assert not any(s.lstrip().startswith('SELECT') and 'FROM episode_guide_items' in s
+                       for s in statements)
+        with app.app_context():
+            copy = EpisodeGuide.query.filter(EpisodeGuide.id != episode_id).one()
+            items = {i.title: i for i in copy.items}
+            assert set(items) == {'Podcast Item 1', 'Podcast Item 2', 'Legacy'}
+            assert items['Podcast Item 1'].all_links == ['https://example.com']
+            assert items['Legacy'].all_links == ['https://legacy.example']
+            assert all(i.timestamp_seconds is None and not i.discussed for i in items.values())
+
     def test_cannot_access_episode_from_wrong_podcast(self, auth_client, app, podcast, test_user):
         """Test cannot access episode via wrong podcast ID."""
         with app.app_context():
@@ -694,6 +1207,25 @@ class TestPodcastTemplates:
             t = EpisodeGuideTemplate.query.get(t_id)
             assert t.name == 'Updated Template Name'
 
+    def test_default_template_moves_on_create_and_edit(self, auth_client, app, podcast):
+        """Test making a template the default unsets the previous default."""
+        url = f'/podcasts/{podcast["id"]}/templates'
+        auth_client.post(f'{url}/new', data={'name': 'First', 'is_default': 'on'})
+        auth_client.post(f'{url}/new', data={'name': 'Second', 'is_default': 'on'})
+
+        def defaults():
+            with app.app_context():
+                return [t.name for t in EpisodeGuideTemplate.query.filter_by(
+                    podcast_id=podcast['id'], is_default=True)]
+
+        assert defaults() == ['Second']
+
+        with app.app_context():
+            first_id = EpisodeGuideTemplate.query.filter_by(name='First').one().id
+        auth_client.post(f'{url}/{first_id}/edit', data={'name': 'First', 'is_default': 'on'})
+
+        assert defaults() == ['First']
+
     def test_delete_template(self, auth_client, app, podcast):
         """Test can delete template."""
         with app.app_context():
@@ -819,6 +1351,92 @@ class TestRecordingAPI:
         data = response.get_json()
         assert data['guide']['status'] == 'draft'
 
+    def test_reset_recording_clears_items_without_loading_them(self, auth_client, app, podcast_episode_with_items, count_queries):
+        """Test reset clears item timestamps and discussed flags without loading the items."""
+        podcast_id = podcast_episode_with_items['podcast_id']
+        episode_id = podcast_episode_with_items['episode_id']
+        with app.app_context():
+            EpisodeGuideItem.query.filter_by(guide_id=episode_id).update(
+                {'timestamp_seconds': 42, 'discussed': True}
+            )
+            db.session.commit()
+
+        with count_queries() as statements:
+            response = auth_client.post(
+                f'/podcasts/{podcast_id}/episodes/{episode_id}/recording',
+                json={'action': 'reset'},
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()['guide']['item_count'] == 2
+        update_at = next(i for i, s in enumerate(statements) if s.startswith('UPDATE episode_guide_items'))
+        # Items aren't loaded just to be cleared (to_dict reads them after commit)
+        assert not any('FROM episode_guide_items' in s for s in statements[:update_at])
+        with app.app_context():
+            items = EpisodeGuideItem.query.filter_by(guide_id=episode_id).all()
+            assert all(i.timestamp_seconds is None and not i.discussed for i in items)
+
+    def test_capture_timestamp_is_a_single_update(self, auth_client, app, podcast_episode_with_items, count_queries):
+        """Test capturing a timestamp updates the item without loading it or its guide."""
+        item_id = podcast_episode_with_items['item_ids'][0]
+        url = (f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+               f'/episodes/{podcast_episode_with_items["episode_id"]}/timestamp/{item_id}')
+
+        with count_queries() as statements:
+            response = auth_client.post(url, json={'elapsed_seconds': 3725})
+
+        assert response.get_json()['timestamp_formatted'] == '1:02:05'
+        assert not any(s.lstrip().startswith('SELECT') and 'FROM episode_guide_items' in s
+                       for s in statements)
+        with app.app_context():
+            item = db.session.get(EpisodeGuideItem, item_id)
+            assert item.timestamp_seconds == 3725
+            assert item.discussed is True
+
+    def test_capture_timestamp_wrong_episode_404(self, auth_client, app, podcast_episode_with_items):
+        """Test the scoped UPDATE doesn't reach an item through another episode's URL."""
+        item_id = podcast_episode_with_items['item_ids'][0]
+        response = auth_client.post(
+            f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+            f'/episodes/{podcast_episode_with_items["episode_id"] + 1}/timestamp/{item_id}',
+            json={'elapsed_seconds': 10},
+        )
+
+        assert response.status_code == 404
+        with app.app_context():
+            assert db.session.get(EpisodeGuideItem, item_id).timestamp_seconds is None
+
+    @pytest.mark.parametrize('path', ['stop', 'timestamp/{item_id}'])
+    @pytest.mark.parametrize('elapsed', ['soon', -5, None, [1]])
+    def test_invalid_elapsed_seconds_400(self, auth_client, app, podcast_episode_with_items, path, elapsed):
+        """Test bad elapsed_seconds values get a 400 instead of a server error."""
+        item_id = podcast_episode_with_items['item_ids'][0]
+        response = auth_client.post(
+            f'/podcasts/{podcast_episode_with_items["podcast_id"]}'
+            f'/episodes/{podcast_episode_with_items["episode_id"]}/' + path.format(item_id=item_id),
+            json={'elapsed_seconds': elapsed},
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid elapsed time'
+        with app.app_context():
+            assert db.session.get(EpisodeGuideItem, item_id).timestamp_seconds is None
+            assert db.session.get(EpisodeGuide, podcast_episode_with_items['episode_id']).status == 'draft'
+
+    def test_start_and_stop_endpoints(self, auth_client, app, podcast_episode):
+        """Test the start/stop endpoints update the guide and report the duration."""
+        base = f'/podcasts/{podcast_episode["podcast_id"]}/episodes/{podcast_episode["id"]}'
+
+        assert auth_client.post(f'{base}/start').get_json()['started_at']
+        response = auth_client.post(f'{base}/stop', json={'elapsed_seconds': 95})
+
+        assert response.get_json()['formatted_duration'] == '01:35'
+        with app.app_context():
+            guide = db.session.get(EpisodeGuide, podcast_episode['id'])
+            assert guide.status == 'completed'
+            assert guide.total_duration_seconds == 95
+            assert guide.recording_started_at is not None
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -89,6 +89,13 @@ class TestContactRoutes:
             assert contact.role == 'reviewer'
             assert contact.twitter == '@testperson'
 
+    def test_create_contact_skips_dropdown_query(self, auth_client, count_queries):
+        """Test a successful create redirects without loading the company dropdown."""
+        with count_queries() as statements:
+            response = auth_client.post('/contacts/new', data={'name': 'Quick Person'})
+        assert response.status_code == 302
+        assert not any('ORDER BY companies.name' in s for s in statements)
+
     def test_create_contact_with_company(self, auth_client, app):
         """Test creating a contact linked to a company."""
         with app.app_context():
@@ -157,6 +164,22 @@ class TestContactRoutes:
         assert response.status_code == 200
         assert b'Reviewer 1' in response.data
 
+    def test_lookup_contacts_prefix_search(self, auth_client, app):
+        """Test contact lookup returns prefix matches with company name."""
+        with app.app_context():
+            company = Company(name='Pulsar')
+            db.session.add(company)
+            db.session.flush()
+            db.session.add(Contact(name='Alice', company_id=company.id))
+            db.session.add(Contact(name='Bob'))
+            db.session.commit()
+
+        response = auth_client.get('/contacts/lookup?q=al')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [r['name'] for r in data['results']] == ['Alice']
+        assert data['results'][0]['company_name'] == 'Pulsar'
+
 
 class TestCompanyRoutes:
     """Tests for company routes."""
@@ -201,6 +224,17 @@ class TestCompanyRoutes:
         assert response.status_code == 200
         assert b'already exists' in response.data
 
+    def test_duplicate_company_check_uses_exists(self, auth_client, app, count_queries):
+        """Test the duplicate name check is an EXISTS probe, not a full row load."""
+        with app.app_context():
+            db.session.add(Company(name='Logitech'))
+            db.session.commit()
+
+        with count_queries() as statements:
+            auth_client.post('/companies/new', data={'name': 'Logitech', 'category': 'mice'})
+
+        assert any('EXISTS (SELECT' in s and 'FROM companies' in s for s in statements)
+
     def test_edit_company(self, auth_client, app):
         """Test editing a company."""
         with app.app_context():
@@ -238,6 +272,33 @@ class TestCompanyRoutes:
             company = db.session.get(Company, company_id)
             assert company is None
 
+    def test_lookup_companies_respects_limit(self, auth_client, app):
+        """Test company lookup filters by prefix and caps result count."""
+        with app.app_context():
+            for i in range(5):
+                db.session.add(Company(name=f'Acme {i}'))
+            db.session.add(Company(name='Zowie'))
+            db.session.commit()
+
+        response = auth_client.get('/companies/lookup?q=acme&limit=3')
+        assert response.status_code == 200
+        names = [r['name'] for r in response.get_json()['results']]
+        assert names == ['Acme 0', 'Acme 1', 'Acme 2']
+
+    def test_lookup_companies_escapes_wildcards(self, auth_client, app):
+        """Test LIKE wildcards in the search term match literally."""
+        with app.app_context():
+            db.session.add(Company(name='100% Mice'))
+            db.session.add(Company(name='1000 Keys'))
+            db.session.add(Company(name='Razer'))
+            db.session.commit()
+
+        response = auth_client.get('/companies/lookup?q=100%25')
+        assert [r['name'] for r in response.get_json()['results']] == ['100% Mice']
+
+        response = auth_client.get('/companies/lookup?q=_')
+        assert response.get_json()['results'] == []
+
 
 class TestInventoryRoutes:
     """Tests for inventory routes."""
@@ -485,12 +485,12 @@ class TestOptionsService:
             assert choices == []
 
     def test_get_valid_values_for_type(self, app):
-        """Test get_valid_values_for_type returns list of values."""
+        """Test get_valid_values_for_type returns a set of values."""
         from services.options import get_valid_values_for_type
 
         with app.app_context():
             values = get_valid_values_for_type('inventory_category')
-            assert isinstance(values, list)
+            assert isinstance(values, frozenset)
             assert 'mouse' in values
             assert 'keyboard' in values
 
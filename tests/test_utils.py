@@ -2,7 +2,7 @@
 import pytest
 from flask import Flask
 from utils.validation import (
-    ValidationError, validate_required, validate_email, validate_url,
+    ValidationError, validate_required, validate_email, validate_url, validate_choice,
     validate_foreign_key, parse_date, parse_int, parse_float, or_none
 )
 from utils.routes import FormData, handle_form_errors, get_request_id
@@ -96,6 +96,20 @@ class TestValidateUrl:
         assert result is None
 
 
+class TestValidateChoice:
+    """Tests for validate_choice function."""
+
+    def test_choice_valid(self):
+        """Test a value in the choices is returned."""
+        assert validate_choice('lead', frozenset({'lead', 'paid'}), 'status') == 'lead'
+
+    def test_choice_invalid_lists_choices_sorted(self):
+        """Test the error lists set choices in a stable order."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_choice('bogus', frozenset({'paid', 'lead', 'confirmed'}), 'status')
+        assert exc_info.value.message == 'Invalid choice. Must be one of: confirmed, lead, paid'
+
+
 class TestParseFunctions:
     """Tests for parse_date, parse_int, parse_float."""
 
@@ -254,6 +268,23 @@ class TestFormData:
             with pytest.raises(ValidationError):
                 form.foreign_key('company_id', Company)
 
+    def test_foreign_keys_single_query(self, app, company, count_queries):
+        """Test FormData.foreign_keys checks every key in one statement."""
+        with app.test_request_context():
+            form = FormData({'company_id': str(company['id']), 'contact_id': ''})
+            with count_queries() as statements:
+                result = form.foreign_keys(('company_id', Company), ('other_id', Company))
+            assert result == [company['id'], None]
+            assert len(statements) == 1
+
+    def test_foreign_keys_invalid(self, app, company):
+        """Test FormData.foreign_keys names the field that failed."""
+        with app.test_request_context():
+            form = FormData({'company_id': str(company['id']), 'other_id': '99999'})
+            with pytest.raises(ValidationError) as exc_info:
+                form.foreign_keys(('company_id', Company), ('other_id', Company))
+            assert exc_info.value.field == 'other_id'
+
     def test_to_dict(self, app):
         """Test FormData.to_dict extracts multiple fields."""
         with app.test_request_context():
@@ -351,3 +382,51 @@ class TestDbOperationDecorator:
         with app.test_request_context():
             with pytest.raises(SQLAlchemyError):
                 db_error_func()
+
+
+class TestOrjsonProvider:
+    """Tests for the orjson-backed JSON provider."""
+
+    def test_app_uses_orjson_provider(self, app):
+        """Test the app factory installs the provider."""
+        from utils.json_provider import OrjsonProvider
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_dumps_matches_default_provider(self, app):
+        """Test output round-trips like the stdlib provider's, with the same date handling."""
+        from datetime import date, datetime
+        from decimal import Decimal
+        from flask.json.provider import DefaultJSONProvider
+
+        payload = {'b': 1, 'a': [Decimal('1.50'), date(2024, 1, 2)],
+                   'when': datetime(2024, 1, 2, 3, 4, 5), 'title': 'Café'}
+        expected = DefaultJSONProvider(app).dumps(payload)
+        assert app.json.loads(app.json.dumps(payload)) == app.json.loads(expected)
+        assert app.json.dumps(payload).index('"a"') < app.json.dumps(payload).index('"b"')
+
+    def test_response_matches_default_provider(self, app):
+        """Test compact and indented responses are byte-for-byte the default provider's."""
+        from flask.json.provider import DefaultJSONProvider
+        from utils.json_provider import OrjsonProvider
+
+        payload = {'success': True, 'items': [{'id': 1, 'title': 'Mouse'}]}
+        for compact in (True, False):
+            ours, default = OrjsonProvider(app), DefaultJSONProvider(app)
+            ours.compact = default.compact = compact
+            with app.test_request_context():
+                response = ours.response(payload)
+                expected = default.response(payload)
+            assert response.mimetype == 'application/json'
+            assert response.get_data() == expected.get_data()
+
+    def test_request_json_parsed(self, app):
+        """Test request bodies are decoded and bad JSON still raises BadRequest."""
+        from werkzeug.exceptions import BadRequest
+
+        with app.test_request_context(json={'title': 'x'}):
+            from flask import request
+            assert request.get_json() == {'title': 'x'}
+        with app.test_request_context(data='{not json', content_type='application/json'):
+            from flask import request
+            with pytest.raises(BadRequest):
+                request.get_json()
@@ -203,6 +203,7 @@ def add_podcast_member(podcast_id, user_id, role='contributor', added_by=None):
     """
     from models import PodcastMember
     from extensions import db
+    from utils.queries import query_exists
 
     if role not in ('admin', 'contributor'):
         raise ValueError(f"Invalid role: {role}. Must be 'admin' or 'contributor'.")
@@ -211,10 +212,10 @@ def add_podcast_member(podcast_id, user_id, role='contributor', added_by=None):
         added_by = current_user.id
 
     # Check if already a member
-    existing = PodcastMember.query.filter_by(
+    existing = query_exists(PodcastMember.query.filter_by(
         podcast_id=podcast_id,
         user_id=user_id
-    ).first()
+    ))
 
     if existing:
         return None
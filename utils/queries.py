@@ -1,31 +1,147 @@
 """Query utilities for reducing database duplication."""
+import time
+from datetime import datetime
 from functools import lru_cache
-from flask import g
+from flask import g, current_app
+from flask_sqlalchemy.pagination import QueryPagination
+from sqlalchemy import event, func, select, tuple_
+from sqlalchemy.orm import object_session
+from extensions import db
 from models import Company, Contact
+from constants import DEFAULT_PAGE_SIZE, DROPDOWN_FETCH_BATCH_SIZE, DROPDOWN_SEARCH_LIMIT, MAX_PAGE_SIZE
+
+# Process-local cache of dropdown rows: key -> (expires_at, rows).
+# Entries are cleared when a transaction that changed companies/contacts ends
+# in this process; the TTL bounds staleness for writes made by other workers.
+# Only display data belongs here: validation must read the database.
+_dropdown_cache = {}
+
+# session.info key holding the cache keys a transaction has made stale
+_PENDING_CLEAR_KEY = 'dropdown_cache_pending_clear'
+
+
+def cached_rows(key, loader):
+    """Return cached rows for key, reloading when missing or expired.
+
+    Rows are shared across requests in this process, so loaders should return
+    immutable data (tuples/Row objects), not ORM instances.
+    """
+    ttl = current_app.config.get('DROPDOWN_CACHE_TTL', 0)
+    if ttl <= 0:
+        return loader()
+
+    now = time.monotonic()
+    entry = _dropdown_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    rows = loader()
+    _dropdown_cache[key] = (now + ttl, rows)
+    return rows
+
+
+def clear_dropdown_cache(*keys):
+    """Drop cached dropdown rows (all of them if no keys given)."""
+    for key in keys or list(_dropdown_cache):
+        _dropdown_cache.pop(key, None)
+
+
+def clear_dropdown_cache_on_commit(target, *keys):
+    """Drop cached dropdown rows once target's session transaction ends.
+
+    Clearing at flush time would let a reload between the flush and the
+    commit cache rows that may still roll back, so the keys are queued on
+    the session and dropped after commit (or rollback).
+    """
+    session = object_session(target)
+    if session is None:
+        clear_dropdown_cache(*keys)
+        return
+    session.info.setdefault(_PENDING_CLEAR_KEY, set()).update(keys)
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _clear_pending_dropdown_keys(session):
+    keys = session.info.pop(_PENDING_CLEAR_KEY, None)
+    if keys:
+        clear_dropdown_cache(*keys)
+
+
+def query_exists(query):
+    """Return whether query matches any row, as a SELECT EXISTS (no row is loaded)."""
+    return db.session.query(query.exists()).scalar()
+
+
+def _fetch_rows(stmt):
+    """Fetch column-only rows in batches into an immutable tuple.
+
+    yield_per streams from a server-side cursor where the driver supports it,
+    so large tables aren't buffered by the driver and again in the list.
+    """
+    result = db.session.execute(stmt.execution_options(yield_per=DROPDOWN_FETCH_BATCH_SIZE))
+    return tuple(result)
+
+
+def _load_companies():
+    return _fetch_rows(select(Company.id, Company.name).order_by(Company.name))
+
+
+def _load_contacts():
+    return _fetch_rows(
+        select(Contact.id, Contact.name, Company.name.label('company_name'))
+        .outerjoin(Company, Contact.company_id == Company.id)
+        .order_by(Contact.name)
+    )
+
+
+def _invalidate_companies(mapper, connection, target):
+    # Contact rows carry company_name, so both lists go stale
+    clear_dropdown_cache_on_commit(target, 'companies', 'contacts')
+
+
+def _invalidate_contacts(mapper, connection, target):
+    clear_dropdown_cache_on_commit(target, 'contacts')
+
+
+for _event_name in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Company, _event_name, _invalidate_companies)
+    event.listen(Contact, _event_name, _invalidate_contacts)
 
 
 def get_companies_for_dropdown():
-    """Get companies list for dropdown menus.
+    """Get companies list for dropdown menus as (id, name) rows.
 
-    Uses Flask's g object to cache within a single request,
-    avoiding duplicate queries when rendering forms with errors.
+    Backed by the process-local dropdown cache, and also memoized on
+    Flask's g object to avoid repeat lookups when rendering forms with errors.
     """
     if not hasattr(g, '_companies_dropdown'):
-        g._companies_dropdown = Company.query.order_by(Company.name).all()
+        g._companies_dropdown = cached_rows('companies', _load_companies)
     return g._companies_dropdown
 
 
 def get_contacts_for_dropdown():
-    """Get contacts list for dropdown menus.
+    """Get contacts list for dropdown menus as (id, name, company_name) rows.
 
-    Uses Flask's g object to cache within a single request,
-    avoiding duplicate queries when rendering forms with errors.
+    Backed by the process-local dropdown cache, and also memoized on
+    Flask's g object to avoid repeat lookups when rendering forms with errors.
     """
     if not hasattr(g, '_contacts_dropdown'):
-        g._contacts_dropdown = Contact.query.order_by(Contact.name).all()
+        g._contacts_dropdown = cached_rows('contacts', _load_contacts)
     return g._contacts_dropdown
 
 
+def get_affiliate_companies_for_dropdown():
+    """Get (id, name) rows for companies with an active affiliate program."""
+    if not hasattr(g, '_affiliate_companies_dropdown'):
+        g._affiliate_companies_dropdown = _fetch_rows(
+            select(Company.id, Company.name)
+            .where(Company.affiliate_status == 'yes')
+            .order_by(Company.name)
+        )
+    return g._affiliate_companies_dropdown
+
+
 def get_companies_and_contacts_for_dropdown():
     """Get both companies and contacts for dropdown menus.
 
@@ -33,3 +149,165 @@ def get_companies_and_contacts_for_dropdown():
     Returns tuple: (companies, contacts)
     """
     return get_companies_for_dropdown(), get_contacts_for_dropdown()
+
+
+def _clamp_limit(limit):
+    """Clamp a requested result limit to 1..MAX_PAGE_SIZE."""
+    if not limit or limit < 1:
+        return DROPDOWN_SEARCH_LIMIT
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def search_companies_for_dropdown(term='', limit=DROPDOWN_SEARCH_LIMIT):
+    """Search companies by name prefix for autocomplete dropdowns.
+
+    Returns at most `limit` (id, name) rows so form pages never need to
+    preload the whole table.
+    """
+    stmt = select(Company.id, Company.name)
+    if term:
+        stmt = stmt.where(Company.name.istartswith(term, autoescape=True))
+    return db.session.execute(
+        stmt.order_by(Company.name).limit(_clamp_limit(limit))
+    ).all()
+
+
+def search_contacts_for_dropdown(term='', limit=DROPDOWN_SEARCH_LIMIT):
+    """Search contacts by name prefix for autocomplete dropdowns.
+
+    Returns (id, name, company_name) rows; the company name comes from an
+    outer join since the dropdown label includes it.
+    """
+    stmt = select(Contact.id, Contact.name, Company.name.label('company_name')).outerjoin(
+        Company, Contact.company_id == Company.id
+    )
+    if term:
+        stmt = stmt.where(Contact.name.istartswith(term, autoescape=True))
+    return db.session.execute(
+        stmt.order_by(Contact.name).limit(_clamp_limit(limit))
+    ).all()
+
+
+def clamp_page(page, total, per_page=DEFAULT_PAGE_SIZE):
+    """Clamp a requested page number to 1..last page for ``total`` rows.
+
+    ``total`` only needs to be an upper bound (e.g. an unfiltered count the
+    route already has), so crawler requests for ``?page=999999`` never run
+    a deep OFFSET scan.
+    """
+    last_page = max(1, -(-total // per_page))
+    return min(max(page or 1, 1), last_page)
+
+
+class WindowedPagination(QueryPagination):
+    """Page-number pagination that reads the total from ``COUNT(*) OVER ()``.
+
+    Drop-in for ``query.paginate()``: the window count rides along on the
+    page SELECT, so a non-empty page costs one statement instead of two.
+    Empty pages (no matches, or past the end) fall back to a plain COUNT.
+    Not for queries that joinedload collections, whose duplicated rows the
+    window would count.
+
+    Overrides QueryPagination's private ``_query_items``/``_query_count``
+    hooks and reads ``_query_args``/``_query_offset``, so Flask-SQLAlchemy
+    is pinned below 3.2 in requirements.txt; recheck these before lifting it.
+    """
+
+    def _query_items(self):
+        rows = self._query_args['query'].add_columns(
+            func.count().over().label('_window_total')
+        ).limit(self.per_page).offset(self._query_offset).all()
+        self._window_total = rows[0]._window_total if rows else None
+        return [row[0] for row in rows]
+
+    def _query_count(self):
+        if self._window_total is not None:
+            return self._window_total
+        return super()._query_count()
+
+
+class KeysetPagination:
+    """Seek pagination for a query ordered newest-first on ``(created_at, id)``.
+
+    Each page continues strictly after the ``after`` cursor (the previous
+    page's last ``(created_at, id)``), or strictly before the ``before``
+    cursor (the next page's first row, walked in ascending order and
+    reversed), instead of using OFFSET, so deep pages cost the same as the
+    first. Both columns must be NOT NULL: row-value comparisons never match
+    NULLs. The total, a COUNT over the uncursored query, and any labelled
+    ``extra_columns`` ride along on the page SELECT as scalar subqueries;
+    the extras from the first row are exposed as ``extras``. An empty page
+    selects the same subqueries on their own, so it still costs one more
+    statement at most.
+    """
+
+    def __init__(self, query, created_column, id_column, after=None, before=None,
+                 per_page=DEFAULT_PAGE_SIZE, extra_columns=()):
+        self.per_page = per_page
+        self.after = after
+        self.before = before if not after else None
+
+        total_column = query.order_by(None).with_entities(func.count()) \
+            .scalar_subquery().correlate(None).label('_keyset_total')
+
+        page_query = query.add_columns(total_column, *extra_columns)
+        key = tuple_(created_column, id_column)
+        if self.before:
+            rows = page_query.filter(key > tuple_(*self.before)).order_by(
+                created_column.asc(), id_column.asc()
+            ).limit(per_page + 1).all()
+            # The extra row means newer pages remain; the cursor row itself
+            # (still there if anything newer is) starts the next page
+            self.has_prev = len(rows) > per_page
+            self.has_next = bool(rows)
+            rows = rows[:per_page][::-1]
+        else:
+            if after:
+                page_query = page_query.filter(key < tuple_(*after))
+            rows = page_query.order_by(
+                created_column.desc(), id_column.desc()
+            ).limit(per_page + 1).all()
+            self.has_prev = bool(after and rows)
+            self.has_next = len(rows) > per_page
+            rows = rows[:per_page]
+        self.items = [row[0] for row in rows]
+
+        if rows:
+            self.total = rows[0]._keyset_total
+            self.extras = {c.key: rows[0]._mapping[c.key] for c in extra_columns}
+        else:
+            row = db.session.execute(select(total_column, *extra_columns)).one()
+            self.total = row._keyset_total
+            self.extras = {c.key: row._mapping[c.key] for c in extra_columns}
+
+        first = self.items[0] if self.items else None
+        last = self.items[-1] if self.items else None
+        self.prev_cursor = (
+            {'before_ts': getattr(first, created_column.key).isoformat(),
+             'before_id': getattr(first, id_column.key)}
+            if self.has_prev else None
+        )
+        self.next_cursor = (
+            {'after_ts': getattr(last, created_column.key).isoformat(),
+             'after_id': getattr(last, id_column.key)}
+            if self.has_next else None
+        )
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def parse_keyset_cursor(args, direction='after'):
+    """Read a ``(<direction>_ts, <direction>_id)`` cursor from request args.
+
+    ``direction`` is ``'after'`` or ``'before'``; returns None if the
+    cursor is absent/invalid.
+    """
+    cursor_ts = args.get(f'{direction}_ts')
+    cursor_id = args.get(f'{direction}_id', type=int)
+    if not cursor_ts or cursor_id is None:
+        return None
+    try:
+        return datetime.fromisoformat(cursor_ts), cursor_id
+    except ValueError:
+        return None
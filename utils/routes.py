@@ -1,11 +1,14 @@
 """Route utilities for reducing code duplication in Flask routes."""
 import uuid
 from functools import wraps
-from flask import request, flash, redirect, url_for, current_app, g
+from flask import request, flash, redirect, url_for, current_app, g, jsonify
 from sqlalchemy.exc import SQLAlchemyError
 from app import db
 from utils.logging import log_exception
-from utils.validation import ValidationError
+from utils.validation import (
+    ValidationError, parse_date, parse_float, parse_int, validate_email,
+    validate_foreign_key, validate_foreign_keys, validate_required, validate_url,
+)
 
 
 def get_request_id():
@@ -18,6 +21,21 @@ def get_request_id():
     return getattr(g, 'request_id', str(uuid.uuid4())[:8])
 
 
+def wants_json():
+    """True when the client prefers a JSON response (fetch with Accept: application/json)."""
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+
+def json_body():
+    """Return the request's JSON body if it is an object, else None.
+
+    Missing, malformed or non-object bodies all come back as None, so AJAX
+    handlers can answer 400 instead of failing on ``data.get``.
+    """
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+
 def handle_form_errors(redirect_endpoint, **redirect_kwargs):
     """Decorator to handle ValidationError and SQLAlchemyError in form routes.
 
@@ -106,7 +124,6 @@ class FormData:
 
     def required(self, field, max_length=None):
         """Get required field value, raising ValidationError if empty."""
-        from utils.validation import validate_required
         value = self.form.get(field, '')
         return validate_required(value, field, max_length)
 
@@ -117,27 +134,22 @@ class FormData:
 
     def email(self, field='email'):
         """Get and validate email field."""
-        from utils.validation import validate_email
         return validate_email(self.form.get(field, ''), field)
 
     def url(self, field='url', max_length=2048):
         """Get and validate URL field."""
-        from utils.validation import validate_url
         return validate_url(self.form.get(field, ''), field, max_length)
 
     def date(self, field):
         """Get and parse date field."""
-        from utils.validation import parse_date
         return parse_date(self.form.get(field, ''), field)
 
     def integer(self, field, allow_negative=False):
         """Get and parse integer field."""
-        from utils.validation import parse_int
         return parse_int(self.form.get(field, ''), field, allow_negative)
 
     def decimal(self, field, allow_negative=True):
         """Get and parse decimal/float field."""
-        from utils.validation import parse_float
         return parse_float(self.form.get(field, ''), field, allow_negative)
 
     def choice(self, field, choices, default=None):
@@ -149,9 +161,14 @@ class FormData:
 
     def foreign_key(self, field, model_class):
         """Get and validate foreign key field."""
-        from utils.validation import validate_foreign_key
         return validate_foreign_key(model_class, self.form.get(field, ''), field)
 
+    def foreign_keys(self, *fields):
+        """Validate several (field, model_class) foreign keys in one query."""
+        return validate_foreign_keys(*(
+            (model_class, self.form.get(field, ''), field) for field, model_class in fields
+        ))
+
     def boolean(self, field):
         """Get boolean field (checkbox)."""
         value = self.form.get(field, '')
@@ -196,7 +213,7 @@ def make_delete_view(model_class, name_attr, redirect_endpoint, entity_name=None
     @login_required
     def delete_view(id):
         try:
-            entity = model_class.query.get_or_404(id)
+            entity = db.get_or_404(model_class, id)
             # Check ownership if required
             if check_user_id and getattr(entity, 'user_id', None) != current_user.id:
                 abort(403)
@@ -230,6 +247,32 @@ def make_delete_view(model_class, name_attr, redirect_endpoint, entity_name=None
     return delete_view
 
 
+def _run_quick_action(op_name, id, redirect_endpoint, action):
+    """Run a quick action, commit, and respond with JSON or flash + redirect."""
+    try:
+        message = action()
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        request_id = get_request_id()
+        log_exception(
+            current_app.logger,
+            f'{op_name} [req:{request_id}]',
+            e,
+            entity_id=id
+        )
+        if wants_json():
+            return jsonify({'success': False, 'error': 'Database error occurred. Please try again.'}), 500
+        flash('Database error occurred. Please try again.', 'error')
+        return redirect(url_for(redirect_endpoint))
+
+    # Fetch clients patch the row in place instead of reloading the list
+    if wants_json():
+        return jsonify({'success': True, 'id': id, 'message': message})
+    flash(message, 'success')
+    return redirect(url_for(redirect_endpoint))
+
+
 def quick_action(model_class, redirect_endpoint, operation_name=None, check_user_id=False):
     """Decorator for quick action routes that update a model and redirect.
 
@@ -239,6 +282,9 @@ def quick_action(model_class, redirect_endpoint, operation_name=None, check_user
         operation_name: Human-readable name for logging (defaults to function name)
         check_user_id: If True, verify entity.user_id == current_user.id before action
 
+    Clients sending Accept: application/json get {success, id, message}
+    back instead of a flash + redirect.
+
     Usage:
         @collabs_bp.route('/<int:id>/complete', methods=['POST'])
         @quick_action(Collaboration, 'collabs.list_collabs', check_user_id=True)
@@ -254,25 +300,58 @@ def quick_action(model_class, redirect_endpoint, operation_name=None, check_user
         @wraps(f)
         @login_required
         def wrapper(id):
-            op_name = operation_name or f.__name__
-            try:
-                entity = model_class.query.get_or_404(id)
+            def action():
+                entity = db.get_or_404(model_class, id)
                 # Check ownership if required
                 if check_user_id and getattr(entity, 'user_id', None) != current_user.id:
                     abort(403)
-                message = f(entity)
-                db.session.commit()
-                flash(message, 'success')
-            except SQLAlchemyError as e:
-                db.session.rollback()
-                request_id = get_request_id()
-                log_exception(
-                    current_app.logger,
-                    f'{op_name} [req:{request_id}]',
-                    e,
-                    entity_id=id
-                )
-                flash('Database error occurred. Please try again.', 'error')
-            return redirect(url_for(redirect_endpoint))
+                return f(entity)
+
+            return _run_quick_action(operation_name or f.__name__, id, redirect_endpoint, action)
+        return wrapper
+    return decorator
+
+
+def quick_action_sql(model_class, redirect_endpoint, operation_name=None, check_user_id=False):
+    """Decorator for quick actions done as a single UPDATE, without loading the row.
+
+    The view receives an UPDATE statement already scoped to the id (and to
+    the current user when check_user_id is set), adds .values() and
+    optionally .returning(), executes it and returns the flash message. It
+    returns None when the statement matched no row, which becomes a 404 (so
+    other users' rows are indistinguishable from missing ones).
+
+    The UPDATE bypasses ORM flush events, so only use this for changes no
+    listener needs to see.
+
+    Usage:
+        @pipeline_bp.route('/<int:id>/mark-paid', methods=['POST'])
+        @quick_action_sql(SalesPipeline, 'pipeline.list_deals', check_user_id=True)
+        def mark_paid(stmt):
+            result = db.session.execute(
+                stmt.values(payment_status='paid').execution_options(**{ROLLUP_SYNCED: True})
+            )
+            return 'Deal marked as paid.' if result.rowcount else None
+    """
+    from flask_login import login_required, current_user
+    from flask import abort
+    from sqlalchemy import update
+
+    def decorator(f):
+        @wraps(f)
+        @login_required
+        def wrapper(id):
+            stmt = update(model_class).where(model_class.id == id)
+            if check_user_id:
+                stmt = stmt.where(model_class.user_id == current_user.id)
+            stmt = stmt.execution_options(synchronize_session=False)
+
+            def action():
+                message = f(stmt)
+                if message is None:
+                    abort(404)
+                return message
+
+            return _run_quick_action(operation_name or f.__name__, id, redirect_endpoint, action)
         return wrapper
     return decorator
@@ -120,10 +120,11 @@ def validate_range(value: float | int, min_val: float = None, max_val: float = N
     return value
 
 
-def validate_choice(value: str, choices: list, field_name: str = 'value') -> str:
-    """Validate that a value is one of the allowed choices."""
+def validate_choice(value: str, choices, field_name: str = 'value') -> str:
+    """Validate that a value is one of the allowed choices (any collection, e.g. a frozenset)."""
     if value not in choices:
-        raise ValidationError(field_name, f"Invalid choice. Must be one of: {', '.join(choices)}")
+        # Sorted so the message is stable when choices is a set
+        raise ValidationError(field_name, f"Invalid choice. Must be one of: {', '.join(sorted(choices))}")
     return value
 
 
@@ -142,6 +143,45 @@ def validate_foreign_key(model_class, value: str | int, field_name: str = 'id')
     return id_val
 
 
+def validate_foreign_keys(*checks) -> list[int | None]:
+    """Validate several foreign keys with one round-trip.
+
+    Args:
+        *checks: (model_class, value, field_name) tuples
+
+    Returns:
+        The validated ids in the order given (None for empty values).
+    """
+    from sqlalchemy import literal, select, union_all
+    from extensions import db
+
+    ids = []
+    lookups = []
+    for position, (model_class, value, field_name) in enumerate(checks):
+        if not value:
+            ids.append(None)
+            continue
+        try:
+            id_val = int(value)
+        except (ValueError, TypeError):
+            raise ValidationError(field_name, "Invalid ID format.")
+        ids.append(id_val)
+        lookups.append(
+            select(literal(position).label('position'))
+            .select_from(model_class)
+            .where(model_class.id == id_val)
+        )
+
+    if lookups:
+        stmt = lookups[0] if len(lookups) == 1 else union_all(*lookups)
+        found = set(db.session.execute(stmt).scalars())
+        for position, (model_class, value, field_name) in enumerate(checks):
+            if ids[position] is not None and position not in found:
+                raise ValidationError(field_name, f"Referenced {model_class.__name__} does not exist.")
+
+    return ids
+
+
 def or_none(value: str) -> str | None:
     """Return None if value is empty, otherwise stripped value."""
     if not value or not value.strip():